@@ -0,0 +1,17 @@
+# asset_data.py
+# Propósito: Fuente de los bitmaps del juego como bytearray literales (los agrega scripts/convert_image.py). No se importa en el dispositivo: scripts/build_assets.py los empaqueta en assets.pack y assets.py los lee de ahí cuando se usan. Cada línea "# Source:" dice tamaño y formato, y el empaquetador la lee.
+
+# --- INTRO SCENE ASSETS (Auto-generated) ---
+# Source: assets/logo/cypher_logo.png (128x64) [MONO_VLSB]
+LOGO_CYPHER = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xf0\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xf8\xe0\xfc\xff\xff\xff\xff\xff\x3f\x1f\x07\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xe0\xfe\xff\xff\xff\xff\xff\xff\x07\x80\xfc\xff\xff\xff\xff\xff\xff\x1f\xfc\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\xf8\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xff\xff\xff\xff\xff\xff\x3f\x00\xe0\xff\xff\xff\xff\xff\xff\x7f\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x1f\x07\x03\x00\x00\xf8\xfc\xfc\xfc\xfc\xfc\xfc\x04\x00\xe0\xff\xff\xff\xff\xff\xff\x07\xf0\xff\xff\xff\xff\xff\xff\x17\x00\xc0\xff\xff\xff\xff\xff\xff\x7f\xc3\xfc\xfc\xfc\xfc\xfc\xfc\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x80\xfc\xfc\xfc\xfc\xfc\xfc\xfc\x04\x00\xfc\xff\xff\xff\xff\xff\xff\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xff\xff\xff\xff\xff\xff\xff\x07\x00\x00\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x01\x00\x00\x00\x00\xe0\xff\xff\xff\xff\xff\xff\xff\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x3f\x83\xfe\xff\xff\xff\xff\xff\xff\x7f\x7f\xff\xff\xff\xff\xff\xff\xff\x3f\xf8\xff\xff\xff\xff\xff\xff\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x0f\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xff\xff\xff\xff\x7f\x00\x80\x80\x80\x80\x80\x80\x80\x80\x00\x00\x00\x00\x00\x00\xfc\xff\xff\xff\xff\xff\xff\x1f\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xff\xff\xff\xff\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xff\xff\xff\xff\xff\xff\x3f\x01\x80\xff\xff\xff\xff\xff\xff\xff\x87\xfe\xff\xff\xff\xff\xff\xff\x03\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\xff\x0f\x00\xfc\xff\xff\xff\xff\xff\xff\x1f\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x9f\x9f\x9f\x9f\x9f\x9f\x9f\x9e\x9e\x9f\x9f\x9f\x9f\x9f\x1f\x1f\x00\x00\x00\x00\x00\x80\x9e\x9f\x9f\x9f\x9f\x9f\x9f\x03\x00\x00\x00\x00\x00\x80\x9e\x9f\x9f\x9f\x9f\x9f\x9f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x98\x9f\x9f\x9f\x9f\x9f\x9f\x1f\x00\x90\x9f\x9f\x9f\x9f\x9f\x9f\x1f\x90\x9f\x9f\x9f\x9f\x9f\x9f\x9f\x9f\x9e\x9e\x9e\x9e\x9e\x9e\x1e\x80\x9f\x9f\x9f\x9f\x9f\x9f\x9f\x01\x80\x9c\x9f\x9f\x9f\x9f\x9f\x9f\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+
+# Source: assets/logo/nomad_logo.png (46x13)
+LOGO_NOMAD = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x98\xc3\x10\xc7\x00\x01\x99\xe7\x31\xcf\xc0\x01\xd2\x37\x73\xcc\xc0\x03\xf6\x37\xf2\xc8\xc0\x03\x76\x2d\xa6\xc8\x80\x02\x66\x6d\x2f\xd9\x80\x02\x67\xc8\x68\xdf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+
+# Source: assets/logo/protocol_logo.png (61x13)
+LOGO_PROTOCOL = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xc7\x07\x3f\x38\x30\xc6\x00\x03\xe7\x8f\xbe\x7c\xf3\xe6\x00\x03\x2c\x91\x88\x8d\x86\x24\x00\x03\xef\x31\x99\x8d\x06\x2c\x00\x03\xcf\x31\x19\x8b\x04\x6c\x00\x06\x09\x33\x11\x9b\x04\xc8\x00\x06\x19\x3e\x31\xf1\xe7\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+# Source: assets/cpu.png (16x16) [INVERTED]
+CPU_ICON_INV = bytearray(b'\xff\xff\xfd\xbf\xea\xa7\xd2\x57\xdf\xf3\xcf\xfb\xbd\x35\xcd\xf7\xef\xb3\x9c\xbb\xef\xf7\xcf\xf3\xe9\x2b\xe5\x57\xfd\xbf\xff\xff')
+
+# Source: assets/cpu.png (16x16)
+CPU_ICON = bytearray(b'\xff\xff\xfd\xbf\xe0\x07\xc0\x03\xcf\xf3\xcf\xf3\x8c\x31\xcd\xb3\xcd\xb3\x8c\x31\xcf\xf3\xcf\xf3\xc0\x03\xe0\x07\xfd\xbf\xff\xff')
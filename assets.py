@@ -1,39 +1,295 @@
 # assets.py
 # Propósito: El almacén de arte. Contiene todos tus bytearray de gráficos (Dogeron, Monstruo, Iconos) y quizás la fuente de texto personalizada.
+#
+# Los gráficos, animaciones y canciones viven en assets.pack (lo arma
+# scripts/build_assets.py) y se leen recién cuando se usan: assets.LOGO_CYPHER
+# lee el bitmap del pack la primera vez y lo deja cargado hasta release().
+# Sin pack (desarrollo, emulador) se importan los módulos fuente como antes.
 
-# Importar módulos con manejo de errores para evitar problemas con mount
-try:
-    import walk_animation
-    WALK_ANIMATION = walk_animation.WALK_ANIMATION
-except (ImportError, AttributeError) as e:
-    print(f"Warning: Could not import walk_animation: {e}")
-    WALK_ANIMATION = []
-
-try:
-    import blues_corto
-    SONG_BLUES = blues_corto
-except (ImportError, AttributeError) as e:
-    print(f"Warning: Could not import blues_corto: {e}")
-    SONG_BLUES = None
-
-try:
-    import music_intro
-    SONG_INTRO = music_intro
-except (ImportError, AttributeError) as e:
-    print(f"Warning: Could not import music_intro: {e}")
-    SONG_INTRO = None
-
-# --- INTRO SCENE ASSETS (Auto-generated) ---
-# Source: assets/logo/cypher_logo.png (128x64)
-LOGO_CYPHER = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xf9\xfe\x3f\xdf\xff\x87\xf3\xfb\xff\xfb\xff\xf0\x00\x00\x01\xff\xfd\xfe\x3f\xdf\xff\xef\xf3\xfb\xff\xfb\xff\xfc\x00\x00\x01\xff\xfc\xfe\x7f\xdf\xff\xef\xf7\xff\xff\xfb\xff\xfc\x00\x00\x01\xff\xfc\xff\x7f\x9f\xff\xef\xe7\xff\xff\xff\xff\xfc\x00\x00\x03\xff\xfc\xff\x7f\xbf\xff\xef\xe7\xff\xff\xf7\xff\xfc\x00\x00\x03\xff\xfc\xff\xff\x3f\xff\xff\xe7\xf7\xff\xf7\xff\xfc\x00\x00\x07\xff\xfc\xff\xfe\x3f\xff\xff\xe7\xf7\xff\xf7\xff\xfc\x00\x00\x07\xff\xfc\xff\xfe\x3f\xff\xff\xef\xf7\xff\xf7\xff\xfc\x00\x00\x07\xf3\xf8\xff\xfe\x00\x1f\xdf\xcf\xf0\x00\x00\x03\xf8\x00\x00\x07\xf3\xf8\xff\xfe\x00\x1f\xdf\xcf\xf0\x00\x00\x03\xf8\x00\x00\x07\xf3\xf8\xff\xfc\x3f\x9f\xdf\xcf\xef\xe0\x0f\xf7\xf8\x00\x00\x0f\xf3\xf8\xff\xf8\x7f\x1f\x9f\x8f\xef\xe0\x0f\xe7\xf8\x00\x00\x0f\xf3\xf8\xff\xf8\x7f\x1f\xbf\xcf\xef\xe0\x0f\xe7\xf0\x00\x00\x0f\xf7\xf8\xff\xf0\x7f\x3f\xbf\x8f\xef\xe0\x0f\xe7\xf0\x00\x00\x0f\xe7\xf8\x7f\xf0\x7f\x3f\xbf\x9f\xff\xe0\x0f\xe7\xf0\x00\x00\x0f\xe7\xf0\x7f\xf0\x7f\x3f\xbf\x9f\xdf\xe0\x1f\xe7\xf0\x00\x00\x1f\xe7\xf0\x7f\xe0\xff\xff\xbf\xff\xdf\xff\xdf\xff\xf0\x00\x00\x1f\xe0\x00\x7f\xc0\xff\xff\xff\xff\xdf\xff\xdf\xff\xe0\x00\x00\x1f\xe0\x00\x7f\xc0\xff\xff\x7f\xff\xdf\xff\xdf\xff\xe0\x00\x00\x1f\xc0\x00\x7f\xc0\xff\xff\x7f\xff\xff\xff\xdf\xff\xe0\x00\x00\x1f\xc0\x00\x7f\x80\xff\xff\x7f\xff\xff\xff\xbf\xff\xe0\x00\x00\x1f\xc0\x00\x7f\x81\xff\xff\x7f\xff\xff\xff\xbf\xff\xe0\x00\x00\x1f\xc0\x00\x7f\x81\xff\xfe\x7f\xff\xbf\xff\xbf\xff\xe0\x00\x00\x3f\xc0\x00\x7f\x81\xfe\x00\xff\x3f\xbf\x80\x3f\xff\xe0\x00\x00\x3f\x80\x00\x7f\x01\xfc\x00\xff\x7f\xbf\x80\x3f\x9f\xe0\x00\x00\x3f\x80\x00\x7f\x01\xfc\x00\xfe\x7f\xff\x80\x7f\x9f\xc0\x00\x00\x3f\x80\x00\xff\x01\xfc\x00\xfe\x7f\xff\x00\x7f\xbf\xc0\x00\x00\x3f\x80\x00\xff\x01\xfc\x00\xfe\x7f\x7f\x00\x7f\xbf\xc0\x00\x00\x7f\x80\x00\xff\x03\xf8\x00\xfe\x7f\x7f\x00\x7f\x3f\xc0\x00\x00\x7f\x80\x00\xfe\x03\xf8\x00\xfe\x7f\x7f\x00\x7f\x3f\x80\x00\x00\x7f\x80\x00\xfe\x03\xf8\x01\xfc\x7f\x7f\x00\x7f\x3f\x80\x00\x00\x7f\x3f\xc0\xfe\x03\xf8\x01\xfc\xff\xff\x00\x7f\x3f\x80\x00\x00\x7f\x3f\x80\xfe\x03\xf8\x01\xfc\xfe\xff\x00\xff\x3f\x80\x00\x00\xff\xff\x81\xfe\x07\xf8\x01\xfc\xfe\xff\xfe\xfe\x3f\x80\x00\x00\xff\xff\x81\xfc\x07\xf8\x01\xfc\xfe\xff\xfe\xfe\x7f\x00\x00\x00\xff\xff\x81\xfc\x07\xf0\x03\xfc\xfe\xff\xfe\xfe\x7f\x00\x00\x00\xff\xff\x81\xfc\x07\xf0\x03\xfd\xff\xff\xfe\xfe\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfe\x03\xfc\x0f\xf0\x03\xf9\xfd\xff\xfd\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
-
-# Source: assets/logo/nomad_logo.png (46x13)
-LOGO_NOMAD = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x98\xc3\x10\xc7\x00\x01\x99\xe7\x31\xcf\xc0\x01\xd2\x37\x73\xcc\xc0\x03\xf6\x37\xf2\xc8\xc0\x03\x76\x2d\xa6\xc8\x80\x02\x66\x6d\x2f\xd9\x80\x02\x67\xc8\x68\xdf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
-
-# Source: assets/logo/protocol_logo.png (61x13)
-LOGO_PROTOCOL = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xc7\x07\x3f\x38\x30\xc6\x00\x03\xe7\x8f\xbe\x7c\xf3\xe6\x00\x03\x2c\x91\x88\x8d\x86\x24\x00\x03\xef\x31\x99\x8d\x06\x2c\x00\x03\xcf\x31\x19\x8b\x04\x6c\x00\x06\x09\x33\x11\x9b\x04\xc8\x00\x06\x19\x3e\x31\xf1\xe7\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
-# Source: assets/cpu.png (16x16) [INVERTED]
-CPU_ICON_INV = bytearray(b'\xff\xff\xfd\xbf\xea\xa7\xd2\x57\xdf\xf3\xcf\xfb\xbd\x35\xcd\xf7\xef\xb3\x9c\xbb\xef\xf7\xcf\xf3\xe9\x2b\xe5\x57\xfd\xbf\xff\xff')
-
-# Source: assets/cpu.png (16x16)
-CPU_ICON = bytearray(b'\xff\xff\xfd\xbf\xe0\x07\xc0\x03\xcf\xf3\xcf\xf3\x8c\x31\xcd\xb3\xcd\xb3\x8c\x31\xcf\xf3\xcf\xf3\xc0\x03\xe0\x07\xfd\xbf\xff\xff')
+import struct
+from array import array
+
+PACK_FILE = 'assets.pack'
+
+# Cabecera: magia, versión, cantidad de entradas. Después una entrada de
+# índice por asset: nombre, formato, frames, ancho, alto, offset, largo.
+PACK_MAGIC = b'NMAP'
+PACK_VERSION = 2
+PACK_HEADER = '<4sHH'
+PACK_ENTRY = '<16sBBHHII2x'
+PACK_HEADER_SIZE = struct.calcsize(PACK_HEADER)
+PACK_ENTRY_SIZE = struct.calcsize(PACK_ENTRY)
+
+# Formatos de entrada
+FMT_HLSB = 0        # Bitmap MONO_HLSB (frames > 1: frames seguidos)
+FMT_VLSB = 1        # Bitmap MONO_VLSB (frames > 1: frames seguidos)
+FMT_DELTA_RLE = 2   # Animación comprimida (ver renderer.DeltaAnimation)
+FMT_SONG = 3        # Canción: tabla de frecuencias y pares (índice, ms) en uint16
+
+SONG_CHUNK = 32     # Notas que se leen juntas al tocar una canción del pack
+
+FORMAT_NAMES = ('MONO_HLSB', 'MONO_VLSB', 'MONO_VLSB', None)
+
+# Módulos fuente, para cuando no hay pack: nombre -> (módulo, atributo)
+SOURCES = {
+    'LOGO_CYPHER': ('asset_data', 'LOGO_CYPHER'),
+    'LOGO_NOMAD': ('asset_data', 'LOGO_NOMAD'),
+    'LOGO_PROTOCOL': ('asset_data', 'LOGO_PROTOCOL'),
+    'CPU_ICON_INV': ('asset_data', 'CPU_ICON_INV'),
+    'CPU_ICON': ('asset_data', 'CPU_ICON'),
+    'WALK_ANIMATION': ('walk_animation', 'WALK_ANIMATION'),
+    'SONG_BLUES': ('blues_corto', None),
+    'SONG_INTRO': ('music_intro', None),
+}
+
+
+class Song:
+    """
+    Canción del pack, con la misma forma que los módulos de
+    scripts/music_gen.py (NOTES y PIECE) para que sound_manager la toque
+    igual.
+    """
+
+    NOTES = {'SILENCE': 0}
+
+    def __init__(self, piece):
+        self.PIECE = piece
+
+
+class Piece:
+    """
+    Notas de una canción empaquetada: una tabla chica de frecuencias y pares
+    (índice en la tabla, ms) en uint16 little-endian, ya con los tempos
+    resueltos. piece[i] devuelve (frecuencia, ms) sin tener una tupla por
+    nota en el heap. Lo usan los módulos que genera scripts/music_gen.py.
+    """
+
+    def __init__(self, freqs, data):
+        self.freqs = freqs
+        self.data = data
+
+    def __len__(self):
+        return len(self.data) >> 2
+
+    def __getitem__(self, i):
+        d = self.data
+        j = i << 2
+        return self.freqs[d[j] | (d[j + 1] << 8)], d[j + 2] | (d[j + 3] << 8)
+
+
+class _PieceStream(Piece):
+    # Piece que lee las notas del pack de a SONG_CHUNK: la RAM que usa no
+    # depende del largo de la canción
+    def __init__(self, path, offset, count, freqs):
+        super().__init__(freqs, bytearray(4 * SONG_CHUNK))
+        self.path = path
+        self.offset = offset
+        self.count = count
+        self._first = -SONG_CHUNK  # Primera nota del chunk cargado
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        k = i - self._first
+        if not 0 <= k < SONG_CHUNK:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset + 4 * i)
+                f.readinto(self.data)
+            self._first = i
+            k = 0
+        return Piece.__getitem__(self, k)
+
+
+class AssetPack:
+    """
+    Índice de assets.pack y los assets cargados. load() lee el asset con
+    readinto a un buffer del que llama, o a uno del pool (los buffers que
+    devolvió release()), o a uno nuevo.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or PACK_FILE
+        self.index = {}     # nombre -> (formato, frames, ancho, alto, offset, largo)
+        self.loaded = {}    # nombre -> (objeto, buffer propio o None)
+        self.pool = []      # Buffers libres para reusar
+        with open(self.path, 'rb') as f:
+            magic, version, count = struct.unpack(PACK_HEADER, f.read(PACK_HEADER_SIZE))
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError("bad asset pack")
+            entry = bytearray(PACK_ENTRY_SIZE)
+            for _ in range(count):
+                f.readinto(entry)
+                name, fmt, frames, w, h, offset, length = struct.unpack(PACK_ENTRY, entry)
+                name = name.rstrip(b'\x00').decode()
+                self.index[name] = (fmt, frames, w, h, offset, length)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def _take(self, length):
+        # El buffer libre más chico que alcance, o uno nuevo
+        best = None
+        for buf in self.pool:
+            if len(buf) >= length and (best is None or len(buf) < len(best)):
+                best = buf
+        if best is None:
+            return bytearray(length)
+        self.pool.remove(best)
+        return best
+
+    def load(self, name, buf=None):
+        """
+        Devuelve el asset (bitmap, lista de frames, Song) y lo deja cargado.
+        Con buf lo lee ahí; ese buffer sigue siendo del que llama.
+        """
+        entry = self.loaded.get(name)
+        if entry is not None:
+            return entry[0]
+        fmt, frames, w, h, offset, length = self.index[name]
+        if fmt == FMT_SONG:
+            # Las canciones no se cargan: se leen de a pedazos mientras suenan
+            obj = self._song(offset)
+            self.loaded[name] = (obj, None)
+            return obj
+        owned = None
+        if buf is None:
+            buf = owned = self._take(length)
+        view = memoryview(buf)[:length]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            f.readinto(view)
+        obj = _decode(fmt, frames, w, h, view)
+        self.loaded[name] = (obj, owned)
+        return obj
+
+    def _song(self, offset):
+        # Cabecera (frecuencias, notas) y la tabla de frecuencias en RAM; las
+        # notas quedan en el archivo
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            nfreq, count = struct.unpack('<HH', f.read(4))
+            freqs = array('H', struct.unpack('<%dH' % nfreq, f.read(2 * nfreq)))
+        return Song(_PieceStream(self.path, offset + 4 + 2 * nfreq, count, freqs))
+
+    def release(self, name):
+        # Olvida el asset; su buffer (si era del pool) queda para el próximo
+        # load(). Lo que todavía apunte al asset no se puede seguir usando.
+        entry = self.loaded.pop(name, None)
+        if entry is not None and entry[1] is not None:
+            self.pool.append(entry[1])
+
+    def free_pool(self):
+        self.pool = []
+
+
+def _decode(fmt, frames, w, h, view):
+    if fmt == FMT_DELTA_RLE:
+        # frames, índice del loop (0xffff = ninguno), un índice de chunk por
+        # frame y los offsets de los chunks únicos (uno más para el final)
+        count, loop = struct.unpack_from('<HH', view, 0)
+        seq = struct.unpack_from('<%dH' % count, view, 4)
+        pos = 4 + count * 2
+        unique = max(seq + ((loop,) if loop != 0xffff else ())) + 1
+        offsets = struct.unpack_from('<%dI' % (unique + 1), view, pos)
+        chunks = [view[offsets[i]:offsets[i + 1]] for i in range(unique)]
+        return _Animation([chunks[i] for i in seq], chunks[loop] if loop != 0xffff else None)
+    if frames > 1:
+        size = len(view) // frames
+        return [view[i * size:(i + 1) * size] for i in range(frames)]
+    return view
+
+
+class _Animation:
+    # Chunks DELTA_RLE (se indexa como una lista) y el delta de vuelta al
+    # primer frame
+    def __init__(self, chunks, loop):
+        self.chunks = chunks
+        self.loop = loop
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def __getitem__(self, i):
+        return self.chunks[i]
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+
+_pack = None
+
+
+def pack():
+    # El AssetPack de assets.pack, o None si no hay pack
+    global _pack
+    if _pack is None:
+        try:
+            _pack = AssetPack()
+        except OSError:
+            _pack = False
+        except ValueError as e:
+            print(f"Warning: Could not read {PACK_FILE}: {e}")
+            _pack = False
+    return _pack or None
+
+
+def load(name, buf=None):
+    p = pack()
+    if p is not None and name in p:
+        return p.load(name, buf)
+    # Los bitmaps nuevos de asset_data no necesitan estar en SOURCES
+    module_name, attr = SOURCES.get(name, ('asset_data', name))
+    try:
+        module = __import__(module_name)
+    except ImportError as e:
+        print(f"Warning: Could not import {module_name}: {e}")
+        return [] if name.endswith('_ANIMATION') else None
+    return getattr(module, attr) if attr else module
+
+
+def release(name):
+    p = pack()
+    if p is not None:
+        p.release(name)
+
+
+def __getattr__(name):
+    # assets.LOGO_CYPHER y compañía se cargan recién cuando se piden. Las
+    # animaciones traen además <NOMBRE>_FORMAT, _ENCODING y _LOOP.
+    p = pack()
+    for suffix in ('_FORMAT', '_ENCODING', '_LOOP'):
+        base = name[:-len(suffix)]
+        if name.endswith(suffix) and (base in SOURCES or (p is not None and base in p)):
+            return _animation_info(base, suffix)
+    if name in SOURCES or (p is not None and name in p):
+        return load(name)
+    if p is None and name.isupper():
+        value = load(name)
+        if value is not None:
+            return value
+    raise AttributeError(name)
+
+
+def _animation_info(name, suffix):
+    p = pack()
+    if p is not None and name in p:
+        fmt = p.index[name][0]
+        if suffix == '_FORMAT':
+            return FORMAT_NAMES[fmt]
+        if suffix == '_ENCODING':
+            return 'DELTA_RLE' if fmt == FMT_DELTA_RLE else 'RAW'
+        return getattr(p.load(name), 'loop', None)
+    module_name = SOURCES[name][0]
+    try:
+        module = __import__(module_name)
+    except ImportError:
+        module = None
+    if suffix == '_FORMAT':
+        # Los módulos viejos (sin FORMAT) son MONO_HLSB
+        return getattr(module, 'FORMAT', 'MONO_HLSB')
+    if suffix == '_ENCODING':
+        return getattr(module, 'ENCODING', 'RAW')
+    return getattr(module, name + '_LOOP', None)
@@ -0,0 +1,237 @@
+# blitter.py
+# Propósito: Blits con operaciones de raster (OR, AND-NOT, XOR, COPY, con fuente invertida opcional) de bitmaps MONO_HLSB (assets, fuentes) al buffer MONO_VLSB del SSD1306, con recorte. framebuf.blit sólo copia con una clave de transparencia, así que para texto negro o sprites con máscara había que armar copias invertidas de cada bitmap; acá la operación se elige al blitear. En el dispositivo corre con @micropython.viper; en CPython (emulador) con un fallback en Python puro.
+
+import sys
+from array import array
+import framebuf
+from micropython import const
+
+# Operaciones: qué hacer con cada píxel del destino donde la fuente vale 1
+_OR = const(0)      # Encender (texto blanco, sprites)
+_CLEAR = const(1)   # AND-NOT: apagar (texto negro sobre fondo blanco, máscaras)
+_XOR = const(2)     # Invertir
+_COPY = const(3)    # Copia opaca: también apaga donde la fuente vale 0
+
+OR = _OR
+CLEAR = _CLEAR
+XOR = _XOR
+COPY = _COPY
+
+# Parámetros del blit para el camino viper (que acepta hasta 4 argumentos):
+# dst_w, stride, sx0, sy0, dx0, dy0, w, h, op, invert, src_offset
+_params = array('i', range(11))
+# Rectángulo de recorte (x0, y0, x1, y1) además de los bordes del destino
+_NO_CLIP = const(0x7fff)
+_clip = array('i', (0, 0, _NO_CLIP, _NO_CLIP))
+
+
+class Canvas(framebuf.FrameBuffer):
+    """
+    FrameBuffer MONO_VLSB que deja ver su buffer y su tamaño, para que el
+    blitter pueda escribir en él (p.ej. las páginas del Viewport).
+    """
+
+    def __init__(self, buffer, width, height):
+        super().__init__(buffer, width, height, framebuf.MONO_VLSB)
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+
+
+def surface(target):
+    # (buffer, width, height) MONO_VLSB de un SSD1306 o un Canvas, o None
+    view = getattr(target, 'framebuf_view', None)
+    if view is not None:
+        return view, target.width, target.height
+    if isinstance(target, Canvas):
+        return target.buffer, target.width, target.height
+    return None
+
+
+if sys.implementation.name == 'micropython':
+    import micropython
+
+    @micropython.viper
+    def _blit_rows(dst, src, params) -> int:
+        d = ptr8(dst)
+        s = ptr8(src)
+        p = ptr32(params)
+        dw = p[0]
+        stride = p[1]
+        sx0 = p[2]
+        sy0 = p[3]
+        dx0 = p[4]
+        dy0 = p[5]
+        w = p[6]
+        h = p[7]
+        op = p[8]
+        inv = p[9]
+        base = p[10]
+        row = 0
+        while row < h:
+            sbase = base + (sy0 + row) * stride
+            dy = dy0 + row
+            dbase = (dy >> 3) * dw + dx0
+            bit = 1 << (dy & 7)
+            nbit = bit ^ 0xff
+            col = 0
+            while col < w:
+                sx = sx0 + col
+                v = ((s[sbase + (sx >> 3)] >> (7 - (sx & 7))) & 1) ^ inv
+                i = dbase + col
+                if v:
+                    if op == _CLEAR:
+                        d[i] = d[i] & nbit
+                    elif op == _XOR:
+                        d[i] = d[i] ^ bit
+                    else:
+                        d[i] = d[i] | bit
+                elif op == _COPY:
+                    d[i] = d[i] & nbit
+                col += 1
+            row += 1
+        return 0
+else:
+    def _blit_rows(dst, src, params):
+        dw, stride, sx0, sy0, dx0, dy0, w, h, op, inv, base = params
+        for row in range(h):
+            sbase = base + (sy0 + row) * stride
+            dy = dy0 + row
+            dbase = (dy >> 3) * dw + dx0
+            bit = 1 << (dy & 7)
+            nbit = bit ^ 0xff
+            for col in range(w):
+                sx = sx0 + col
+                v = ((src[sbase + (sx >> 3)] >> (7 - (sx & 7))) & 1) ^ inv
+                i = dbase + col
+                if v:
+                    if op == _CLEAR:
+                        dst[i] &= nbit
+                    elif op == _XOR:
+                        dst[i] ^= bit
+                    else:
+                        dst[i] |= bit
+                elif op == _COPY:
+                    dst[i] &= nbit
+        return 0
+
+
+def set_clip(x, y, w, h):
+    # Limita los blits siguientes a un rectángulo (p.ej. la zona que el
+    # compositor está redibujando)
+    c = _clip
+    c[0] = x
+    c[1] = y
+    c[2] = x + w
+    c[3] = y + h
+
+
+def reset_clip():
+    c = _clip
+    c[0] = 0
+    c[1] = 0
+    c[2] = _NO_CLIP
+    c[3] = _NO_CLIP
+
+
+def blit_buffer(dst, dst_w, dst_h, src, w, h, x, y, op=_OR, invert=False, offset=0):
+    """
+    Blitea src (MONO_HLSB, w x h, empezando en src[offset]) en el buffer
+    MONO_VLSB dst de dst_w x dst_h con la esquina en (x, y). Recorta contra
+    los bordes y el rectángulo de set_clip(). Devuelve False si quedó todo
+    afuera. No marca nada como sucio (para eso está blit()) ni aloca: el
+    rectángulo escrito queda en _params[4:8].
+    """
+    c = _clip
+    left = c[0] if c[0] > 0 else 0
+    top = c[1] if c[1] > 0 else 0
+    right = c[2] if c[2] < dst_w else dst_w
+    bottom = c[3] if c[3] < dst_h else dst_h
+    sx0 = left - x if x < left else 0
+    sy0 = top - y if y < top else 0
+    dx0 = x + sx0
+    dy0 = y + sy0
+    cw = min(w - sx0, right - dx0)
+    ch = min(h - sy0, bottom - dy0)
+    if cw <= 0 or ch <= 0:
+        return False
+    p = _params
+    p[0] = dst_w
+    p[1] = (w + 7) >> 3
+    p[2] = sx0
+    p[3] = sy0
+    p[4] = dx0
+    p[5] = dy0
+    p[6] = cw
+    p[7] = ch
+    p[8] = op
+    p[9] = 1 if invert else 0
+    p[10] = offset
+    _blit_rows(dst, src, p)
+    return True
+
+
+def blit(target, src, w, h, x, y, op=_OR, invert=False, offset=0):
+    """
+    blit_buffer() sobre un SSD1306 o un Canvas; en el SSD1306 marca sucia
+    sólo la zona escrita. Devuelve False si el destino no es MONO_VLSB
+    accesible (un FrameBuffer cualquiera), para que el que llama use
+    framebuf.blit.
+    """
+    surf = surface(target)
+    if surf is None:
+        return False
+    drawn = blit_buffer(surf[0], surf[1], surf[2], src, w, h, x, y, op, invert, offset)
+    mark_dirty = getattr(target, 'mark_dirty', None)
+    if drawn and mark_dirty is not None:
+        p = _params
+        mark_dirty(p[4], p[5], p[6], p[7])
+    return True
+
+
+def blit_masked(target, sprite, mask, w, h, x, y):
+    # Sprite con máscara (ambos MONO_HLSB del mismo tamaño): la máscara
+    # apaga lo que tapa el sprite y después se encienden sus píxeles. Sin
+    # máscara el sprite se copia opaco (COPY).
+    if mask is None:
+        return blit(target, sprite, w, h, x, y, _COPY)
+    return blit(target, mask, w, h, x, y, _CLEAR) and blit(target, sprite, w, h, x, y, _OR)
+
+
+def copy_frame(target, frame):
+    # Pantalla completa ya en MONO_VLSB (p.ej. los frames de la caminata):
+    # una sola asignación de slice sobre el buffer, sin convertir píxeles.
+    # Devuelve False si el destino no es una superficie del mismo tamaño.
+    surf = surface(target)
+    if surf is None or len(frame) != len(surf[0]):
+        return False
+    surf[0][:] = frame
+    mark_dirty = getattr(target, 'mark_dirty', None)
+    if mark_dirty is not None:
+        mark_dirty()
+    return True
+
+
+def invert_rect(target, x, y, w, h):
+    # Invierte un rectángulo del destino (XOR con todo en 1)
+    surf = surface(target)
+    if surf is None:
+        return False
+    buf, dw, dh = surf
+    x0 = max(0, x)
+    y0 = max(0, y)
+    x1 = min(dw, x + w)
+    y1 = min(dh, y + h)
+    if x0 >= x1 or y0 >= y1:
+        return True
+    for page in range(y0 >> 3, ((y1 - 1) >> 3) + 1):
+        top = max(y0 - page * 8, 0)
+        bottom = min(y1 - page * 8, 8)
+        mask = ((0xff << top) & 0xff) & (0xff >> (8 - bottom))
+        base = page * dw
+        for i in range(base + x0, base + x1):
+            buf[i] ^= mask
+    mark_dirty = getattr(target, 'mark_dirty', None)
+    if mark_dirty is not None:
+        mark_dirty(x0, y0, x1 - x0, y1 - y0)
+    return True
@@ -1,3 +1,12 @@
+# blues_corto.py
+# Convertido con scripts/music_gen.py --convert desde la versión anterior
+# de este módulo (ajustada a mano; no sale del .mid de assets/):
+# 74 notas, 40924 ms.
+# PIECE da (frecuencia, ms) desde EVENTS, pares (índice en FREQS, ms) en
+# uint16 little-endian con los tempos ya resueltos: sin una tupla por nota.
+
+from assets import Piece
+
 NOTES = {
     'SILENCE': 0,
     'A#3': 233,
@@ -17,81 +26,26 @@ NOTES = {
     'G3': 196,
     'G4': 392,
 }
-TEMPO = 370
-SUBDIV = 320
-PIECE = [
-    (NOTES['SILENCE'], TEMPO * 480 // SUBDIV),
-    (NOTES['G3'], TEMPO * 240 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 192 // SUBDIV),
-    (NOTES['C4'], TEMPO * 414 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 22 // SUBDIV),
-    (NOTES['D4'], TEMPO * 354 // SUBDIV),
-    (NOTES['C4'], TEMPO * 134 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 245 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 56 // SUBDIV),
-    (NOTES['C4'], TEMPO * 534 // SUBDIV),
-    (NOTES['G3'], TEMPO * 240 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 1200 // SUBDIV),
-    (NOTES['G1'], TEMPO * 811 // SUBDIV),
-    (NOTES['F1'], TEMPO * 1200 // SUBDIV),
-    (NOTES['G3'], TEMPO * 480 // SUBDIV),
-    (NOTES['A3'], TEMPO * 960 // SUBDIV),
-    (NOTES['F2'], TEMPO * 960 // SUBDIV),
-    (NOTES['D#2'], TEMPO * 1200 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 184 // SUBDIV),
-    (NOTES['G3'], TEMPO * 960 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 267 // SUBDIV),
-    (NOTES['C4'], TEMPO * 379 // SUBDIV),
-    (NOTES['C4'], TEMPO * 1417 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 301 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 72 // SUBDIV),
-    (NOTES['G3'], TEMPO * 480 // SUBDIV),
-    (NOTES['G3'], TEMPO * 1440 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 56 // SUBDIV),
-    (NOTES['D#2'], TEMPO * 960 // SUBDIV),
-    (NOTES['C2'], TEMPO * 960 // SUBDIV),
-    (NOTES['D2'], TEMPO * 1200 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO // SUBDIV),
-    (NOTES['G3'], TEMPO * 323 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 245 // SUBDIV),
-    (NOTES['C4'], TEMPO * 334 // SUBDIV),
-    (NOTES['C#4'], TEMPO * 189 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO // SUBDIV),
-    (NOTES['D4'], TEMPO * 412 // SUBDIV),
-    (NOTES['G4'], TEMPO * 235 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 23 // SUBDIV),
-    (NOTES['C#4'], TEMPO * 486 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 216 // SUBDIV),
-    (NOTES['C4'], TEMPO * 334 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 45 // SUBDIV),
-    (NOTES['G3'], TEMPO * 178 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 11 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 1398 // SUBDIV),
-    (NOTES['G1'], TEMPO * 350 // SUBDIV),
-    (NOTES['G1'], TEMPO * 240 // SUBDIV),
-    (NOTES['G1'], TEMPO * 240 // SUBDIV),
-    (NOTES['F1'], TEMPO * 1440 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 314 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 323 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 67 // SUBDIV),
-    (NOTES['C4'], TEMPO * 279 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 22 // SUBDIV),
-    (NOTES['A#3'], TEMPO * 279 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 10 // SUBDIV),
-    (NOTES['A3'], TEMPO * 1106 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 267 // SUBDIV),
-    (NOTES['A3'], TEMPO * 256 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 33 // SUBDIV),
-    (NOTES['G3'], TEMPO * 223 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 101 // SUBDIV),
-    (NOTES['D#3'], TEMPO * 800 // SUBDIV),
-    (NOTES['C3'], TEMPO * 240 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 110 // SUBDIV),
-    (NOTES['A3'], TEMPO * 234 // SUBDIV),
-    (NOTES['SILENCE'], TEMPO * 22 // SUBDIV),
-    (NOTES['G3'], TEMPO * 594 // SUBDIV),
-    (NOTES['D#3'], TEMPO * 1440 // SUBDIV),
-    (NOTES['C3'], TEMPO * 960 // SUBDIV),
-    (NOTES['D3'], TEMPO * 960 // SUBDIV),
-    (NOTES['D2'], TEMPO * 1680 // SUBDIV),
-]
\ No newline at end of file
+FREQS = (0, 233, 220, 277, 65, 131, 262, 78, 156, 73, 147, 294, 44, 87, 49, 196, 392,)
+EVENTS = (
+    b'\x00\x00\x2b\x02\x0f\x00\x15\x01\x01\x00\xde\x00\x06\x00\xde\x01'
+    b'\x00\x00\x19\x00\x0b\x00\x99\x01\x06\x00\x9a\x00\x01\x00\x1b\x01'
+    b'\x00\x00\x40\x00\x06\x00\x69\x02\x0f\x00\x15\x01\x01\x00\x6b\x05'
+    b'\x0e\x00\xa9\x03\x0c\x00\x6b\x05\x0f\x00\x2b\x02\x02\x00\x56\x04'
+    b'\x0d\x00\x56\x04\x07\x00\x6b\x05\x00\x00\xd4\x00\x0f\x00\x56\x04'
+    b'\x01\x00\x34\x01\x06\x00\xb6\x01\x06\x00\x66\x06\x01\x00\x5c\x01'
+    b'\x00\x00\x53\x00\x0f\x00\x2b\x02\x0f\x00\x81\x06\x00\x00\x40\x00'
+    b'\x07\x00\x56\x04\x04\x00\x56\x04\x09\x00\x6b\x05\x00\x00\x01\x00'
+    b'\x0f\x00\x75\x01\x01\x00\x1b\x01\x06\x00\x82\x01\x03\x00\xda\x00'
+    b'\x00\x00\x01\x00\x0b\x00\xdc\x01\x10\x00\x0f\x01\x00\x00\x1a\x00'
+    b'\x03\x00\x31\x02\x01\x00\xf9\x00\x06\x00\x82\x01\x00\x00\x34\x00'
+    b'\x0f\x00\xcd\x00\x00\x00\x0c\x00\x01\x00\x50\x06\x0e\x00\x94\x01'
+    b'\x0e\x00\x15\x01\x0e\x00\x15\x01\x0c\x00\x81\x06\x00\x00\x6b\x01'
+    b'\x01\x00\x75\x01\x00\x00\x4d\x00\x06\x00\x42\x01\x00\x00\x19\x00'
+    b'\x01\x00\x42\x01\x00\x00\x0b\x00\x02\x00\xfe\x04\x00\x00\x34\x01'
+    b'\x02\x00\x28\x01\x00\x00\x26\x00\x0f\x00\x01\x01\x00\x00\x74\x00'
+    b'\x08\x00\x9d\x03\x05\x00\x15\x01\x00\x00\x7f\x00\x02\x00\x0e\x01'
+    b'\x00\x00\x19\x00\x0f\x00\xae\x02\x08\x00\x81\x06\x05\x00\x56\x04'
+    b'\x0a\x00\x56\x04\x09\x00\x96\x07'
+)
+PIECE = Piece(FREQS, EVENTS)
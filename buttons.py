@@ -0,0 +1,235 @@
+# buttons.py
+# Propósito: Entrada de botones por interrupciones. Cada flanco (Pin.irq) se guarda con su tiempo en un anillo preasignado, así no se pierde un click más corto que el ciclo de una escena. El antirrebote y los gestos (click, pulsación larga, doble click, repetición) se resuelven del lado del que consume, cuando la escena llama a events() desde su bucle: nada espera a que se suelte el botón.
+
+import time
+from array import array
+from machine import Pin
+import config
+
+# Tipos de evento
+PRESS = 0    # Apretado (ya sin rebote): para acciones inmediatas
+RELEASE = 1  # Soltado
+CLICK = 2    # Apretado y soltado antes de long_ms
+LONG = 3     # Sigue apretado después de long_ms
+REPEAT = 4   # Cada repeat_ms mientras sigue apretado después del LONG
+DOUBLE = 5   # Segundo click dentro de double_ms (sólo con enable_double)
+
+EVENT_NAMES = ('PRESS', 'RELEASE', 'CLICK', 'LONG', 'REPEAT', 'DOUBLE')
+
+_STALE_MS = 60_000
+
+
+class _Key:
+    # Estado de un botón del lado del consumidor (niveles con pull-up:
+    # 0 = apretado, 1 = suelto)
+    def __init__(self, level):
+        self.stable = level     # Último nivel aceptado
+        self.raw = level        # Último nivel visto en un flanco
+        self.raw_t = 0
+        self.change_t = 0       # Cuándo se aceptó el nivel estable
+        self.down_t = 0
+        self.held = False       # Ya hubo LONG
+        self.ignore = False     # Pulsación de antes de clear(): no da gestos
+        self.next_repeat = 0
+        self.double = False     # Espera un segundo click antes del CLICK
+        self.pending = False    # Click esperando a ver si llega el segundo
+        self.second = False     # Esta pulsación es el segundo click
+        self.up_t = 0
+
+
+class Buttons:
+    """
+    Grupo de botones con un anillo de flancos compartido. El handler de la
+    IRQ sólo escribe tiempo y código (botón, nivel) en arrays ya creados;
+    si el anillo se llena se cuentan los flancos perdidos en `dropped`.
+
+    events() vacía el anillo, aplica el antirrebote (se acepta el primer
+    flanco y se ignoran los siguientes durante debounce_ms) y devuelve los
+    eventos nuevos como (índice del botón, tipo).
+    """
+
+    def __init__(self, pins, size=None):
+        self.pins = tuple(pins)
+        size = size or config.INPUT_QUEUE
+        # El anillo usa un tamaño potencia de 2 para enmascarar el índice
+        n = 1
+        while n < size:
+            n <<= 1
+        self._mask = n - 1
+        self._times = array('i', bytes(4 * n))
+        self._codes = bytearray(n)
+        self._head = 0  # Lo escribe sólo la IRQ
+        self._tail = 0  # Lo escribe sólo el consumidor
+        self.dropped = 0
+        self.debounce_ms = config.INPUT_DEBOUNCE_MS
+        self.long_ms = config.INPUT_LONG_MS
+        self.double_ms = config.INPUT_DOUBLE_MS
+        self.repeat_ms = config.INPUT_REPEAT_MS
+        self.keys = [_Key(pin.value()) for pin in self.pins]
+        ready = time.ticks_add(time.ticks_ms(), -self.debounce_ms)
+        for key in self.keys:
+            key.change_t = ready
+        self.queue = []
+        for i, pin in enumerate(self.pins):
+            pin.irq(handler=self._handler(i), trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING)
+
+    def _handler(self, index):
+        # Handler de IRQ del botón index: no aloca ni llama al consumidor
+        def edge(pin):
+            head = self._head
+            nxt = (head + 1) & self._mask
+            if nxt == self._tail:
+                self.dropped += 1
+                return
+            self._times[head] = time.ticks_ms()
+            self._codes[head] = (index << 1) | pin.value()
+            self._head = nxt
+        return edge
+
+    def index(self, pin):
+        return self.pins.index(pin)
+
+    def enable_double(self, index, enabled=True):
+        # Con doble click el CLICK se demora hasta double_ms para ver si
+        # llega el segundo; sin él (por defecto) sale apenas se suelta
+        self.keys[index].double = enabled
+
+    def pressed(self, index):
+        return self.keys[index].stable == 0
+
+    def clear(self):
+        """
+        Descarta lo pendiente al entrar a una escena: los eventos en cola y
+        lo que quede de las pulsaciones en curso (soltar un botón que se
+        apretó en la escena anterior sólo da RELEASE, no CLICK).
+        """
+        self.poll()
+        self.queue = []
+        for key in self.keys:
+            key.pending = False
+            key.second = False
+            key.ignore = key.stable == 0
+
+    def events(self):
+        # Eventos nuevos desde la última llamada: [(botón, tipo), ...]
+        self.poll()
+        events = self.queue
+        self.queue = []
+        return events
+
+    def take(self, index, kind):
+        # True si hay (y saca) un evento kind del botón index en la cola
+        self.poll()
+        for event in self.queue:
+            if event[0] == index and event[1] == kind:
+                self.queue.remove(event)
+                return True
+        return False
+
+    def poll(self, now=None):
+        # Vacía el anillo y corre el antirrebote y los temporizadores
+        times = self._times
+        codes = self._codes
+        tail = self._tail
+        while tail != self._head:
+            t = times[tail]
+            code = codes[tail]
+            tail = (tail + 1) & self._mask
+            self._edge(code >> 1, code & 1, t)
+        self._tail = tail
+        if now is None:
+            now = time.ticks_ms()
+        for i, key in enumerate(self.keys):
+            self._timers(i, key, now)
+
+    def _edge(self, i, level, t):
+        key = self.keys[i]
+        key.raw = level
+        key.raw_t = t
+        if level != key.stable and time.ticks_diff(t, key.change_t) >= self.debounce_ms:
+            self._accept(i, key, level, t)
+
+    def _timers(self, i, key, now):
+        # Un rebote pudo dejar el último nivel distinto del aceptado: se
+        # acepta cuando pasó la ventana de antirrebote
+        if key.raw != key.stable and time.ticks_diff(now, key.change_t) >= self.debounce_ms:
+            t = key.raw_t
+            if time.ticks_diff(t, key.change_t) < self.debounce_ms:
+                t = time.ticks_add(key.change_t, self.debounce_ms)
+            self._accept(i, key, key.raw, t)
+        elif time.ticks_diff(now, key.change_t) > _STALE_MS:
+            # Que la referencia no quede tan atrás que ticks_diff dé la vuelta
+            key.change_t = time.ticks_add(now, -_STALE_MS)
+        if key.stable == 0 and not key.ignore:
+            if not key.held and time.ticks_diff(now, key.down_t) >= self.long_ms:
+                if key.second:
+                    # El segundo click quedó largo: el primero vale solo
+                    self.queue.append((i, CLICK))
+                    key.second = False
+                key.held = True
+                key.next_repeat = time.ticks_add(key.down_t, self.long_ms + self.repeat_ms)
+                self.queue.append((i, LONG))
+            elif key.held and self.repeat_ms and time.ticks_diff(now, key.next_repeat) >= 0:
+                key.next_repeat = time.ticks_add(key.next_repeat, self.repeat_ms)
+                if time.ticks_diff(now, key.next_repeat) >= 0:
+                    # Si la escena estuvo ocupada no se acumulan repeticiones
+                    key.next_repeat = time.ticks_add(now, self.repeat_ms)
+                self.queue.append((i, REPEAT))
+        if key.pending and time.ticks_diff(now, key.up_t) > self.double_ms:
+            key.pending = False
+            self.queue.append((i, CLICK))
+
+    def _accept(self, i, key, level, t):
+        key.stable = level
+        key.change_t = t
+        if level == 0:
+            key.down_t = t
+            key.held = False
+            key.ignore = False
+            if key.pending:
+                key.pending = False
+                if time.ticks_diff(t, key.up_t) <= self.double_ms:
+                    key.second = True
+                else:
+                    self.queue.append((i, CLICK))
+            self.queue.append((i, PRESS))
+            return
+        self.queue.append((i, RELEASE))
+        if key.held or key.ignore:
+            return
+        if key.second:
+            key.second = False
+            self.queue.append((i, DOUBLE))
+        elif key.double:
+            key.pending = True
+            key.up_t = t
+        else:
+            self.queue.append((i, CLICK))
+
+
+_groups = []
+
+
+def attach(*pins):
+    # Crea el grupo de botones de estos pines (hardware.init_hardware)
+    keys = Buttons(pins)
+    _groups.append(keys)
+    return keys
+
+
+def poll_all():
+    # Corre poll() en todos los grupos; True si quedaron eventos en cola
+    queued = False
+    for keys in _groups:
+        keys.poll()
+        if keys.queue:
+            queued = True
+    return queued
+
+
+def of(pin):
+    # El grupo al que pertenece el pin; si no está en ninguno se crea uno
+    for keys in _groups:
+        if pin in keys.pins:
+            return keys
+    return attach(pin)
@@ -4,11 +4,42 @@
 # Display Settings
 OLED_WIDTH = 128
 OLED_HEIGHT = 64
+# Shadow-buffer diff: show() only sends bytes that differ from the last frame
+OLED_DIFF_MODE = True
+# Diff size (bytes) above which a full frame is sent instead (None = 3/4 frame)
+OLED_DIFF_THRESHOLD = None
+# Double buffering: show() returns right away and a worker thread flushes.
+# Only on the boards listed (sys.platform): rp2 allows a single extra thread
+OLED_ASYNC_FLUSH = True
+OLED_ASYNC_FLUSH_PLATFORMS = ('esp32',)
+
+# Display bus: "i2c" or "spi"
+OLED_BUS = "i2c"
 
 # I2C Pins
 PIN_SCL = 22
 PIN_SDA = 21
 
+# I2C Bus
+OLED_I2C_ADDR = 0x3C
+I2C_FREQ = 400_000  # Used as is when the probe is off, and as its fallback
+# At boot, step the clock up through the rates above I2C_FREQ pushing test
+# frames and keep the fastest one without ACK/EIO errors (never below I2C_FREQ)
+I2C_PROBE = True
+I2C_PROBE_FREQS = (1_000_000, 1_400_000, 2_000_000)
+I2C_PROBE_FRAMES = 3
+# Print full-frame / single-page flush times after init (hardware.benchmark_bus)
+I2C_BENCHMARK = False
+
+# SPI Bus (OLED_BUS = "spi")
+SPI_ID = 2              # VSPI on ESP32
+SPI_BAUDRATE = 10_000_000
+PIN_SPI_SCK = 18
+PIN_SPI_MOSI = 23
+PIN_OLED_DC = 16
+PIN_OLED_RES = 17
+PIN_OLED_CS = 15        # None if CS is tied to GND (display alone on the bus)
+
 # Audio Pins
 PIN_BUZZER = 25
 
@@ -18,3 +49,26 @@ PIN_BUTTON_B = 5
 
 # Animation Settings
 ANIMATION_SPEED_MS = 125
+# Frame clock rates (frame_clock.FrameClock)
+INTRO_FPS = 60          # Fly-in de los logos de la intro
+FADE_STEP_MS = 15       # Pausa entre pasos del fade de contraste
+INPUT_POLL_HZ = 20      # Lectura de botones en menú y pantallas de espera
+TRANSITION_FPS = 30     # Pasos por segundo de las transiciones (transitions.py)
+
+# Buttons (buttons.py)
+INPUT_QUEUE = 32         # Flancos que entran en el anillo de la IRQ
+INPUT_DEBOUNCE_MS = 20   # Se ignoran flancos por este tiempo después de uno aceptado
+INPUT_LONG_MS = 400      # Pulsación larga
+INPUT_DOUBLE_MS = 350    # Ventana del doble click
+INPUT_REPEAT_MS = 150    # Repetición mientras se mantiene después del LONG
+INPUT_TASK_MS = 10       # Período de la tarea de entrada del runtime
+
+# Runtime (runtime.py)
+ENGINE_TICK_MS = 1000    # Período de engine.update()
+
+# Music (sound_manager.py)
+MUSIC_TIMER_ID = None    # None: el secuenciador corre como tarea del runtime; 0-3: con ese machine.Timer
+
+# Fonts
+FONT_GLYPH_CACHE_BYTES = 2048  # Budget for ready-to-blit glyphs (fonts.py), LRU
+FONT_TEXT_CACHE_BYTES = 1536   # Budget for pre-rendered strings (fonts.draw_text), LRU
@@ -0,0 +1,177 @@
+# framebuf.py (emulador)
+# Propósito: Implementación en Python puro del módulo `framebuf` de MicroPython (formatos monocromo MONO_VLSB, MONO_HLSB y MONO_HMSB) para correr el firmware en la PC. Lenta pero fiel al layout de bits del original.
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+_FONT = None
+
+
+def _load_font():
+    # MicroPython trae una fuente fija de 8x8. Acá la rasterizamos con la
+    # fuente bitmap por defecto de Pillow; si no está, cajas de 6x7.
+    global _FONT
+    _FONT = {}
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+        font = ImageFont.load_default()
+        for code in range(32, 127):
+            img = Image.new('1', (8, 8), 0)
+            ImageDraw.Draw(img).text((1, -1), chr(code), fill=1, font=font)
+            _FONT[code] = [[img.getpixel((x, y)) for x in range(8)] for y in range(8)]
+    except Exception:
+        box = [[1 if 1 <= x <= 6 and 1 <= y <= 7 else 0 for x in range(8)] for y in range(8)]
+        for code in range(33, 127):
+            _FONT[code] = box
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format=MONO_VLSB, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError("invalid format")
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        if format != MONO_VLSB:
+            self.stride = (self.stride + 7) & ~7
+        needed = self._size()
+        if len(buffer) < needed:
+            raise ValueError("buffer too small")
+
+    def _size(self):
+        if self.format == MONO_VLSB:
+            return ((self.height + 7) >> 3) * self.stride
+        return (self.stride * self.height) >> 3
+
+    def _get(self, x, y):
+        buf = self.buffer
+        if self.format == MONO_VLSB:
+            return (buf[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+        index = (y * self.stride + x) >> 3
+        if self.format == MONO_HLSB:
+            return (buf[index] >> (7 - (x & 7))) & 1
+        return (buf[index] >> (x & 7)) & 1
+
+    def _set(self, x, y, c):
+        buf = self.buffer
+        if self.format == MONO_VLSB:
+            index = (y >> 3) * self.stride + x
+            bit = 1 << (y & 7)
+        else:
+            index = (y * self.stride + x) >> 3
+            bit = 1 << ((7 - (x & 7)) if self.format == MONO_HLSB else (x & 7))
+        if c & 1:
+            buf[index] |= bit
+        else:
+            buf[index] &= ~bit & 0xFF
+
+    def fill(self, c):
+        value = 0xFF if c & 1 else 0x00
+        buf = self.buffer
+        for i in range(self._size()):
+            buf[i] = value
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # Bresenham, como framebuf.c
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            # (buffer, width, height, format[, stride[, palette]])
+            fbuf = FrameBuffer(*fbuf)
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + fbuf.width)
+        y1 = min(self.height, y + fbuf.height)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                c = fbuf._get(xx - x, yy - y)
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                if c != key:
+                    self._set(xx, yy, c)
+
+    def scroll(self, xstep, ystep):
+        # Igual que MicroPython: lo que queda descubierto conserva su valor
+        w = self.width
+        h = self.height
+        if xstep < 0:
+            sx, xend, dx = 0, w + xstep, 1
+        else:
+            sx, xend, dx = w - 1, xstep - 1, -1
+        if ystep < 0:
+            y, yend, dy = 0, h + ystep, 1
+        else:
+            y, yend, dy = h - 1, ystep - 1, -1
+        while y != yend:
+            x = sx
+            while x != xend:
+                self._set(x, y, self._get(x - xstep, y - ystep))
+                x += dx
+            y += dy
+
+    def text(self, s, x, y, c=1):
+        if _FONT is None:
+            _load_font()
+        for ch in s:
+            glyph = _FONT.get(ord(ch))
+            if glyph is not None:
+                for gy in range(8):
+                    row = glyph[gy]
+                    for gx in range(8):
+                        if row[gx]:
+                            self.pixel(x + gx, y + gy, c)
+            x += 8
+
+
+def FrameBuffer1(buffer, width, height, stride=None):
+    return FrameBuffer(buffer, width, height, MONO_VLSB, stride)
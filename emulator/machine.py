@@ -0,0 +1,315 @@
+# machine.py (emulador)
+# Propósito: Reemplazo en CPython del módulo `machine` de MicroPython (Pin, I2C, SPI, PWM, Timer). Los dispositivos del bus (el panel SSD1306) se registran desde emulator/run.py y los pines se manejan desde afuera con Pin.drive() para simular botones.
+
+import threading
+import time
+
+# Dispositivos conectados: los llena el runner
+i2c_devices = {}          # addr -> objeto con i2c_write(data)
+spi_devices = {}          # id de bus -> (dispositivo, pin DC, pin CS)
+# Frecuencia máxima que "aguanta" el cableado emulado; arriba de esto
+# writeto falla con EIO como en una placa con pull-ups débiles.
+max_i2c_freq = 1_000_000
+# Si es True las transferencias duermen lo que tardaría el bus real
+bus_timing = True
+
+_pins = {}
+_T0 = time.monotonic()
+
+
+def freq(hz=None):
+    return 240_000_000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def soft_reset():
+    raise SystemExit("machine.soft_reset()")
+
+
+def idle():
+    time.sleep(0)
+
+
+def unique_id():
+    return b'\x4e\x4f\x4d\x41\x44\x00'
+
+
+_irq_lock = threading.RLock()
+
+
+def disable_irq():
+    _irq_lock.acquire()
+    return 0
+
+
+def enable_irq(state=0):
+    _irq_lock.release()
+
+
+def _bus_wait(bits, hz):
+    if bus_timing and hz:
+        time.sleep(bits / hz)
+
+
+class Pin:
+    # Valores del port ESP32
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_DOWN = 1
+    PULL_UP = 2
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __new__(cls, id, *args, **kwargs):
+        # Como en MicroPython, Pin(n) devuelve siempre el mismo pin físico
+        pin = _pins.get(id)
+        if pin is None:
+            pin = object.__new__(cls)
+            pin.id = id
+            pin._mode = None
+            pin._pull = None
+            pin._out = 0
+            pin._ext = None          # Nivel forzado desde afuera (botón)
+            pin._handler = None
+            pin._trigger = 0
+            _pins[id] = pin
+        return pin
+
+    def __init__(self, id, mode=-1, pull=-1, value=None, **kwargs):
+        self.init(mode, pull, value=value)
+
+    def init(self, mode=-1, pull=-1, value=None, **kwargs):
+        if mode != -1:
+            self._mode = mode
+        if pull != -1:
+            self._pull = pull
+        if value is not None:
+            self._out = 1 if value else 0
+
+    def __repr__(self):
+        return "Pin(%s)" % self.id
+
+    def _level(self):
+        if self._ext is not None:
+            return self._ext
+        if self._mode == Pin.OUT or self._mode == Pin.OPEN_DRAIN:
+            return self._out
+        if self._pull == Pin.PULL_UP:
+            return 1
+        return 0
+
+    def value(self, v=None):
+        if v is None:
+            return self._level()
+        old = self._level()
+        self._out = 1 if v else 0
+        self._edge(old)
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    high = on
+    low = off
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, **kwargs):
+        self._handler = handler
+        self._trigger = trigger if handler is not None else 0
+        return self
+
+    def drive(self, level):
+        """Fuerza el nivel desde afuera (None lo suelta). Dispara la IRQ."""
+        old = self._level()
+        self._ext = level
+        self._edge(old)
+
+    def _edge(self, old):
+        new = self._level()
+        if new == old or self._handler is None:
+            return
+        if (new and self._trigger & Pin.IRQ_RISING) or (not new and self._trigger & Pin.IRQ_FALLING):
+            with _irq_lock:
+                self._handler(self)
+
+
+class I2C:
+    def __init__(self, id=0, *, scl=None, sda=None, freq=400_000, timeout=50_000):
+        self.id = id
+        self.scl = scl
+        self.sda = sda
+        self.freq = freq
+
+    def init(self, *, scl=None, sda=None, freq=400_000, **kwargs):
+        self.freq = freq
+
+    def deinit(self):
+        pass
+
+    def _check(self, addr):
+        if self.freq > max_i2c_freq:
+            raise OSError(5)    # EIO
+        if addr not in i2c_devices:
+            raise OSError(19)   # ENODEV
+        return i2c_devices[addr]
+
+    def scan(self):
+        if self.freq > max_i2c_freq:
+            return []
+        return sorted(i2c_devices)
+
+    def writeto(self, addr, buf, stop=True):
+        device = self._check(addr)
+        data = bytes(buf)
+        # Dirección + bytes, 9 bits cada uno (con ACK)
+        _bus_wait((len(data) + 1) * 9, self.freq)
+        device.i2c_write(data)
+        return len(data)
+
+    def writevto(self, addr, vector, stop=True):
+        # Una sola transacción: los buffers van pegados después de la dirección
+        device = self._check(addr)
+        data = b''.join(bytes(b) for b in vector)
+        _bus_wait((len(data) + 1) * 9, self.freq)
+        device.i2c_write(data)
+        return len(data)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        self._check(addr)
+        return bytes(nbytes)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        self._check(addr)
+
+
+class SoftI2C(I2C):
+    pass
+
+
+class SPI:
+    MSB = 0
+    LSB = 1
+
+    def __init__(self, id=1, baudrate=1_000_000, *, polarity=0, phase=0, bits=8,
+                 firstbit=MSB, sck=None, mosi=None, miso=None):
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate=None, **kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        data = bytes(buf)
+        _bus_wait(len(data) * 8, self.baudrate)
+        attached = spi_devices.get(self.id)
+        if attached is None:
+            return
+        device, dc, cs = attached
+        if cs is not None and Pin(cs).value():
+            return
+        device.spi_write(data, Pin(dc).value())
+
+    def read(self, nbytes, write=0x00):
+        return bytes(nbytes)
+
+    def write_readinto(self, write_buf, read_buf):
+        self.write(write_buf)
+
+
+class PWM:
+    # Registro de notas: (ms desde el arranque, freq) cada vez que el buzzer
+    # arranca un tono
+    log = []
+
+    def __init__(self, dest, *, freq=None, duty=None, duty_u16=None):
+        self.pin = dest
+        self._freq = 5000
+        self._duty = 0
+        if freq is not None:
+            self.freq(freq)
+        if duty is not None:
+            self.duty(duty)
+        if duty_u16 is not None:
+            self.duty_u16(duty_u16)
+
+    def init(self, *, freq=None, duty=None, duty_u16=None):
+        self.__init__(self.pin, freq=freq, duty=duty, duty_u16=duty_u16)
+
+    def deinit(self):
+        self._duty = 0
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self._freq = int(value)
+        if self._duty:
+            self._note()
+
+    def duty(self, value=None):
+        if value is None:
+            return self._duty >> 6
+        self.duty_u16(int(value) << 6)
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        was = self._duty
+        self._duty = int(value)
+        if self._duty and not was:
+            self._note()
+
+    def _note(self):
+        PWM.log.append((int((time.monotonic() - _T0) * 1000), self._freq))
+        if len(PWM.log) > 4096:
+            del PWM.log[:2048]
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.id = id
+        self._stop = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, *, mode=PERIODIC, period=-1, freq=-1, callback=None, **kwargs):
+        self.deinit()
+        if freq > 0:
+            period_s = 1 / freq
+        else:
+            period_s = max(period, 1) / 1000
+        stop = threading.Event()
+        self._stop = stop
+
+        def run():
+            deadline = time.monotonic() + period_s
+            while not stop.wait(max(0, deadline - time.monotonic())):
+                if callback is not None:
+                    with _irq_lock:
+                        callback(self)
+                if mode == Timer.ONE_SHOT:
+                    break
+                deadline += period_s
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def deinit(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def value(self):
+        return 0
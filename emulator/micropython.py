@@ -0,0 +1,40 @@
+# micropython.py (emulador)
+# Propósito: Reemplazo en CPython del módulo `micropython` para correr el firmware en la PC.
+
+def const(value):
+    return value
+
+
+# Los emisores de código nativo no existen en CPython: devolvemos la función
+# tal cual. El firmware sólo usa viper cuando corre sobre MicroPython
+# (ver sys.implementation), así que el código viper nunca se ejecuta acá.
+def native(func):
+    return func
+
+
+def viper(func):
+    return func
+
+
+def schedule(func, arg):
+    func(arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def opt_level(level=None):
+    return 0
+
+
+def mem_info(verbose=False):
+    print("mem_info not available in the emulator")
+
+
+def heap_lock():
+    return 0
+
+
+def heap_unlock():
+    return 0
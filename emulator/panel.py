@@ -0,0 +1,296 @@
+# panel.py (emulador)
+# Propósito: Controlador SSD1306 virtual. Decodifica el tráfico I2C (bytes de control 0x00/0x40/0x80) o SPI (pin DC) en comandos y escrituras a una GDDRAM de 128x64, y lleva la cuenta de transacciones y bytes para medir cuánto le cuesta al bus cada escena.
+
+import struct
+import time
+import zlib
+
+WIDTH = 128
+HEIGHT = 64
+PAGES = HEIGHT // 8
+PANEL_FPS = 100  # Refresco aproximado con SET_DISP_CLK_DIV 0x80
+
+# Bytes de parámetro que sigue a cada comando
+_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2a: 5,
+    0x81: 1, 0x8d: 1, 0xa3: 2, 0xa8: 1, 0xd3: 1, 0xd5: 1, 0xd9: 1,
+    0xda: 1, 0xdb: 1,
+}
+
+# Frames entre pasos de scroll, indexado por el byte de intervalo (0..7)
+_SCROLL_FRAMES = (5, 64, 128, 256, 3, 4, 25, 2)
+
+
+class Counters:
+    def __init__(self):
+        self.transactions = 0
+        self.bytes = 0          # Todo lo que pasó por el bus
+        self.data_bytes = 0     # Bytes de píxeles escritos en la GDDRAM
+        self.cmd_bytes = 0      # Comandos y parámetros
+        self.data_writes = 0    # Transacciones con datos de píxeles
+
+    def copy(self):
+        c = Counters()
+        c.__dict__.update(self.__dict__)
+        return c
+
+    def since(self, start):
+        c = Counters()
+        for k, v in self.__dict__.items():
+            setattr(c, k, v - getattr(start, k))
+        return c
+
+
+class SSD1306Panel:
+    def __init__(self):
+        self.ram = bytearray(WIDTH * PAGES)  # Indexada por segmento físico
+        self.counters = Counters()
+        self.listeners = []  # Se llaman después de cada transacción
+        self.reset()
+
+    def reset(self):
+        self.mem_mode = 2       # Modo página, como al encender
+        self.col0 = 0
+        self.col1 = WIDTH - 1
+        self.page0 = 0
+        self.page1 = PAGES - 1
+        self.col = 0
+        self.page = 0
+        self.start_line = 0
+        self.offset = 0
+        self.mux = HEIGHT
+        self.seg_remap = 0
+        self.com_remap = 0
+        self.contrast = 0x7f
+        self.inverted = False
+        self.entire_on = False
+        self.on = False
+        self.scroll = None      # (dirección, p0, p1, frames, dy)
+        self._scrolling = False
+        self._scroll_t0 = 0
+        self._pending = []
+
+    # --- Bus ---
+
+    def i2c_write(self, data):
+        self.counters.transactions += 1
+        self.counters.bytes += len(data) + 1  # Más el byte de dirección
+        wrote = False
+        i = 0
+        n = len(data)
+        while i < n:
+            control = data[i]
+            i += 1
+            is_data = control & 0x40
+            if control & 0x80:
+                # Co=1: un solo byte y después viene otro byte de control
+                if i < n:
+                    if is_data:
+                        self._data(data[i:i + 1])
+                        wrote = True
+                    else:
+                        self._command(data[i])
+                i += 1
+            else:
+                # Co=0: el resto de la transacción es un stream
+                if is_data:
+                    self._data(data[i:])
+                    wrote = True
+                else:
+                    for b in data[i:]:
+                        self._command(b)
+                break
+        self._done(wrote)
+
+    def spi_write(self, data, dc):
+        self.counters.transactions += 1
+        self.counters.bytes += len(data)
+        if dc:
+            self._data(data)
+        else:
+            for b in data:
+                self._command(b)
+        self._done(dc)
+
+    def _done(self, wrote):
+        if wrote:
+            self.counters.data_writes += 1
+        for listener in self.listeners:
+            listener(self)
+
+    # --- Comandos ---
+
+    def _command(self, b):
+        self.counters.cmd_bytes += 1
+        pending = self._pending
+        pending.append(b)
+        if len(pending) <= _ARGS.get(pending[0], 0):
+            return
+        self._pending = []
+        self._execute(pending[0], pending[1:])
+
+    def _execute(self, c, args):
+        if c == 0x20:
+            self.mem_mode = args[0] & 3
+        elif c == 0x21:
+            self.col0 = self.col = args[0] & 0x7f
+            self.col1 = args[1] & 0x7f
+        elif c == 0x22:
+            self.page0 = self.page = args[0] & 7
+            self.page1 = args[1] & 7
+        elif c == 0x81:
+            self.contrast = args[0]
+        elif c in (0x26, 0x27):
+            self._stop_scroll()
+            self.scroll = (1 if c == 0x26 else -1, args[1] & 7, args[3] & 7,
+                           _SCROLL_FRAMES[args[2] & 7], 0)
+        elif c in (0x29, 0x2a):
+            self._stop_scroll()
+            self.scroll = (1 if c == 0x29 else -1, args[1] & 7, args[3] & 7,
+                           _SCROLL_FRAMES[args[2] & 7], args[4] & 0x3f)
+        elif c == 0x2e:
+            self._stop_scroll()
+        elif c == 0x2f:
+            self._scroll_t0 = time.monotonic()
+            self._scrolling = True
+        elif 0x40 <= c <= 0x7f:
+            self.start_line = c & 0x3f
+        elif c in (0xa0, 0xa1):
+            self.seg_remap = c & 1
+        elif c in (0xa4, 0xa5):
+            self.entire_on = bool(c & 1)
+        elif c in (0xa6, 0xa7):
+            self.inverted = bool(c & 1)
+        elif c == 0xa8:
+            self.mux = (args[0] & 0x3f) + 1
+        elif c in (0xae, 0xaf):
+            self.on = bool(c & 1)
+        elif 0xb0 <= c <= 0xb7:
+            self.page = c & 7
+        elif c <= 0x0f:
+            self.col = (self.col & 0xf0) | c
+        elif c <= 0x1f:
+            self.col = (self.col & 0x0f) | ((c & 0x0f) << 4)
+        elif c in (0xc0, 0xc8):
+            self.com_remap = 1 if c & 0x08 else 0
+        elif c == 0xd3:
+            self.offset = args[0] & 0x3f
+        # 0xa3, 0xd5, 0xd9, 0xda, 0xdb, 0x8d, 0xe3: no cambian la imagen
+
+    # --- GDDRAM ---
+
+    def _data(self, data):
+        ram = self.ram
+        mode = self.mem_mode
+        for b in data:
+            seg = WIDTH - 1 - self.col if self.seg_remap else self.col
+            ram[self.page * WIDTH + seg] = b
+            self.counters.data_bytes += 1
+            if mode == 0:       # Horizontal
+                self.col += 1
+                if self.col > self.col1:
+                    self.col = self.col0
+                    self.page += 1
+                    if self.page > self.page1:
+                        self.page = self.page0
+            elif mode == 1:     # Vertical
+                self.page += 1
+                if self.page > self.page1:
+                    self.page = self.page0
+                    self.col += 1
+                    if self.col > self.col1:
+                        self.col = self.col0
+            else:               # Página
+                self.col = (self.col + 1) & 0x7f
+
+    # --- Scroll por hardware ---
+
+    def _scroll_steps(self):
+        if self.scroll is None or not self._scrolling:
+            return 0
+        frames = int((time.monotonic() - self._scroll_t0) * PANEL_FPS)
+        return frames // self.scroll[3]
+
+    def _stop_scroll(self):
+        # El controlador deja la GDDRAM rotada donde quedó el scroll
+        steps = self._scroll_steps()
+        if steps and self.scroll is not None:
+            direction, p0, p1 = self.scroll[:3]
+            shift = (steps * direction) % WIDTH
+            for page in range(p0, p1 + 1):
+                row = self.ram[page * WIDTH:(page + 1) * WIDTH]
+                # Con SEG_REMAP (el normal de los drivers) la columna 0 queda
+                # a la izquierda, así que en segmentos el scroll va al revés
+                s = (-shift if self.seg_remap else shift) % WIDTH
+                row = row[-s:] + row[:-s] if s else row
+                self.ram[page * WIDTH:(page + 1) * WIDTH] = row
+        self.scroll = None
+        self._scrolling = False
+
+    # --- Imagen visible ---
+
+    def _visible_pixel(self, vx, vy, shift, dy):
+        r = vy if self.com_remap else HEIGHT - 1 - vy
+        line = (r + self.start_line + self.offset + dy) % HEIGHT
+        seg = WIDTH - 1 - vx
+        page = line >> 3
+        if shift and self.scroll[1] <= page <= self.scroll[2]:
+            seg = (seg + (shift if self.seg_remap else -shift)) % WIDTH
+        return (self.ram[page * WIDTH + seg] >> (line & 7)) & 1
+
+    def pixels(self):
+        """
+        Imagen tal como la ve quien mira el panel: lista de HEIGHT filas de
+        WIDTH valores 0/1. Aplica display on/off, invertido, línea de inicio,
+        orientación (SEG/COM remap) y el scroll por hardware en curso.
+        """
+        if not self.on:
+            return [[0] * WIDTH for _ in range(HEIGHT)]
+        if self.entire_on:
+            return [[1] * WIDTH for _ in range(HEIGHT)]
+        steps = self._scroll_steps()
+        shift = 0
+        dy = 0
+        if steps:
+            shift = (steps * self.scroll[0]) % WIDTH
+            dy = (steps * self.scroll[4]) % HEIGHT
+        inv = 1 if self.inverted else 0
+        rows = []
+        for vy in range(HEIGHT):
+            if vy >= self.mux:
+                rows.append([0] * WIDTH)
+                continue
+            rows.append([self._visible_pixel(vx, vy, shift, dy) ^ inv for vx in range(WIDTH)])
+        return rows
+
+    def framebuffer(self):
+        """La imagen visible en el layout MONO_VLSB del driver (128x8 bytes)."""
+        out = bytearray(WIDTH * PAGES)
+        for y, row in enumerate(self.pixels()):
+            bit = 1 << (y & 7)
+            base = (y >> 3) * WIDTH
+            for x in range(WIDTH):
+                if row[x]:
+                    out[base + x] |= bit
+        return out
+
+    def save_png(self, path, scale=4):
+        # PNG en escala de grises armado a mano (zlib), sin depender de Pillow
+        level = 64 + (self.contrast * 191) // 255
+        raw = bytearray()
+        for row in self.pixels():
+            line = bytearray(b'\x00')  # Filtro "None"
+            for p in row:
+                line.extend((level if p else 0,) * scale)
+            for _ in range(scale):
+                raw.extend(line)
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', WIDTH * scale, HEIGHT * scale, 8, 0, 0, 0, 0)))
+            f.write(_chunk(b'IDAT', zlib.compress(bytes(raw))))
+            f.write(_chunk(b'IEND', b''))
+
+
+def _chunk(kind, data):
+    body = kind + data
+    return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
@@ -0,0 +1,315 @@
+# run.py (emulador)
+# Propósito: Corre el firmware sin modificar en CPython, sin placa ni Wokwi. Pone emulator/ adelante en sys.path (machine, framebuf, micropython), completa `time`/`sys`/`gc` con lo que agrega MicroPython, conecta un SSD1306 virtual al bus, aprieta botones según un guion, guarda frames en PNG y al final imprime bytes y transacciones de bus por escena.
+#
+# Uso:
+#   python3 emulator/run.py --seconds 20 --press A@4000 --press B@9000
+#   python3 emulator/run.py --frames out/ --screenshot final.png
+#   python3 emulator/run.py --script botones.txt --no-bus-timing
+#
+# El guion tiene una acción por línea: "<ms> <botón> [duración_ms]", con
+# <botón> A o B (o un número de GPIO). Las líneas con # son comentarios.
+
+import argparse
+import inspect
+import os
+import runpy
+import sys
+import threading
+import time
+import traceback
+
+EMU_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(EMU_DIR)
+
+# Escenas que se miden: (nombre, módulo, atributo)
+SCENES = (
+    ("intro", "intro_scene", "play_sequence"),
+    ("menu", "menus.main_menu", "MainMenu.run"),
+    ("hq", "hq_scene", "play_scene"),
+    ("walk", "walk_scene", "play_scene"),
+    ("uplink", "wifi_manager", "play_scene"),
+)
+
+PRESS_MS = 120  # Duración de un click si el guion no la dice
+
+
+# --- Lo que MicroPython agrega a time, sys y gc ---
+
+_TICKS_PERIOD = 1 << 30
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALF = _TICKS_PERIOD // 2
+_T0 = time.monotonic()
+
+
+def _ticks_diff(end, start):
+    return ((end - start + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+
+def install_host_shims():
+    time.sleep_ms = lambda ms: time.sleep(max(0, ms) / 1000)
+    time.sleep_us = lambda us: time.sleep(max(0, us) / 1_000_000)
+    time.ticks_ms = lambda: int((time.monotonic() - _T0) * 1000) & _TICKS_MAX
+    time.ticks_us = lambda: int((time.monotonic() - _T0) * 1_000_000) & _TICKS_MAX
+    time.ticks_cpu = time.ticks_us
+    time.ticks_add = lambda ticks, delta: (ticks + delta) & _TICKS_MAX
+    time.ticks_diff = _ticks_diff
+    sys.modules.setdefault("utime", time)
+
+    def print_exception(exc, file=None):
+        traceback.print_exception(type(exc), exc, exc.__traceback__, file=file or sys.stdout)
+    sys.print_exception = print_exception
+
+    # asyncio de MicroPython tiene variantes en ms que CPython no trae
+    import asyncio
+    if not hasattr(asyncio, "sleep_ms"):
+        asyncio.sleep_ms = lambda ms: asyncio.sleep(max(0, ms) / 1000)
+        asyncio.wait_for_ms = lambda aw, ms: asyncio.wait_for(aw, max(0, ms) / 1000)
+
+    import gc
+    if not hasattr(gc, "mem_free"):
+        gc.mem_free = lambda: 100_000
+        gc.mem_alloc = lambda: 0
+        gc.threshold = lambda *args: -1
+
+
+# --- Medición por escena ---
+
+class SceneMeter:
+    def __init__(self, panel):
+        self.panel = panel
+        self.totals = {}   # nombre -> [llamadas, ms, Counters]
+        self.current = []  # (nombre, t0, counters al entrar)
+        self.lock = threading.Lock()
+
+    def enter(self, name):
+        with self.lock:
+            self.current.append((name, time.monotonic(), self.panel.counters.copy()))
+
+    def leave(self):
+        with self.lock:
+            if not self.current:
+                return
+            name, t0, start = self.current.pop()
+            used = self.panel.counters.since(start)
+            entry = self.totals.setdefault(name, [0, 0, None])
+            entry[0] += 1
+            entry[1] += int((time.monotonic() - t0) * 1000)
+            if entry[2] is None:
+                entry[2] = used
+            else:
+                for k, v in used.__dict__.items():
+                    setattr(entry[2], k, getattr(entry[2], k) + v)
+
+    def wrap(self, name, func):
+        meter = self
+
+        if inspect.iscoroutinefunction(func):
+            # Las escenas corrutina se miden hasta que terminan, no hasta
+            # que devuelven la corrutina
+            async def async_wrapper(*args, **kwargs):
+                meter.enter(name)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    meter.leave()
+            async_wrapper.__name__ = getattr(func, "__name__", name)
+            return async_wrapper
+
+        def wrapper(*args, **kwargs):
+            meter.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                meter.leave()
+        wrapper.__name__ = getattr(func, "__name__", name)
+        return wrapper
+
+    def instrument(self):
+        import importlib
+        for name, module_name, attr in SCENES:
+            try:
+                owner = importlib.import_module(module_name)
+            except Exception as e:
+                print(f"[emu] Could not instrument {name}: {e}")
+                continue
+            path = attr.split(".")
+            for part in path[:-1]:
+                owner = getattr(owner, part)
+            func = getattr(owner, path[-1], None)
+            if func is not None:
+                setattr(owner, path[-1], self.wrap(name, func))
+
+    def report(self, boot, boot_ms):
+        # Las escenas que siguen abiertas al cortar se cuentan hasta acá
+        while self.current:
+            self.leave()
+        rows = [("boot", 1, boot_ms, boot)]
+        for name, _, _ in SCENES:
+            if name in self.totals:
+                calls, ms, used = self.totals[name]
+                rows.append((name, calls, ms, used))
+        total = self.panel.counters
+        print()
+        print(f"{'scene':<8} {'calls':>5} {'ms':>7} {'tx':>7} {'bytes':>9} {'data B':>9} "
+              f"{'writes':>7} {'B/s':>8}")
+        for name, calls, ms, c in rows:
+            rate = c.bytes * 1000 // ms if ms else 0
+            print(f"{name:<8} {calls:>5} {ms:>7} {c.transactions:>7} {c.bytes:>9} "
+                  f"{c.data_bytes:>9} {c.data_writes:>7} {rate:>8}")
+        print(f"{'total':<8} {'':>5} {'':>7} {total.transactions:>7} {total.bytes:>9} "
+              f"{total.data_bytes:>9} {total.data_writes:>7}")
+
+
+# --- Botones ---
+
+def parse_script(lines, buttons):
+    events = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        parts = line.replace("@", " ").replace(":", " ").split()
+        at = int(parts[0]) if parts[0].isdigit() else int(parts[1])
+        name = parts[1] if parts[0].isdigit() else parts[0]
+        rest = parts[2:]
+        duration = int(rest[0]) if rest else PRESS_MS
+        pin = buttons.get(name.upper())
+        if pin is None:
+            pin = int(name)
+        events.append((at, pin, duration))
+    events.sort()
+    return events
+
+
+def run_script(events, t0):
+    import machine
+    # Cada click es un par de cambios de nivel: apretar (0) y soltar (suelto)
+    changes = []
+    for at, pin, duration in events:
+        changes.append((at, pin, 0))
+        changes.append((at + duration, pin, None))
+    changes.sort(key=lambda c: c[0])
+    for at, pin, level in changes:
+        delay = t0 + at / 1000 - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        machine.Pin(pin).drive(level)
+
+
+# --- Frames ---
+
+class FrameDumper:
+    def __init__(self, directory, interval_ms, scale):
+        self.directory = directory
+        self.interval = interval_ms / 1000
+        self.scale = scale
+        self.last = None
+        self.last_time = 0
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, panel):
+        now = time.monotonic()
+        if now - self.last_time < self.interval:
+            return
+        image = panel.framebuffer()
+        if image == self.last:
+            return
+        self.last = image
+        self.last_time = now
+        path = os.path.join(self.directory, "frame_%05d.png" % self.count)
+        panel.save_png(path, self.scale)
+        self.count += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the NOMAD firmware headless under CPython")
+    parser.add_argument("--seconds", type=float, default=15, help="run time before stopping")
+    parser.add_argument("--press", action="append", default=[],
+                        help="button action BUTTON@MS[:DURATION_MS], e.g. A@4000 or B@9000:800")
+    parser.add_argument("--script", help="file with one '<ms> <button> [duration_ms]' per line")
+    parser.add_argument("--frames", help="directory to dump changed frames as PNG")
+    parser.add_argument("--frame-interval", type=int, default=0,
+                        help="minimum ms between dumped frames")
+    parser.add_argument("--screenshot", help="save the last frame to this PNG")
+    parser.add_argument("--scale", type=int, default=4, help="PNG pixel scale")
+    parser.add_argument("--bus", choices=("i2c", "spi"), help="override config.OLED_BUS")
+    parser.add_argument("--max-i2c-freq", type=int, default=1_000_000,
+                        help="fastest I2C clock the emulated wiring accepts")
+    parser.add_argument("--no-bus-timing", action="store_true",
+                        help="don't sleep for the simulated bus transfer time")
+    args = parser.parse_args(argv)
+
+    install_host_shims()
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, EMU_DIR)
+    os.chdir(ROOT)
+
+    import machine
+    import config
+    from panel import SSD1306Panel
+
+    if args.bus:
+        config.OLED_BUS = args.bus
+    machine.max_i2c_freq = args.max_i2c_freq
+    machine.bus_timing = not args.no_bus_timing
+
+    panel = SSD1306Panel()
+    machine.i2c_devices[config.OLED_I2C_ADDR] = panel
+    machine.spi_devices[config.SPI_ID] = (panel, config.PIN_OLED_DC, config.PIN_OLED_CS)
+
+    buttons = {"A": config.PIN_BUTTON_A, "B": config.PIN_BUTTON_B}
+    lines = list(args.press)
+    if args.script:
+        with open(args.script) as f:
+            lines.extend(f)
+    events = parse_script(lines, buttons)
+
+    if args.frames:
+        panel.listeners.append(FrameDumper(args.frames, args.frame_interval, args.scale))
+
+    meter = SceneMeter(panel)
+    meter.instrument()
+
+    def boot():
+        try:
+            runpy.run_path(os.path.join(ROOT, "main.py"), run_name="__main__")
+        except SystemExit:
+            pass
+        except BaseException as e:
+            print("[emu] Firmware stopped:")
+            sys.print_exception(e)
+
+    t0 = time.monotonic()
+    threading.Thread(target=run_script, args=(events, t0), daemon=True).start()
+    firmware = threading.Thread(target=boot, daemon=True)
+    firmware.start()
+
+    # Lo que pasa antes de la primera escena (init del panel, probe del bus)
+    boot_counters = None
+    boot_ms = 0
+    deadline = t0 + args.seconds
+    while firmware.is_alive() and time.monotonic() < deadline:
+        if boot_counters is None and meter.current:
+            boot_counters = meter.current[0][2]
+            boot_ms = int((meter.current[0][1] - t0) * 1000)
+        time.sleep(0.01)
+    if boot_counters is None:
+        boot_counters = panel.counters.copy()
+        boot_ms = int((time.monotonic() - t0) * 1000)
+
+    if args.screenshot:
+        panel.save_png(args.screenshot, args.scale)
+    meter.report(boot_counters, boot_ms)
+    music = getattr(sys.modules.get("sound_manager"), "sequencer", None)
+    if music is not None:
+        st = music.stats()
+        print(f"\nmusic: {st['notes']} notes, {st['skipped']} skipped, late avg "
+              f"{st['late_avg']:.1f} ms, dev {st['late_dev']:.1f} ms, max {st['late_max']} ms")
+    sys.stdout.flush()
+    # Los hilos del firmware (timers, flush) no terminan solos
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,11 @@
 # engine.py
 # Propósito: El "Controlador". La máquina de estados. Decide qué pasa. Contiene la lógica de: "Si está en [MEATSPACE] y pasó 1 hora, generar evento aleatorio", "Si tocó el botón en el menú, comprar Perk".
+
+ticks = 0
+
+
+def update(now_ms):
+    # Un tick de la máquina de estados. Lo llama una tarea del runtime cada
+    # config.ENGINE_TICK_MS, mientras las escenas esperan o animan.
+    global ticks
+    ticks += 1
@@ -1,4 +1,297 @@
 import framebuf
+import config
+import blitter
+from array import array
+
+# The MicroPython built-in 8x8 font (FrameBuffer.text), usable wherever a
+# font_data is taken
+FONT_8X8 = 'FONT_8X8'
+
+
+class Font:
+    """
+    Packed glyph atlas written by scripts/convert_fonts.py. widths/heights
+    are indexed by codepoint - first (width 0 = no glyph) and every MONO_HLSB
+    bitmap sits back to back in one bytearray, read through memoryview
+    slices. A whole font is a handful of heap objects instead of a tuple and
+    a bytearray per glyph.
+    """
+
+    def __init__(self, first, height, widths, heights, data):
+        self.first = first
+        self.count = len(widths)
+        self.height = height
+        self.widths = widths
+        self.heights = heights
+        self.data = memoryview(data)
+        # Offsets follow from the sizes: no need to ship them
+        self.offsets = array('H', range(self.count))
+        offset = 0
+        for i in range(self.count):
+            self.offsets[i] = offset
+            offset += ((widths[i] + 7) >> 3) * heights[i]
+
+    def index(self, code):
+        # Table index for code, or -1 if the font has no glyph for it
+        i = code - self.first
+        if 0 <= i < self.count and self.widths[i]:
+            return i
+        return -1
+
+    def bitmap(self, i):
+        size = ((self.widths[i] + 7) >> 3) * self.heights[i]
+        offset = self.offsets[i]
+        return self.data[offset:offset + size]
+
+    # Same interface as the old {code: (w, h, data)} dicts
+    def __contains__(self, code):
+        return self.index(code) >= 0
+
+    def __getitem__(self, code):
+        i = self.index(code)
+        if i < 0:
+            raise KeyError(code)
+        return self.widths[i], self.heights[i], self.bitmap(i)
+
+    def get(self, code, default=None):
+        i = self.index(code)
+        if i < 0:
+            return default
+        return self.widths[i], self.heights[i], self.bitmap(i)
+
+
+# --- Caches ---
+# fonts.draw used to build a FrameBuffer per character on every call (and two
+# inverted bytearrays per character for color=0). Glyphs are now kept ready to
+# blit, keyed by (font, codepoint, polarity), and whole strings can be
+# rasterized once into a single strip keyed by (font, polarity, text). Both
+# caches have a byte budget with LRU eviction. MicroPython dicts don't keep
+# insertion order, so recency is a use stamp per entry and eviction scans for
+# the oldest one.
+
+_FB_OVERHEAD = 32  # Approx. heap cost of a FrameBuffer object
+
+
+class _Cache:
+    def __init__(self, budget):
+        self.budget = budget
+        self.tables = {}  # id(font_data) * 2 + polarity -> {key: [value, size, stamp]}
+        self.bytes = 0
+        self.stamp = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def table(self, font_data, polarity):
+        tid = id(font_data) * 2 + polarity
+        table = self.tables.get(tid)
+        if table is None:
+            table = {}
+            self.tables[tid] = table
+        return table
+
+    def get(self, table, key):
+        self.stamp += 1
+        entry = table.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry[2] = self.stamp
+        return entry[0]
+
+    def put(self, table, key, value, size):
+        if size > self.budget:
+            return
+        self.evict(size)
+        table[key] = [value, size, self.stamp]
+        self.bytes += size
+
+    def evict(self, needed=0):
+        # Drop least recently used entries until `needed` more bytes fit
+        while self.bytes + needed > self.budget and self.bytes > 0:
+            oldest = None
+            for table in self.tables.values():
+                for key, entry in table.items():
+                    if oldest is None or entry[2] < oldest[2][2]:
+                        oldest = (table, key, entry)
+            if oldest is None:
+                break
+            table, key, entry = oldest
+            del table[key]
+            self.bytes -= entry[1]
+            self.evictions += 1
+
+    def clear(self):
+        self.tables.clear()
+        self.bytes = 0
+
+    def stats(self):
+        entries = 0
+        for table in self.tables.values():
+            entries += len(table)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': self.bytes,
+            'budget': self.budget,
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+_glyphs = _Cache(getattr(config, 'FONT_GLYPH_CACHE_BYTES', 2048))
+_strips = _Cache(getattr(config, 'FONT_TEXT_CACHE_BYTES', 1536))
+
+
+def set_glyph_cache(budget):
+    # Change the byte budget (0 disables caching) and trim to it
+    _glyphs.budget = budget
+    _glyphs.evict()
+
+
+def clear_glyph_cache():
+    _glyphs.clear()
+
+
+def glyph_cache_stats():
+    return _glyphs.stats()
+
+
+def reset_glyph_cache_stats():
+    _glyphs.reset_stats()
+
+
+def set_text_cache(budget):
+    _strips.budget = budget
+    _strips.evict()
+
+
+def clear_text_cache():
+    _strips.clear()
+
+
+def text_cache_stats():
+    return _strips.stats()
+
+
+def reset_text_cache_stats():
+    _strips.reset_stats()
+
+
+def _glyph(font_data, i, code, color):
+    # Ready-to-blit FrameBuffer for glyph index i, or None if it has no
+    # pixels. Only used for targets the blitter can't write to (plain
+    # FrameBuffers such as the HLSB text strips): there color=0 glyphs are
+    # stored inverted (text=0, background=1) and blitted with key=1, since
+    # framebuf.blit has no "clear bits" operation.
+    polarity = 0 if color == 0 else 1
+    table = _glyphs.table(font_data, polarity)
+    fb = _glyphs.get(table, code)
+    if fb is not None:
+        return fb
+    w = font_data.widths[i]
+    h = font_data.heights[i]
+    if h == 0:
+        return None
+    data = font_data.bitmap(i)
+    size = _FB_OVERHEAD
+    if polarity == 0:
+        data = bytearray(data)
+        for j in range(len(data)):
+            data[j] = ~data[j] & 0xFF
+        size += len(data)
+    fb = framebuf.FrameBuffer(data, w, h, framebuf.MONO_HLSB)
+    _glyphs.put(table, code, fb, size)
+    return fb
+
+
+def prewarm(chars, font_data=None, color=1):
+    # Rasterize a charset ahead of time (e.g. menu labels before the first
+    # frame) so the first draw doesn't pay for the allocations
+    if font_data is None:
+        font_data = FONT_REGULAR
+    for char in chars:
+        code = ord(char)
+        i = font_data.index(code)
+        if i >= 0:
+            _glyph(font_data, i, code, color)
+
+
+def measure(text, font_data=None):
+    """
+    Size in pixels (width, height) of text as draw() renders it, so callers
+    can center or right-align without hardcoding offsets.
+    """
+    if font_data is None:
+        font_data = FONT_REGULAR
+    if font_data is FONT_8X8:
+        return len(text) * 8, 8 if text else 0
+    width = 0
+    height = 0
+    widths = font_data.widths
+    heights = font_data.heights
+    for char in text:
+        i = font_data.index(ord(char))
+        if i < 0:
+            width += 4 # Same spacing draw() uses for a missing char
+            continue
+        width += widths[i] + 1
+        if heights[i] > height:
+            height = heights[i]
+    # draw() leaves a 1px gap after every glyph; the last one isn't ink
+    if width:
+        width -= 1
+    return width, height
+
+
+def text_strip(text, font_data=None, color=1):
+    """
+    The whole string rasterized once into a single MONO_HLSB FrameBuffer.
+    Returns (fb, w, h, key, buf): fb-blit with that transparency key, or
+    hand buf to the blitter. Cached per (font, color, text) within
+    FONT_TEXT_CACHE_BYTES.
+    """
+    if font_data is None:
+        font_data = FONT_REGULAR
+    polarity = 0 if color == 0 else 1
+    table = _strips.table(font_data, polarity)
+    strip = _strips.get(table, text)
+    if strip is not None:
+        return strip
+    w, h = measure(text, font_data)
+    w = max(w, 1)
+    h = max(h, 1)
+    buf = bytearray(((w + 7) >> 3) * h)
+    fb = framebuf.FrameBuffer(buf, w, h, framebuf.MONO_HLSB)
+    # Same polarity trick as the glyphs: black text lives as 0s on 1s
+    fb.fill(1 - polarity)
+    draw(fb, text, 0, 0, font_data, color)
+    strip = (fb, w, h, 1 - polarity, buf)
+    _strips.put(table, text, strip, len(buf) + _FB_OVERHEAD)
+    return strip
+
+
+def draw_text(oled, text, x, y, font_data=None, color=1):
+    # Like draw(), but blits a cached pre-rendered strip: one blit per
+    # string instead of one per character. Meant for static UI text.
+    # Black text on an SSD1306/Canvas clears the white strip's pixels with
+    # the blitter, so no inverted strip is built.
+    if color == 0 and blitter.surface(oled) is not None:
+        _, w, h, _, buf = text_strip(text, font_data, 1)
+        blitter.blit(oled, buf, w, h, x, y, blitter.CLEAR)
+        return w
+    fb, w, h, key, _ = text_strip(text, font_data, color)
+    if hasattr(oled, 'mark_dirty'):
+        oled.blit(fb, x, y, key, w=w, h=h)
+    else:
+        oled.blit(fb, x, y, key)
+    return w
 
 
 def draw(oled, text, x, y, font_data=None, color=1):
@@ -8,283 +301,249 @@ def draw(oled, text, x, y, font_data=None, color=1):
             font_data = FONT_REGULAR
         else:
             return # No font to draw
-            
+    if font_data is FONT_8X8:
+        oled.text(text, x, y, color)
+        return
+
+    # White text: 0 is transparent, so 1s are drawn.
+    # Black text (color=0, on a white box): the blitter clears the glyph's
+    # pixels straight from the atlas; other targets get an inverted glyph
+    # blitted with 1 as the transparent color.
+    key = 1 if color == 0 else 0
+    surf = blitter.surface(oled) if color == 0 else None
+    # On the SSD1306 driver blit into its FrameBuffer and flag the whole
+    # string once, instead of one open-ended dirty region per glyph
+    target = oled
+    mark_dirty = getattr(oled, 'mark_dirty', None)
+    if mark_dirty is not None:
+        target = oled.framebuf
     cursor_x = x
+    height = 0
+    widths = font_data.widths
+    heights = font_data.heights
     for char in text:
         code = ord(char)
-        if code not in font_data: 
+        i = font_data.index(code)
+        if i < 0:
             cursor_x += 4 # Default spacing for missing char
             continue
-        w, h, data = font_data[code]
-        if h > 0 and len(data) > 0:
-            # Invert data if color=0 (Black on White)
-            # But data is read-only bytes usually.
-            # We can invert at blit time? SSD1306 doesn't support key=1 for inverted blit easily
-            # without changing the buffer.
-            # Better: Create a temporary mutable bytearray if needed?
-            # Or pre-generate inverted fonts? No, waste of space.
-            # SSD1306 FrameBuffer operations:
-            # blit(fbuf, x, y, key)
-            # If key is specified, pixels matching key are transparent.
-            
-            # If we want BLACK text (color=0) on WHITE background:
-            # The font bitmap has 1s where the character is.
-            # If we blit with color=0, we want to clear pixels?
-            # FrameBuffer.blit doesn't have 'color' param, it just copies bits.
-            # It copies 1s as 1s (White).
-            
-            # To draw BLACK text, we need to use a different raster operation (XOR, OR, AND, NOT).
-            # MicroPython standard framebuf only supports simple copy with transparency key.
-            
-            # Workaround for BLACK text (color=0):
-            # We need to invert the source bytes before blitting?
-            # Or draw a white box and then XOR? framebuf doesn't do XOR easily.
-            
-            # BUT: We are drawing on a white background (already filled).
-            # So we need to clear pixels where the font has 1s.
-            # This means we need 0s where font has 1s.
-            # Since we can't change the operation mode of blit, we have to invert the buffer manually.
-            
-            if color == 0:
-                # Invert bytes on the fly
-                inv_data = bytearray([~b & 0xFF for b in data])
-                fb = framebuf.FrameBuffer(inv_data, w, h, framebuf.MONO_HLSB)
-                # We want to draw '0's (Black) where text is.
-                # But blit copies 1s.
-                # If we have inverted data, we have 1s where background is.
-                # If we blit that, we draw white background and keep holes?
-                # No, that overwrites background.
-                
-                # Wait, SSD1306 driver usually maps 1->On, 0->Off.
-                # If background is White (1), we want to set pixels to 0.
-                # There is no "clear bits" blit in standard MicroPython framebuf.
-                
-                # SLOW BUT WORKING FALLBACK for color=0:
-                # Iterate pixels? No too slow.
-                
-                # TRICK: Use 'key' for transparency.
-                # If we invert the image:
-                # Original: Text=1, Bg=0.
-                # Inverted: Text=0, Bg=1.
-                # If we blit Inverted with key=1 (White is transparent):
-                # We copy only the 0s? No, key makes the MATCHING color transparent.
-                # So if key=1, 1s are skipped. 0s are copied.
-                # 0s are Black.
-                # So if we invert the font (Text=0, Bg=1) and blit with key=1:
-                # The Bg (1) is transparent.
-                # The Text (0) is copied (as Black).
-                # THIS IS THE WAY!
-                
-                # Let's implement this trick.
-                inv_data = bytearray([~b & 0xFF for b in data])
-                fb = framebuf.FrameBuffer(inv_data, w, h, framebuf.MONO_HLSB)
-                oled.blit(fb, cursor_x, y, 1) # 1 is transparent, so 0s (Black Text) are drawn.
-                
-            else:
-                # Normal White text
-                fb = framebuf.FrameBuffer(data, w, h, framebuf.MONO_HLSB)
-                oled.blit(fb, cursor_x, y, 0) # 0 is transparent, so 1s (White Text) are drawn.
-                
-        cursor_x += w + 1
-
+        h = heights[i]
+        if surf is not None:
+            if h:
+                blitter.blit_buffer(surf[0], surf[1], surf[2], font_data.data, widths[i], h,
+                                    cursor_x, y, blitter.CLEAR, False, font_data.offsets[i])
+        else:
+            fb = _glyph(font_data, i, code, color)
+            if fb is not None:
+                target.blit(fb, cursor_x, y, key)
+        if h > height:
+            height = h
+        cursor_x += widths[i] + 1
+    if mark_dirty is not None and height:
+        mark_dirty(x, y, cursor_x - x, height)
 
 # --- Font: FONT_BOLD (size: 13px, height: 15px) ---
 # Source: helvb08.ttf
 FONT_BOLD_HEIGHT = 15
-FONT_BOLD = {}
-FONT_BOLD[32] = (3, 0, bytearray(b''))
-FONT_BOLD[33] = (3, 15, bytearray(b'\x00\xe0\xe0\xe0\xe0\xe0\x80\x80\x80\x00\x00\xe0\x00\x00\x00'))
-FONT_BOLD[34] = (4, 15, bytearray(b'\x00\x90\x90\x90\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[35] = (9, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x14\x00\x14\x00\x7f\x80\x14\x00\x14\x00\xff\x00\x48\x00\x48\x00\x48\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[36] = (6, 15, bytearray(b'\x10\x78\x10\x94\xf0\x70\x18\x1c\x14\x14\x94\x78\x10\x00\x00'))
-FONT_BOLD[37] = (9, 15, bytearray(b'\x00\x00\x70\x80\x10\x00\x99\x00\x74\x00\x00\x00\x08\x00\x08\x00\x17\x00\x01\x00\x49\x80\x87\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[38] = (9, 15, bytearray(b'\x00\x00\x78\x00\x68\x00\xee\x00\xee\x00\x78\x00\x68\x00\xef\x80\xe7\x00\xef\x00\xef\x00\x79\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[39] = (2, 15, bytearray(b'\x00\x80\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[40] = (4, 15, bytearray(b'\x00\x10\x10\x20\x20\x20\xe0\xe0\xe0\xe0\xe0\x20\x20\x10\x10'))
-FONT_BOLD[41] = (4, 15, bytearray(b'\x00\x80\x80\x40\x40\x40\x70\x70\x70\x70\x70\x40\x40\x80\x80'))
-FONT_BOLD[42] = (3, 15, bytearray(b'\x00\xa0\x00\x40\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[43] = (8, 15, bytearray(b'\x00\x00\x00\x00\x38\x38\xff\x38\x38\x38\x00\x00\x00\x00\x00'))
-FONT_BOLD[44] = (2, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\x40\x40\x80'))
-FONT_BOLD[45] = (5, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[46] = (3, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[47] = (5, 15, bytearray(b'\x00\x08\x08\x00\x10\x10\x00\x40\x40\x00\x80\x80\x00\x00\x00'))
-FONT_BOLD[48] = (7, 15, bytearray(b'\x00\x3c\x2c\xee\xee\xee\xee\xee\xee\xee\xee\x3c\x00\x00\x00'))
-FONT_BOLD[49] = (3, 15, bytearray(b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[50] = (7, 15, bytearray(b'\x00\x78\x68\xee\x0e\x0e\x0e\x18\x70\xe0\xe0\xfe\x00\x00\x00'))
-FONT_BOLD[51] = (7, 15, bytearray(b'\x00\x78\x68\xee\x0e\x18\x08\x0e\x0e\x0e\xee\x78\x00\x00\x00'))
-FONT_BOLD[52] = (8, 15, bytearray(b'\x00\x02\x02\x0e\x3e\x4e\x8e\x8e\xff\x0e\x0e\x0e\x00\x00\x00'))
-FONT_BOLD[53] = (7, 15, bytearray(b'\x00\xfe\xe0\xe0\xe0\xf8\x0e\x0e\x8e\xee\x68\x78\x00\x00\x00'))
-FONT_BOLD[54] = (7, 15, bytearray(b'\x00\x3c\x2c\xee\xe0\xfc\xec\xee\xee\xee\xee\x3c\x00\x00\x00'))
-FONT_BOLD[55] = (5, 15, bytearray(b'\x00\xf8\x18\x18\x18\x70\x70\x70\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[56] = (7, 15, bytearray(b'\x00\x3c\x2c\xee\xee\x3c\x2c\xee\xee\xee\xee\x3c\x00\x00\x00'))
-FONT_BOLD[57] = (6, 15, bytearray(b'\x00\x78\x68\xec\xec\xec\xec\x7c\x04\x04\xec\x78\x00\x00\x00'))
-FONT_BOLD[58] = (3, 15, bytearray(b'\x00\x00\x00\x00\xe0\xe0\x00\x00\x00\x00\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[59] = (2, 15, bytearray(b'\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\xc0\xc0\x40\x40\x80'))
-FONT_BOLD[60] = (5, 15, bytearray(b'\x00\x00\x00\x00\x18\x70\x70\xe0\x70\x18\x00\x00\x00\x00\x00'))
-FONT_BOLD[61] = (7, 15, bytearray(b'\x00\x00\x00\x00\x00\xfe\x00\x00\xfe\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[62] = (5, 15, bytearray(b'\x00\x00\x00\x00\xe0\x70\x70\x18\x70\xe0\x00\x00\x00\x00\x00'))
-FONT_BOLD[63] = (7, 15, bytearray(b'\x00\x78\x68\xee\x0e\x18\x18\x70\x70\x00\x00\x70\x00\x00\x00'))
-FONT_BOLD[64] = (13, 15, bytearray(b'\x0f\xc0\x70\x10\x40\x00\x47\x48\x88\x88\x80\x88\x90\x00\x91\x10\x8e\xc0\x00\x00\x40\x00\x1f\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[65] = (9, 15, bytearray(b'\x00\x00\x1e\x00\x1e\x00\x16\x00\x77\x00\x77\x00\x77\x00\x7f\x00\xe1\x80\xe1\x80\xe1\x80\xe1\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[66] = (8, 15, bytearray(b'\x00\xfe\xe6\xe7\xe7\xfe\xe6\xe7\xe7\xe7\xe7\xfe\x00\x00\x00'))
-FONT_BOLD[67] = (9, 15, bytearray(b'\x00\x00\x1f\x00\x11\x00\x71\x80\xe0\x80\xe0\x00\xe0\x00\xe0\x00\xe0\x80\x71\x80\x11\x00\x1f\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[68] = (8, 15, bytearray(b'\x00\xf8\xe8\xee\xe7\xe7\xe7\xe7\xe7\xee\xee\xf8\x00\x00\x00'))
-FONT_BOLD[69] = (7, 15, bytearray(b'\x00\xfe\xe0\xe0\xe0\xfe\xe0\xe0\xe0\xe0\xe0\xfe\x00\x00\x00'))
-FONT_BOLD[70] = (7, 15, bytearray(b'\x00\xfe\xe0\xe0\xe0\xfc\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[71] = (9, 15, bytearray(b'\x00\x00\x1f\x00\x11\x00\x71\x80\xe0\x80\xe0\x00\xe0\x00\xe7\x80\xe3\x80\x73\x80\x73\x80\x1e\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[72] = (8, 15, bytearray(b'\x00\xe7\xe7\xe7\xe7\xff\xe7\xe7\xe7\xe7\xe7\xe7\x00\x00\x00'))
-FONT_BOLD[73] = (3, 15, bytearray(b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[74] = (7, 15, bytearray(b'\x00\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\xee\x2c\x3c\x00\x00\x00'))
-FONT_BOLD[75] = (9, 15, bytearray(b'\x00\x00\xe7\x00\xe6\x00\xee\x00\xf8\x00\xf0\x00\xf0\x00\xf8\x00\xee\x00\xe7\x00\xe1\x00\xe1\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[76] = (7, 15, bytearray(b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xfe\x00\x00\x00'))
-FONT_BOLD[77] = (11, 15, bytearray(b'\x00\x00\xe0\x60\xe0\x60\xf1\xe0\xf1\xe0\xf9\xe0\xf9\xe0\xea\x60\xee\x60\xe4\x60\xe4\x60\xe4\x60\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[78] = (9, 15, bytearray(b'\x00\x00\xe3\x80\xe3\x80\xf3\x80\xf3\x80\xe3\x80\xeb\x80\xeb\x80\xe7\x80\xe7\x80\xe3\x80\xe3\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[79] = (9, 15, bytearray(b'\x00\x00\x1e\x00\x16\x00\x77\x00\xe1\x80\xe1\x80\xe1\x80\xe1\x80\xe1\x80\x77\x00\x77\x00\x1e\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[80] = (8, 15, bytearray(b'\x00\xfe\xe6\xe7\xe7\xe7\xe7\xfe\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[81] = (9, 15, bytearray(b'\x00\x00\x1e\x00\x16\x00\x77\x00\xe1\x80\xe1\x80\xe1\x80\xe1\x80\xe9\x80\x77\x00\x77\x00\x1f\x00\x00\x80\x00\x00\x00\x00'))
-FONT_BOLD[82] = (8, 15, bytearray(b'\x00\xf8\xe0\xe7\xe7\xe7\xe7\xfe\xe7\xe7\xe7\xe7\x00\x00\x00'))
-FONT_BOLD[83] = (8, 15, bytearray(b'\x00\x7c\x64\xe7\xf0\x70\x0f\x0f\x87\xe7\x64\x7c\x00\x00\x00'))
-FONT_BOLD[84] = (8, 15, bytearray(b'\x00\xff\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x00\x00\x00'))
-FONT_BOLD[85] = (8, 15, bytearray(b'\x00\xe7\xe7\xe7\xe7\xe7\xe7\xe7\xe7\xe7\x64\x7c\x00\x00\x00'))
-FONT_BOLD[86] = (9, 15, bytearray(b'\x00\x00\xe1\x80\xe1\x80\x61\x00\x77\x00\x77\x00\x77\x00\x77\x00\x1e\x00\x1e\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[87] = (13, 15, bytearray(b'\x00\x00\xe7\x18\xe7\x18\xe7\x18\xe7\x18\x77\x70\x77\x70\x77\x70\x7f\xf0\x18\xe0\x18\xe0\x18\xe0\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[88] = (9, 15, bytearray(b'\x00\x00\xe1\x80\xe1\x80\x61\x00\x77\x00\x16\x00\x1e\x00\x1e\x00\x77\x00\x61\x00\xe1\x80\xe1\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[89] = (11, 15, bytearray(b'\x00\x00\xe0\xe0\xe0\xe0\x60\x80\x71\x80\x71\x80\x71\x80\x1f\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[90] = (8, 15, bytearray(b'\x00\xff\x07\x07\x0e\x18\x18\x78\x70\xe0\xe0\xff\x00\x00\x00'))
-FONT_BOLD[91] = (4, 15, bytearray(b'\x00\xf0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xf0'))
-FONT_BOLD[92] = (5, 15, bytearray(b'\x00\x80\x80\x00\x40\x40\x00\x10\x10\x00\x08\x08\x00\x00\x00'))
-FONT_BOLD[93] = (3, 15, bytearray(b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0'))
-FONT_BOLD[94] = (5, 15, bytearray(b'\x00\x00\x70\xf8\x88\x88\x88\x00\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[95] = (8, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00'))
-FONT_BOLD[96] = (9, 15, bytearray(b'\x00\x00\xff\x80\x80\x80\xc3\x80\xa4\x80\x98\x80\x98\x80\x98\x80\xa4\x80\xc2\x80\xc1\x80\xff\x80\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[97] = (8, 15, bytearray(b'\x00\x00\x00\x00\x78\x8e\x0e\x7e\xee\xee\x66\x77\x00\x00\x00'))
-FONT_BOLD[98] = (7, 15, bytearray(b'\x00\xe0\xe0\xe0\xfc\xee\xee\xee\xee\xee\xec\xfc\x00\x00\x00'))
-FONT_BOLD[99] = (5, 15, bytearray(b'\x00\x00\x00\x00\x78\xe8\xe0\xe0\xe0\xe8\x68\x78\x00\x00\x00'))
-FONT_BOLD[100] = (7, 15, bytearray(b'\x00\x0e\x0e\x0e\x7e\xee\xee\xee\xee\xee\x6e\x7e\x00\x00\x00'))
-FONT_BOLD[101] = (7, 15, bytearray(b'\x00\x00\x00\x00\x3c\x2c\xee\xfe\xe0\xe0\xee\x3c\x00\x00\x00'))
-FONT_BOLD[102] = (6, 15, bytearray(b'\x00\x3c\x20\xe0\xf8\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[103] = (6, 15, bytearray(b'\x00\x00\x00\x00\x74\x64\xec\xec\xec\xec\xec\x7c\x0c\x08\x78'))
-FONT_BOLD[104] = (7, 15, bytearray(b'\x00\xe0\xe0\xe0\xfc\xec\xee\xee\xee\xee\xee\xee\x00\x00\x00'))
-FONT_BOLD[105] = (3, 15, bytearray(b'\x00\xe0\x00\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[106] = (4, 15, bytearray(b'\x00\x70\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x60\xe0'))
-FONT_BOLD[107] = (8, 15, bytearray(b'\x00\xe0\xe0\xe0\xee\xf8\xf8\xf0\xf8\xee\xe6\xe7\x00\x00\x00'))
-FONT_BOLD[108] = (3, 15, bytearray(b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[109] = (11, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x99\x80\x88\x80\xee\xe0\xee\xe0\xee\xe0\xee\xe0\xee\xe0\xee\xe0\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[110] = (7, 15, bytearray(b'\x00\x00\x00\x00\x98\x88\xee\xee\xee\xee\xee\xee\x00\x00\x00'))
-FONT_BOLD[111] = (7, 15, bytearray(b'\x00\x00\x00\x00\x3c\xee\xee\xee\xee\xee\x2c\x3c\x00\x00\x00'))
-FONT_BOLD[112] = (7, 15, bytearray(b'\x00\x00\x00\x00\x98\x88\xee\xee\xee\xee\xee\xf8\xe0\xe0\xe0'))
-FONT_BOLD[113] = (6, 15, bytearray(b'\x00\x00\x00\x00\x74\x64\xec\xec\xec\xec\xec\x7c\x0c\x0c\x0c'))
-FONT_BOLD[114] = (5, 15, bytearray(b'\x00\x00\x00\x00\x98\x90\xf0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'))
-FONT_BOLD[115] = (7, 15, bytearray(b'\x00\x00\x00\x00\x3c\xee\x2c\x3c\x0c\x0e\xee\x3c\x00\x00\x00'))
-FONT_BOLD[116] = (5, 15, bytearray(b'\x00\x70\x70\x70\xf8\x70\x70\x70\x70\x70\x30\x38\x00\x00\x00'))
-FONT_BOLD[117] = (6, 15, bytearray(b'\x00\x00\x00\x00\xec\xec\xec\xec\xec\xec\x64\x74\x00\x00\x00'))
-FONT_BOLD[118] = (7, 15, bytearray(b'\x00\x00\x00\x00\xe6\xe6\xe6\xe6\x24\x24\x3c\x10\x00\x00\x00'))
-FONT_BOLD[119] = (9, 15, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\xeb\x80\xeb\x80\xeb\x80\xeb\x80\x77\x00\x77\x00\x77\x00\x77\x00\x00\x00\x00\x00\x00\x00'))
-FONT_BOLD[120] = (8, 15, bytearray(b'\x00\x00\x00\x00\xe7\x7c\x7c\x18\x7c\x64\xe7\xe7\x00\x00\x00'))
-FONT_BOLD[121] = (7, 15, bytearray(b'\x00\x00\x00\x00\xee\xee\xee\xee\xee\x7e\x18\x18\x18\x18\x70'))
-FONT_BOLD[122] = (7, 15, bytearray(b'\x00\x00\x00\x00\xfe\x0e\x0e\x18\x70\xe0\xe0\xfe\x00\x00\x00'))
-FONT_BOLD[123] = (5, 15, bytearray(b'\x00\x18\x10\x70\x70\x70\x70\xe0\x70\x70\x70\x70\x70\x10\x18'))
-FONT_BOLD[124] = (1, 15, bytearray(b'\x00\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'))
-FONT_BOLD[125] = (5, 15, bytearray(b'\x00\xe0\x60\x70\x70\x70\x70\x18\x70\x70\x70\x70\x70\x60\xe0'))
-FONT_BOLD[126] = (6, 15, bytearray(b'\x00\x00\x00\x00\x00\x74\x30\xb8\x00\x00\x00\x00\x00\x00\x00'))
+FONT_BOLD = Font(32, FONT_BOLD_HEIGHT,
+    b'\x03\x03\x04\x09\x06\x09\x09\x02\x04\x04\x03\x08\x02\x05\x03\x05\x07\x03\x07\x07\x08\x07\x07\x05\x07\x06\x03\x02\x05\x07\x05\x07\x0d\x09\x08\x09\x08\x07\x07\x09\x08\x03\x07\x09\x07\x0b\x09\x09\x08\x09\x08\x08\x08\x08\x09\x0d\x09\x0b\x08\x04\x05\x03\x05\x08\x09\x08\x07\x05\x07\x07\x06\x06\x07\x03\x04\x08\x03\x0b\x07\x07\x07\x06\x05\x07\x05\x06\x07\x09\x08\x07\x07\x05\x01\x05\x06',
+    b'\x00\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f',
+    bytearray(
+        b'\x00\xe0\xe0\xe0\xe0\xe0\x80\x80\x80\x00\x00\xe0\x00\x00\x00'  # '!'
+        b'\x00\x90\x90\x90\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # '"'
+        b'\x00\x00\x00\x00\x00\x00\x14\x00\x14\x00\x7f\x80\x14\x00\x14\x00\xff\x00\x48\x00\x48\x00\x48\x00\x00\x00\x00\x00\x00\x00'  # '#'
+        b'\x10\x78\x10\x94\xf0\x70\x18\x1c\x14\x14\x94\x78\x10\x00\x00'  # '$'
+        b'\x00\x00\x70\x80\x10\x00\x99\x00\x74\x00\x00\x00\x08\x00\x08\x00\x17\x00\x01\x00\x49\x80\x87\x00\x00\x00\x00\x00\x00\x00'  # '%'
+        b'\x00\x00\x78\x00\x68\x00\xee\x00\xee\x00\x78\x00\x68\x00\xef\x80\xe7\x00\xef\x00\xef\x00\x79\x80\x00\x00\x00\x00\x00\x00'  # '&'
+        b'\x00\x80\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # "'"
+        b'\x00\x10\x10\x20\x20\x20\xe0\xe0\xe0\xe0\xe0\x20\x20\x10\x10'  # '('
+        b'\x00\x80\x80\x40\x40\x40\x70\x70\x70\x70\x70\x40\x40\x80\x80'  # ')'
+        b'\x00\xa0\x00\x40\xa0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # '*'
+        b'\x00\x00\x00\x00\x38\x38\xff\x38\x38\x38\x00\x00\x00\x00\x00'  # '+'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\x40\x40\x80'  # ','
+        b'\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x00\x00'  # '-'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0\x00\x00\x00'  # '.'
+        b'\x00\x08\x08\x00\x10\x10\x00\x40\x40\x00\x80\x80\x00\x00\x00'  # '/'
+        b'\x00\x3c\x2c\xee\xee\xee\xee\xee\xee\xee\xee\x3c\x00\x00\x00'  # '0'
+        b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # '1'
+        b'\x00\x78\x68\xee\x0e\x0e\x0e\x18\x70\xe0\xe0\xfe\x00\x00\x00'  # '2'
+        b'\x00\x78\x68\xee\x0e\x18\x08\x0e\x0e\x0e\xee\x78\x00\x00\x00'  # '3'
+        b'\x00\x02\x02\x0e\x3e\x4e\x8e\x8e\xff\x0e\x0e\x0e\x00\x00\x00'  # '4'
+        b'\x00\xfe\xe0\xe0\xe0\xf8\x0e\x0e\x8e\xee\x68\x78\x00\x00\x00'  # '5'
+        b'\x00\x3c\x2c\xee\xe0\xfc\xec\xee\xee\xee\xee\x3c\x00\x00\x00'  # '6'
+        b'\x00\xf8\x18\x18\x18\x70\x70\x70\xe0\xe0\xe0\xe0\x00\x00\x00'  # '7'
+        b'\x00\x3c\x2c\xee\xee\x3c\x2c\xee\xee\xee\xee\x3c\x00\x00\x00'  # '8'
+        b'\x00\x78\x68\xec\xec\xec\xec\x7c\x04\x04\xec\x78\x00\x00\x00'  # '9'
+        b'\x00\x00\x00\x00\xe0\xe0\x00\x00\x00\x00\xe0\xe0\x00\x00\x00'  # ':'
+        b'\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\xc0\xc0\x40\x40\x80'  # ';'
+        b'\x00\x00\x00\x00\x18\x70\x70\xe0\x70\x18\x00\x00\x00\x00\x00'  # '<'
+        b'\x00\x00\x00\x00\x00\xfe\x00\x00\xfe\x00\x00\x00\x00\x00\x00'  # '='
+        b'\x00\x00\x00\x00\xe0\x70\x70\x18\x70\xe0\x00\x00\x00\x00\x00'  # '>'
+        b'\x00\x78\x68\xee\x0e\x18\x18\x70\x70\x00\x00\x70\x00\x00\x00'  # '?'
+        b'\x0f\xc0\x70\x10\x40\x00\x47\x48\x88\x88\x80\x88\x90\x00\x91\x10\x8e\xc0\x00\x00\x40\x00\x1f\x80\x00\x00\x00\x00\x00\x00'  # '@'
+        b'\x00\x00\x1e\x00\x1e\x00\x16\x00\x77\x00\x77\x00\x77\x00\x7f\x00\xe1\x80\xe1\x80\xe1\x80\xe1\x80\x00\x00\x00\x00\x00\x00'  # 'A'
+        b'\x00\xfe\xe6\xe7\xe7\xfe\xe6\xe7\xe7\xe7\xe7\xfe\x00\x00\x00'  # 'B'
+        b'\x00\x00\x1f\x00\x11\x00\x71\x80\xe0\x80\xe0\x00\xe0\x00\xe0\x00\xe0\x80\x71\x80\x11\x00\x1f\x00\x00\x00\x00\x00\x00\x00'  # 'C'
+        b'\x00\xf8\xe8\xee\xe7\xe7\xe7\xe7\xe7\xee\xee\xf8\x00\x00\x00'  # 'D'
+        b'\x00\xfe\xe0\xe0\xe0\xfe\xe0\xe0\xe0\xe0\xe0\xfe\x00\x00\x00'  # 'E'
+        b'\x00\xfe\xe0\xe0\xe0\xfc\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'F'
+        b'\x00\x00\x1f\x00\x11\x00\x71\x80\xe0\x80\xe0\x00\xe0\x00\xe7\x80\xe3\x80\x73\x80\x73\x80\x1e\x80\x00\x00\x00\x00\x00\x00'  # 'G'
+        b'\x00\xe7\xe7\xe7\xe7\xff\xe7\xe7\xe7\xe7\xe7\xe7\x00\x00\x00'  # 'H'
+        b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'I'
+        b'\x00\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\xee\x2c\x3c\x00\x00\x00'  # 'J'
+        b'\x00\x00\xe7\x00\xe6\x00\xee\x00\xf8\x00\xf0\x00\xf0\x00\xf8\x00\xee\x00\xe7\x00\xe1\x00\xe1\x80\x00\x00\x00\x00\x00\x00'  # 'K'
+        b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xfe\x00\x00\x00'  # 'L'
+        b'\x00\x00\xe0\x60\xe0\x60\xf1\xe0\xf1\xe0\xf9\xe0\xf9\xe0\xea\x60\xee\x60\xe4\x60\xe4\x60\xe4\x60\x00\x00\x00\x00\x00\x00'  # 'M'
+        b'\x00\x00\xe3\x80\xe3\x80\xf3\x80\xf3\x80\xe3\x80\xeb\x80\xeb\x80\xe7\x80\xe7\x80\xe3\x80\xe3\x80\x00\x00\x00\x00\x00\x00'  # 'N'
+        b'\x00\x00\x1e\x00\x16\x00\x77\x00\xe1\x80\xe1\x80\xe1\x80\xe1\x80\xe1\x80\x77\x00\x77\x00\x1e\x00\x00\x00\x00\x00\x00\x00'  # 'O'
+        b'\x00\xfe\xe6\xe7\xe7\xe7\xe7\xfe\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'P'
+        b'\x00\x00\x1e\x00\x16\x00\x77\x00\xe1\x80\xe1\x80\xe1\x80\xe1\x80\xe9\x80\x77\x00\x77\x00\x1f\x00\x00\x80\x00\x00\x00\x00'  # 'Q'
+        b'\x00\xf8\xe0\xe7\xe7\xe7\xe7\xfe\xe7\xe7\xe7\xe7\x00\x00\x00'  # 'R'
+        b'\x00\x7c\x64\xe7\xf0\x70\x0f\x0f\x87\xe7\x64\x7c\x00\x00\x00'  # 'S'
+        b'\x00\xff\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x00\x00\x00'  # 'T'
+        b'\x00\xe7\xe7\xe7\xe7\xe7\xe7\xe7\xe7\xe7\x64\x7c\x00\x00\x00'  # 'U'
+        b'\x00\x00\xe1\x80\xe1\x80\x61\x00\x77\x00\x77\x00\x77\x00\x77\x00\x1e\x00\x1e\x00\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00'  # 'V'
+        b'\x00\x00\xe7\x18\xe7\x18\xe7\x18\xe7\x18\x77\x70\x77\x70\x77\x70\x7f\xf0\x18\xe0\x18\xe0\x18\xe0\x00\x00\x00\x00\x00\x00'  # 'W'
+        b'\x00\x00\xe1\x80\xe1\x80\x61\x00\x77\x00\x16\x00\x1e\x00\x1e\x00\x77\x00\x61\x00\xe1\x80\xe1\x80\x00\x00\x00\x00\x00\x00'  # 'X'
+        b'\x00\x00\xe0\xe0\xe0\xe0\x60\x80\x71\x80\x71\x80\x71\x80\x1f\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x00\x00\x00\x00\x00\x00'  # 'Y'
+        b'\x00\xff\x07\x07\x0e\x18\x18\x78\x70\xe0\xe0\xff\x00\x00\x00'  # 'Z'
+        b'\x00\xf0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xf0'  # '['
+        b'\x00\x80\x80\x00\x40\x40\x00\x10\x10\x00\x08\x08\x00\x00\x00'  # '\\'
+        b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0'  # ']'
+        b'\x00\x00\x70\xf8\x88\x88\x88\x00\x00\x00\x00\x00\x00\x00\x00'  # '^'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00'  # '_'
+        b'\x00\x00\xff\x80\x80\x80\xc3\x80\xa4\x80\x98\x80\x98\x80\x98\x80\xa4\x80\xc2\x80\xc1\x80\xff\x80\x00\x00\x00\x00\x00\x00'  # '`'
+        b'\x00\x00\x00\x00\x78\x8e\x0e\x7e\xee\xee\x66\x77\x00\x00\x00'  # 'a'
+        b'\x00\xe0\xe0\xe0\xfc\xee\xee\xee\xee\xee\xec\xfc\x00\x00\x00'  # 'b'
+        b'\x00\x00\x00\x00\x78\xe8\xe0\xe0\xe0\xe8\x68\x78\x00\x00\x00'  # 'c'
+        b'\x00\x0e\x0e\x0e\x7e\xee\xee\xee\xee\xee\x6e\x7e\x00\x00\x00'  # 'd'
+        b'\x00\x00\x00\x00\x3c\x2c\xee\xfe\xe0\xe0\xee\x3c\x00\x00\x00'  # 'e'
+        b'\x00\x3c\x20\xe0\xf8\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'f'
+        b'\x00\x00\x00\x00\x74\x64\xec\xec\xec\xec\xec\x7c\x0c\x08\x78'  # 'g'
+        b'\x00\xe0\xe0\xe0\xfc\xec\xee\xee\xee\xee\xee\xee\x00\x00\x00'  # 'h'
+        b'\x00\xe0\x00\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'i'
+        b'\x00\x70\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x60\xe0'  # 'j'
+        b'\x00\xe0\xe0\xe0\xee\xf8\xf8\xf0\xf8\xee\xe6\xe7\x00\x00\x00'  # 'k'
+        b'\x00\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'l'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x99\x80\x88\x80\xee\xe0\xee\xe0\xee\xe0\xee\xe0\xee\xe0\xee\xe0\x00\x00\x00\x00\x00\x00'  # 'm'
+        b'\x00\x00\x00\x00\x98\x88\xee\xee\xee\xee\xee\xee\x00\x00\x00'  # 'n'
+        b'\x00\x00\x00\x00\x3c\xee\xee\xee\xee\xee\x2c\x3c\x00\x00\x00'  # 'o'
+        b'\x00\x00\x00\x00\x98\x88\xee\xee\xee\xee\xee\xf8\xe0\xe0\xe0'  # 'p'
+        b'\x00\x00\x00\x00\x74\x64\xec\xec\xec\xec\xec\x7c\x0c\x0c\x0c'  # 'q'
+        b'\x00\x00\x00\x00\x98\x90\xf0\xe0\xe0\xe0\xe0\xe0\x00\x00\x00'  # 'r'
+        b'\x00\x00\x00\x00\x3c\xee\x2c\x3c\x0c\x0e\xee\x3c\x00\x00\x00'  # 's'
+        b'\x00\x70\x70\x70\xf8\x70\x70\x70\x70\x70\x30\x38\x00\x00\x00'  # 't'
+        b'\x00\x00\x00\x00\xec\xec\xec\xec\xec\xec\x64\x74\x00\x00\x00'  # 'u'
+        b'\x00\x00\x00\x00\xe6\xe6\xe6\xe6\x24\x24\x3c\x10\x00\x00\x00'  # 'v'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\xeb\x80\xeb\x80\xeb\x80\xeb\x80\x77\x00\x77\x00\x77\x00\x77\x00\x00\x00\x00\x00\x00\x00'  # 'w'
+        b'\x00\x00\x00\x00\xe7\x7c\x7c\x18\x7c\x64\xe7\xe7\x00\x00\x00'  # 'x'
+        b'\x00\x00\x00\x00\xee\xee\xee\xee\xee\x7e\x18\x18\x18\x18\x70'  # 'y'
+        b'\x00\x00\x00\x00\xfe\x0e\x0e\x18\x70\xe0\xe0\xfe\x00\x00\x00'  # 'z'
+        b'\x00\x18\x10\x70\x70\x70\x70\xe0\x70\x70\x70\x70\x70\x10\x18'  # '{'
+        b'\x00\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'  # '|'
+        b'\x00\xe0\x60\x70\x70\x70\x70\x18\x70\x70\x70\x70\x70\x60\xe0'  # '}'
+        b'\x00\x00\x00\x00\x00\x74\x30\xb8\x00\x00\x00\x00\x00\x00\x00'  # '~'
+    ))
 
 # --- Font: FONT_REGULAR (16px) ---
 # Source: haxrcorp-4089.ttf
 FONT_REGULAR_HEIGHT = 11
-FONT_REGULAR = {}
-FONT_REGULAR[32] = (3, 0, bytearray(b''))
-FONT_REGULAR[33] = (1, 11, bytearray(b'\x00\x00\x80\x80\x80\x80\x80\x00\x80\x00\x00'))
-FONT_REGULAR[34] = (3, 11, bytearray(b'\x00\x00\xa0\xa0\xa0\x00\x00\x00\x00\x00\x00'))
-FONT_REGULAR[35] = (5, 11, bytearray(b'\x00\x00\x00\x50\xf8\x50\xf8\x50\x00\x00\x00'))
-FONT_REGULAR[36] = (5, 11, bytearray(b'\x00\x20\x70\xa8\xa0\x70\x28\xa8\x70\x20\x00'))
-FONT_REGULAR[37] = (7, 11, bytearray(b'\x00\x00\x42\xa4\x48\x10\x24\x4a\x84\x00\x00'))
-FONT_REGULAR[38] = (6, 11, bytearray(b'\x00\x00\x60\x90\x90\x64\x94\x88\x74\x00\x00'))
-FONT_REGULAR[39] = (1, 11, bytearray(b'\x00\x00\x80\x80\x80\x00\x00\x00\x00\x00\x00'))
-FONT_REGULAR[40] = (3, 11, bytearray(b'\x00\x20\x40\x80\x80\x80\x80\x80\x40\x20\x00'))
-FONT_REGULAR[41] = (3, 11, bytearray(b'\x00\x80\x40\x20\x20\x20\x20\x20\x40\x80\x00'))
-FONT_REGULAR[42] = (5, 11, bytearray(b'\x00\x00\x20\xa8\x70\xa8\x20\x00\x00\x00\x00'))
-FONT_REGULAR[43] = (5, 11, bytearray(b'\x00\x00\x00\x20\x20\xf8\x20\x20\x00\x00\x00'))
-FONT_REGULAR[44] = (2, 11, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x40\x40\x80\x00'))
-FONT_REGULAR[45] = (5, 11, bytearray(b'\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00'))
-FONT_REGULAR[46] = (1, 11, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00'))
-FONT_REGULAR[47] = (7, 11, bytearray(b'\x00\x00\x02\x04\x08\x10\x20\x40\x80\x00\x00'))
-FONT_REGULAR[48] = (5, 11, bytearray(b'\x00\x00\x70\x88\x98\xa8\xc8\x88\x70\x00\x00'))
-FONT_REGULAR[49] = (2, 11, bytearray(b'\x00\x00\x40\xc0\x40\x40\x40\x40\x40\x00\x00'))
-FONT_REGULAR[50] = (5, 11, bytearray(b'\x00\x00\x70\x88\x08\x10\x20\x40\xf8\x00\x00'))
-FONT_REGULAR[51] = (5, 11, bytearray(b'\x00\x00\x70\x88\x08\x30\x08\x88\x70\x00\x00'))
-FONT_REGULAR[52] = (5, 11, bytearray(b'\x00\x00\x10\x30\x50\x90\xf8\x10\x10\x00\x00'))
-FONT_REGULAR[53] = (5, 11, bytearray(b'\x00\x00\xf8\x80\xf0\x08\x08\x88\x70\x00\x00'))
-FONT_REGULAR[54] = (5, 11, bytearray(b'\x00\x00\x70\x88\x80\xf0\x88\x88\x70\x00\x00'))
-FONT_REGULAR[55] = (5, 11, bytearray(b'\x00\x00\xf8\x08\x08\x10\x10\x20\x20\x00\x00'))
-FONT_REGULAR[56] = (5, 11, bytearray(b'\x00\x00\x70\x88\x88\x70\x88\x88\x70\x00\x00'))
-FONT_REGULAR[57] = (5, 11, bytearray(b'\x00\x00\x70\x88\x88\x78\x08\x88\x70\x00\x00'))
-FONT_REGULAR[58] = (1, 11, bytearray(b'\x00\x00\x00\x00\x80\x00\x00\x80\x00\x00\x00'))
-FONT_REGULAR[59] = (2, 11, bytearray(b'\x00\x00\x00\x00\x40\x00\x00\x40\x40\x80\x00'))
-FONT_REGULAR[60] = (3, 11, bytearray(b'\x00\x00\x00\x20\x40\x80\x40\x20\x00\x00\x00'))
-FONT_REGULAR[61] = (5, 11, bytearray(b'\x00\x00\x00\x00\xf8\x00\xf8\x00\x00\x00\x00'))
-FONT_REGULAR[62] = (3, 11, bytearray(b'\x00\x00\x00\x80\x40\x20\x40\x80\x00\x00\x00'))
-FONT_REGULAR[63] = (5, 11, bytearray(b'\x00\x00\x70\x88\x08\x10\x20\x00\x20\x00\x00'))
-FONT_REGULAR[64] = (8, 11, bytearray(b'\x00\x7e\x81\x9d\xa5\xa5\x9e\x80\x7e\x00\x00'))
-FONT_REGULAR[65] = (5, 11, bytearray(b'\x00\x00\x70\x88\x88\xf8\x88\x88\x88\x00\x00'))
-FONT_REGULAR[66] = (5, 11, bytearray(b'\x00\x00\xf0\x88\x88\xf0\x88\x88\xf0\x00\x00'))
-FONT_REGULAR[67] = (5, 11, bytearray(b'\x00\x00\x70\x88\x80\x80\x80\x88\x70\x00\x00'))
-FONT_REGULAR[68] = (5, 11, bytearray(b'\x00\x00\xf0\x88\x88\x88\x88\x88\xf0\x00\x00'))
-FONT_REGULAR[69] = (5, 11, bytearray(b'\x00\x00\xf8\x80\x80\xf0\x80\x80\xf8\x00\x00'))
-FONT_REGULAR[70] = (5, 11, bytearray(b'\x00\x00\xf8\x80\x80\xf0\x80\x80\x80\x00\x00'))
-FONT_REGULAR[71] = (5, 11, bytearray(b'\x00\x00\x70\x88\x80\x98\x88\x88\x70\x00\x00'))
-FONT_REGULAR[72] = (5, 11, bytearray(b'\x00\x00\x88\x88\x88\xf8\x88\x88\x88\x00\x00'))
-FONT_REGULAR[73] = (1, 11, bytearray(b'\x00\x00\x80\x80\x80\x80\x80\x80\x80\x00\x00'))
-FONT_REGULAR[74] = (5, 11, bytearray(b'\x00\x00\x08\x08\x08\x08\x08\x88\x70\x00\x00'))
-FONT_REGULAR[75] = (5, 11, bytearray(b'\x00\x00\x88\x90\xa0\xc0\xa0\x90\x88\x00\x00'))
-FONT_REGULAR[76] = (5, 11, bytearray(b'\x00\x00\x80\x80\x80\x80\x80\x80\xf8\x00\x00'))
-FONT_REGULAR[77] = (7, 11, bytearray(b'\x00\x00\x82\xc6\xaa\x92\x82\x82\x82\x00\x00'))
-FONT_REGULAR[78] = (5, 11, bytearray(b'\x00\x00\x88\x88\xc8\xa8\x98\x88\x88\x00\x00'))
-FONT_REGULAR[79] = (5, 11, bytearray(b'\x00\x00\x70\x88\x88\x88\x88\x88\x70\x00\x00'))
-FONT_REGULAR[80] = (5, 11, bytearray(b'\x00\x00\xf0\x88\x88\xf0\x80\x80\x80\x00\x00'))
-FONT_REGULAR[81] = (5, 11, bytearray(b'\x00\x00\x70\x88\x88\x88\x88\x88\x70\x08\x00'))
-FONT_REGULAR[82] = (5, 11, bytearray(b'\x00\x00\xf0\x88\x88\xf0\xa0\x90\x88\x00\x00'))
-FONT_REGULAR[83] = (5, 11, bytearray(b'\x00\x00\x70\x88\x80\x70\x08\x88\x70\x00\x00'))
-FONT_REGULAR[84] = (5, 11, bytearray(b'\x00\x00\xf8\x20\x20\x20\x20\x20\x20\x00\x00'))
-FONT_REGULAR[85] = (5, 11, bytearray(b'\x00\x00\x88\x88\x88\x88\x88\x88\x70\x00\x00'))
-FONT_REGULAR[86] = (5, 11, bytearray(b'\x00\x00\x88\x88\x88\x50\x50\x20\x20\x00\x00'))
-FONT_REGULAR[87] = (7, 11, bytearray(b'\x00\x00\x92\x92\x92\x92\x92\x92\x6c\x00\x00'))
-FONT_REGULAR[88] = (5, 11, bytearray(b'\x00\x00\x88\x88\x50\x20\x50\x88\x88\x00\x00'))
-FONT_REGULAR[89] = (5, 11, bytearray(b'\x00\x00\x88\x88\x50\x20\x20\x20\x20\x00\x00'))
-FONT_REGULAR[90] = (5, 11, bytearray(b'\x00\x00\xf8\x08\x10\x20\x40\x80\xf8\x00\x00'))
-FONT_REGULAR[91] = (3, 11, bytearray(b'\x00\xe0\x80\x80\x80\x80\x80\x80\x80\xe0\x00'))
-FONT_REGULAR[92] = (7, 11, bytearray(b'\x00\x00\x80\x40\x20\x10\x08\x04\x02\x00\x00'))
-FONT_REGULAR[93] = (3, 11, bytearray(b'\x00\xe0\x20\x20\x20\x20\x20\x20\x20\xe0\x00'))
-FONT_REGULAR[94] = (5, 11, bytearray(b'\x00\x00\x20\x50\x88\x00\x00\x00\x00\x00\x00'))
-FONT_REGULAR[95] = (5, 11, bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00'))
-FONT_REGULAR[96] = (3, 11, bytearray(b'\x00\x00\x80\x40\x20\x00\x00\x00\x00\x00\x00'))
-FONT_REGULAR[97] = (4, 11, bytearray(b'\x00\x00\x00\x00\x70\x90\x90\x90\x70\x00\x00'))
-FONT_REGULAR[98] = (4, 11, bytearray(b'\x00\x00\x80\x80\xe0\x90\x90\x90\xe0\x00\x00'))
-FONT_REGULAR[99] = (4, 11, bytearray(b'\x00\x00\x00\x00\x60\x90\x80\x90\x60\x00\x00'))
-FONT_REGULAR[100] = (4, 11, bytearray(b'\x00\x00\x10\x10\x70\x90\x90\x90\x70\x00\x00'))
-FONT_REGULAR[101] = (4, 11, bytearray(b'\x00\x00\x00\x00\x60\x90\xf0\x80\x60\x00\x00'))
-FONT_REGULAR[102] = (2, 11, bytearray(b'\x00\x00\x40\x80\x80\xc0\x80\x80\x80\x00\x00'))
-FONT_REGULAR[103] = (4, 11, bytearray(b'\x00\x00\x00\x00\x70\x90\x90\x90\x70\x10\x60'))
-FONT_REGULAR[104] = (4, 11, bytearray(b'\x00\x00\x80\x80\xe0\x90\x90\x90\x90\x00\x00'))
-FONT_REGULAR[105] = (1, 11, bytearray(b'\x00\x00\x80\x00\x80\x80\x80\x80\x80\x00\x00'))
-FONT_REGULAR[106] = (2, 11, bytearray(b'\x00\x00\x40\x00\x40\x40\x40\x40\x40\x40\x80'))
-FONT_REGULAR[107] = (4, 11, bytearray(b'\x00\x00\x80\x80\x90\xa0\xc0\xa0\x90\x00\x00'))
-FONT_REGULAR[108] = (1, 11, bytearray(b'\x00\x00\x80\x80\x80\x80\x80\x80\x80\x00\x00'))
-FONT_REGULAR[109] = (7, 11, bytearray(b'\x00\x00\x00\x00\xec\x92\x92\x92\x92\x00\x00'))
-FONT_REGULAR[110] = (4, 11, bytearray(b'\x00\x00\x00\x00\xe0\x90\x90\x90\x90\x00\x00'))
-FONT_REGULAR[111] = (4, 11, bytearray(b'\x00\x00\x00\x00\x60\x90\x90\x90\x60\x00\x00'))
-FONT_REGULAR[112] = (4, 11, bytearray(b'\x00\x00\x00\x00\xe0\x90\x90\x90\xe0\x80\x80'))
-FONT_REGULAR[113] = (4, 11, bytearray(b'\x00\x00\x00\x00\x70\x90\x90\x90\x70\x10\x10'))
-FONT_REGULAR[114] = (3, 11, bytearray(b'\x00\x00\x00\x00\xe0\x80\x80\x80\x80\x00\x00'))
-FONT_REGULAR[115] = (3, 11, bytearray(b'\x00\x00\x00\x00\x60\x80\x40\x20\xc0\x00\x00'))
-FONT_REGULAR[116] = (3, 11, bytearray(b'\x00\x00\x40\x40\xe0\x40\x40\x40\x40\x00\x00'))
-FONT_REGULAR[117] = (4, 11, bytearray(b'\x00\x00\x00\x00\x90\x90\x90\x90\x70\x00\x00'))
-FONT_REGULAR[118] = (4, 11, bytearray(b'\x00\x00\x00\x00\x90\x90\x90\x90\x60\x00\x00'))
-FONT_REGULAR[119] = (7, 11, bytearray(b'\x00\x00\x00\x00\x92\x92\x92\x92\x6c\x00\x00'))
-FONT_REGULAR[120] = (4, 11, bytearray(b'\x00\x00\x00\x00\x90\x90\x60\x90\x90\x00\x00'))
-FONT_REGULAR[121] = (4, 11, bytearray(b'\x00\x00\x00\x00\x90\x90\x90\x90\x70\x10\x60'))
-FONT_REGULAR[122] = (4, 11, bytearray(b'\x00\x00\x00\x00\xf0\x10\x60\x80\xf0\x00\x00'))
-FONT_REGULAR[123] = (3, 11, bytearray(b'\x00\x20\x40\x40\x40\x80\x40\x40\x40\x20\x00'))
-FONT_REGULAR[124] = (1, 11, bytearray(b'\x00\x80\x80\x80\x80\x80\x80\x80\x80\x80\x00'))
-FONT_REGULAR[125] = (3, 11, bytearray(b'\x00\x80\x40\x40\x40\x20\x40\x40\x40\x80\x00'))
-FONT_REGULAR[126] = (6, 11, bytearray(b'\x00\x00\x00\x00\x64\x98\x00\x00\x00\x00\x00'))
-
+FONT_REGULAR = Font(32, FONT_REGULAR_HEIGHT,
+    b'\x03\x01\x03\x05\x05\x07\x06\x01\x03\x03\x05\x05\x02\x05\x01\x07\x05\x02\x05\x05\x05\x05\x05\x05\x05\x05\x01\x02\x03\x05\x03\x05\x08\x05\x05\x05\x05\x05\x05\x05\x05\x01\x05\x05\x05\x07\x05\x05\x05\x05\x05\x05\x05\x05\x05\x07\x05\x05\x05\x03\x07\x03\x05\x05\x03\x04\x04\x04\x04\x04\x02\x04\x04\x01\x02\x04\x01\x07\x04\x04\x04\x04\x03\x03\x03\x04\x04\x07\x04\x04\x04\x03\x01\x03\x06',
+    b'\x00\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b',
+    bytearray(
+        b'\x00\x00\x80\x80\x80\x80\x80\x00\x80\x00\x00'  # '!'
+        b'\x00\x00\xa0\xa0\xa0\x00\x00\x00\x00\x00\x00'  # '"'
+        b'\x00\x00\x00\x50\xf8\x50\xf8\x50\x00\x00\x00'  # '#'
+        b'\x00\x20\x70\xa8\xa0\x70\x28\xa8\x70\x20\x00'  # '$'
+        b'\x00\x00\x42\xa4\x48\x10\x24\x4a\x84\x00\x00'  # '%'
+        b'\x00\x00\x60\x90\x90\x64\x94\x88\x74\x00\x00'  # '&'
+        b'\x00\x00\x80\x80\x80\x00\x00\x00\x00\x00\x00'  # "'"
+        b'\x00\x20\x40\x80\x80\x80\x80\x80\x40\x20\x00'  # '('
+        b'\x00\x80\x40\x20\x20\x20\x20\x20\x40\x80\x00'  # ')'
+        b'\x00\x00\x20\xa8\x70\xa8\x20\x00\x00\x00\x00'  # '*'
+        b'\x00\x00\x00\x20\x20\xf8\x20\x20\x00\x00\x00'  # '+'
+        b'\x00\x00\x00\x00\x00\x00\x00\x40\x40\x80\x00'  # ','
+        b'\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00'  # '-'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00'  # '.'
+        b'\x00\x00\x02\x04\x08\x10\x20\x40\x80\x00\x00'  # '/'
+        b'\x00\x00\x70\x88\x98\xa8\xc8\x88\x70\x00\x00'  # '0'
+        b'\x00\x00\x40\xc0\x40\x40\x40\x40\x40\x00\x00'  # '1'
+        b'\x00\x00\x70\x88\x08\x10\x20\x40\xf8\x00\x00'  # '2'
+        b'\x00\x00\x70\x88\x08\x30\x08\x88\x70\x00\x00'  # '3'
+        b'\x00\x00\x10\x30\x50\x90\xf8\x10\x10\x00\x00'  # '4'
+        b'\x00\x00\xf8\x80\xf0\x08\x08\x88\x70\x00\x00'  # '5'
+        b'\x00\x00\x70\x88\x80\xf0\x88\x88\x70\x00\x00'  # '6'
+        b'\x00\x00\xf8\x08\x08\x10\x10\x20\x20\x00\x00'  # '7'
+        b'\x00\x00\x70\x88\x88\x70\x88\x88\x70\x00\x00'  # '8'
+        b'\x00\x00\x70\x88\x88\x78\x08\x88\x70\x00\x00'  # '9'
+        b'\x00\x00\x00\x00\x80\x00\x00\x80\x00\x00\x00'  # ':'
+        b'\x00\x00\x00\x00\x40\x00\x00\x40\x40\x80\x00'  # ';'
+        b'\x00\x00\x00\x20\x40\x80\x40\x20\x00\x00\x00'  # '<'
+        b'\x00\x00\x00\x00\xf8\x00\xf8\x00\x00\x00\x00'  # '='
+        b'\x00\x00\x00\x80\x40\x20\x40\x80\x00\x00\x00'  # '>'
+        b'\x00\x00\x70\x88\x08\x10\x20\x00\x20\x00\x00'  # '?'
+        b'\x00\x7e\x81\x9d\xa5\xa5\x9e\x80\x7e\x00\x00'  # '@'
+        b'\x00\x00\x70\x88\x88\xf8\x88\x88\x88\x00\x00'  # 'A'
+        b'\x00\x00\xf0\x88\x88\xf0\x88\x88\xf0\x00\x00'  # 'B'
+        b'\x00\x00\x70\x88\x80\x80\x80\x88\x70\x00\x00'  # 'C'
+        b'\x00\x00\xf0\x88\x88\x88\x88\x88\xf0\x00\x00'  # 'D'
+        b'\x00\x00\xf8\x80\x80\xf0\x80\x80\xf8\x00\x00'  # 'E'
+        b'\x00\x00\xf8\x80\x80\xf0\x80\x80\x80\x00\x00'  # 'F'
+        b'\x00\x00\x70\x88\x80\x98\x88\x88\x70\x00\x00'  # 'G'
+        b'\x00\x00\x88\x88\x88\xf8\x88\x88\x88\x00\x00'  # 'H'
+        b'\x00\x00\x80\x80\x80\x80\x80\x80\x80\x00\x00'  # 'I'
+        b'\x00\x00\x08\x08\x08\x08\x08\x88\x70\x00\x00'  # 'J'
+        b'\x00\x00\x88\x90\xa0\xc0\xa0\x90\x88\x00\x00'  # 'K'
+        b'\x00\x00\x80\x80\x80\x80\x80\x80\xf8\x00\x00'  # 'L'
+        b'\x00\x00\x82\xc6\xaa\x92\x82\x82\x82\x00\x00'  # 'M'
+        b'\x00\x00\x88\x88\xc8\xa8\x98\x88\x88\x00\x00'  # 'N'
+        b'\x00\x00\x70\x88\x88\x88\x88\x88\x70\x00\x00'  # 'O'
+        b'\x00\x00\xf0\x88\x88\xf0\x80\x80\x80\x00\x00'  # 'P'
+        b'\x00\x00\x70\x88\x88\x88\x88\x88\x70\x08\x00'  # 'Q'
+        b'\x00\x00\xf0\x88\x88\xf0\xa0\x90\x88\x00\x00'  # 'R'
+        b'\x00\x00\x70\x88\x80\x70\x08\x88\x70\x00\x00'  # 'S'
+        b'\x00\x00\xf8\x20\x20\x20\x20\x20\x20\x00\x00'  # 'T'
+        b'\x00\x00\x88\x88\x88\x88\x88\x88\x70\x00\x00'  # 'U'
+        b'\x00\x00\x88\x88\x88\x50\x50\x20\x20\x00\x00'  # 'V'
+        b'\x00\x00\x92\x92\x92\x92\x92\x92\x6c\x00\x00'  # 'W'
+        b'\x00\x00\x88\x88\x50\x20\x50\x88\x88\x00\x00'  # 'X'
+        b'\x00\x00\x88\x88\x50\x20\x20\x20\x20\x00\x00'  # 'Y'
+        b'\x00\x00\xf8\x08\x10\x20\x40\x80\xf8\x00\x00'  # 'Z'
+        b'\x00\xe0\x80\x80\x80\x80\x80\x80\x80\xe0\x00'  # '['
+        b'\x00\x00\x80\x40\x20\x10\x08\x04\x02\x00\x00'  # '\\'
+        b'\x00\xe0\x20\x20\x20\x20\x20\x20\x20\xe0\x00'  # ']'
+        b'\x00\x00\x20\x50\x88\x00\x00\x00\x00\x00\x00'  # '^'
+        b'\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00'  # '_'
+        b'\x00\x00\x80\x40\x20\x00\x00\x00\x00\x00\x00'  # '`'
+        b'\x00\x00\x00\x00\x70\x90\x90\x90\x70\x00\x00'  # 'a'
+        b'\x00\x00\x80\x80\xe0\x90\x90\x90\xe0\x00\x00'  # 'b'
+        b'\x00\x00\x00\x00\x60\x90\x80\x90\x60\x00\x00'  # 'c'
+        b'\x00\x00\x10\x10\x70\x90\x90\x90\x70\x00\x00'  # 'd'
+        b'\x00\x00\x00\x00\x60\x90\xf0\x80\x60\x00\x00'  # 'e'
+        b'\x00\x00\x40\x80\x80\xc0\x80\x80\x80\x00\x00'  # 'f'
+        b'\x00\x00\x00\x00\x70\x90\x90\x90\x70\x10\x60'  # 'g'
+        b'\x00\x00\x80\x80\xe0\x90\x90\x90\x90\x00\x00'  # 'h'
+        b'\x00\x00\x80\x00\x80\x80\x80\x80\x80\x00\x00'  # 'i'
+        b'\x00\x00\x40\x00\x40\x40\x40\x40\x40\x40\x80'  # 'j'
+        b'\x00\x00\x80\x80\x90\xa0\xc0\xa0\x90\x00\x00'  # 'k'
+        b'\x00\x00\x80\x80\x80\x80\x80\x80\x80\x00\x00'  # 'l'
+        b'\x00\x00\x00\x00\xec\x92\x92\x92\x92\x00\x00'  # 'm'
+        b'\x00\x00\x00\x00\xe0\x90\x90\x90\x90\x00\x00'  # 'n'
+        b'\x00\x00\x00\x00\x60\x90\x90\x90\x60\x00\x00'  # 'o'
+        b'\x00\x00\x00\x00\xe0\x90\x90\x90\xe0\x80\x80'  # 'p'
+        b'\x00\x00\x00\x00\x70\x90\x90\x90\x70\x10\x10'  # 'q'
+        b'\x00\x00\x00\x00\xe0\x80\x80\x80\x80\x00\x00'  # 'r'
+        b'\x00\x00\x00\x00\x60\x80\x40\x20\xc0\x00\x00'  # 's'
+        b'\x00\x00\x40\x40\xe0\x40\x40\x40\x40\x00\x00'  # 't'
+        b'\x00\x00\x00\x00\x90\x90\x90\x90\x70\x00\x00'  # 'u'
+        b'\x00\x00\x00\x00\x90\x90\x90\x90\x60\x00\x00'  # 'v'
+        b'\x00\x00\x00\x00\x92\x92\x92\x92\x6c\x00\x00'  # 'w'
+        b'\x00\x00\x00\x00\x90\x90\x60\x90\x90\x00\x00'  # 'x'
+        b'\x00\x00\x00\x00\x90\x90\x90\x90\x70\x10\x60'  # 'y'
+        b'\x00\x00\x00\x00\xf0\x10\x60\x80\xf0\x00\x00'  # 'z'
+        b'\x00\x20\x40\x40\x40\x80\x40\x40\x40\x20\x00'  # '{'
+        b'\x00\x80\x80\x80\x80\x80\x80\x80\x80\x80\x00'  # '|'
+        b'\x00\x80\x40\x40\x40\x20\x40\x40\x40\x80\x00'  # '}'
+        b'\x00\x00\x00\x00\x64\x98\x00\x00\x00\x00\x00'  # '~'
+    ))
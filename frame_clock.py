@@ -0,0 +1,147 @@
+# frame_clock.py
+# Propósito: Reloj de frames compartido por todas las escenas. Paso fijo con deadlines absolutos (ticks_us): si vamos atrasados se siguen corriendo los ticks de simulación y se saltean frames de render, así la velocidad de las animaciones no depende de lo que tarde el bus del display.
+
+import time
+import runtime
+
+
+class FrameClock:
+    """
+    Uso típico (en una corrutina, `await clock.tick()` en vez de wait()):
+
+        clock = FrameClock(30)
+        while running:
+            for _ in range(clock.wait()):
+                update()                 # un tick de simulación
+            clock.update_done()
+            if clock.render:
+                draw()
+                clock.draw_done()
+                oled.show()
+                clock.flush_done()
+    """
+
+    def __init__(self, fps=30, max_updates=5, max_skip=3):
+        self.max_updates = max_updates  # Ticks de simulación máximos por frame
+        self.max_skip = max_skip        # Renders seguidos que se pueden saltear
+        self.set_fps(fps)
+        self.reset_stats()
+
+    def set_fps(self, fps):
+        self.fps = fps
+        self.period_us = 1_000_000 // fps
+        self.reset()
+
+    def reset(self):
+        # Reinicia los deadlines (p.ej. al volver a una escena)
+        self._deadline = time.ticks_add(time.ticks_us(), self.period_us)
+        self._mark = time.ticks_us()
+        self._skips = 0
+        self.render = True
+
+    def reset_stats(self):
+        self.ticks = 0          # Ticks de simulación corridos
+        self.frames = 0         # Frames renderizados
+        self.skipped = 0        # Frames de render salteados
+        self.late = 0           # Frames que se pasaron del presupuesto
+        self.update_us = 0
+        self.draw_us = 0
+        self.flush_us = 0
+        self.max_update_us = 0
+        self.max_draw_us = 0
+        self.max_flush_us = 0
+
+    def wait(self):
+        """
+        Duerme hasta el próximo deadline y devuelve cuántos ticks de
+        simulación tocan (1 si vamos a tiempo, más si hubo atraso).
+        Deja en self.render si este frame se dibuja o se saltea.
+        """
+        now = time.ticks_us()
+        remaining = time.ticks_diff(self._deadline, now)
+        if remaining > 0:
+            # sleep_ms cede la CPU a los otros hilos (música, flush)
+            if remaining >= 1000:
+                time.sleep_ms(remaining // 1000)
+            rest = time.ticks_diff(self._deadline, time.ticks_us())
+            if rest > 0:
+                time.sleep_us(rest)
+            now = self._deadline
+        return self._advance(now)
+
+    async def tick(self):
+        """
+        Como wait(), para corrutinas: en vez de dormir cede el tiempo que
+        falta a las otras tareas del runtime (música, entrada, render).
+        """
+        remaining = time.ticks_diff(self._deadline, time.ticks_us())
+        if remaining > 0:
+            await runtime.sleep_ms((remaining + 999) // 1000)
+        now = time.ticks_us()
+        if time.ticks_diff(now, self._deadline) < 0:
+            now = self._deadline
+        return self._advance(now)
+
+    def _advance(self, now):
+        behind = time.ticks_diff(now, self._deadline)
+        steps = 1 + behind // self.period_us
+        if steps > self.max_updates:
+            # Demasiado atrasados: se pierde ese tiempo en vez de acelerar
+            steps = self.max_updates
+            self._deadline = time.ticks_add(now, self.period_us)
+        else:
+            self._deadline = time.ticks_add(self._deadline, steps * self.period_us)
+
+        if steps > 1:
+            self.late += 1
+        if steps > 1 and self._skips < self.max_skip:
+            self.render = False
+            self._skips += 1
+            self.skipped += 1
+        else:
+            self.render = True
+            self._skips = 0
+            self.frames += 1
+        self.ticks += steps
+        self._mark = time.ticks_us()
+        return steps
+
+    def _lap(self):
+        now = time.ticks_us()
+        us = time.ticks_diff(now, self._mark)
+        self._mark = now
+        return us
+
+    def update_done(self):
+        us = self._lap()
+        self.update_us = us
+        if us > self.max_update_us:
+            self.max_update_us = us
+
+    def draw_done(self):
+        us = self._lap()
+        self.draw_us = us
+        if us > self.max_draw_us:
+            self.max_draw_us = us
+
+    def flush_done(self):
+        us = self._lap()
+        self.flush_us = us
+        if us > self.max_flush_us:
+            self.max_flush_us = us
+
+    def stats(self):
+        return {
+            'fps': self.fps,
+            'budget_us': self.period_us,
+            'ticks': self.ticks,
+            'frames': self.frames,
+            'skipped': self.skipped,
+            'late': self.late,
+            'update_us': self.update_us,
+            'draw_us': self.draw_us,
+            'flush_us': self.flush_us,
+            'max_update_us': self.max_update_us,
+            'max_draw_us': self.max_draw_us,
+            'max_flush_us': self.max_flush_us,
+        }
@@ -1,15 +1,116 @@
 # hardware.py
 # Propósito:  Abstracción del Hardware (HAL). Inicializa el oled, buzzer, touch_pad y ldr_sensor. Contiene funciones como read_touch(), play_tone() o read_light_sensor(). Así el juego no se preocupa por cómo funcionan los pines.
 
-from machine import Pin, I2C, PWM
-from ssd1306 import SSD1306_I2C
+from machine import Pin, I2C, SPI, PWM
+from ssd1306 import SSD1306_I2C, SSD1306_SPI
+import sys
 import config
+import buttons
 import time
 
 oled = None
 buzzer = None
 button_a = None
 button_b = None
+i2c = None
+i2c_freq = None
+spi = None
+
+def _make_i2c(freq):
+    return I2C(0, scl=Pin(config.PIN_SCL), sda=Pin(config.PIN_SDA), freq=freq)
+
+def make_display(probe=False):
+    """
+    Construye el driver del OLED según config.OLED_BUS ("i2c" o "spi").
+    Las escenas sólo usan la API común de SSD1306, así que corren igual
+    en cualquiera de los dos buses.
+    """
+    global i2c, i2c_freq, spi
+    if config.OLED_BUS == "spi":
+        spi = SPI(config.SPI_ID, baudrate=config.SPI_BAUDRATE,
+                  sck=Pin(config.PIN_SPI_SCK), mosi=Pin(config.PIN_SPI_MOSI))
+        cs = Pin(config.PIN_OLED_CS) if config.PIN_OLED_CS is not None else None
+        return SSD1306_SPI(config.OLED_WIDTH, config.OLED_HEIGHT, spi,
+                           Pin(config.PIN_OLED_DC), Pin(config.PIN_OLED_RES), cs,
+                           baudrate=config.SPI_BAUDRATE)
+    i2c_freq = config.I2C_FREQ
+    i2c = _make_i2c(i2c_freq)
+    display = SSD1306_I2C(config.OLED_WIDTH, config.OLED_HEIGHT, i2c, config.OLED_I2C_ADDR)
+    if probe:
+        i2c, i2c_freq = probe_i2c_freq(display)
+    return display
+
+def probe_i2c_freq(display):
+    """
+    Sube el reloj del I2C por config.I2C_PROBE_FREQS (sólo las que están
+    por encima de config.I2C_FREQ) empujando frames de prueba y se queda con
+    la frecuencia más alta que no dio errores de ACK/EIO; nunca baja de
+    I2C_FREQ. Devuelve (i2c, freq) y deja el display usando ese bus.
+    """
+    best_bus = display.i2c
+    best_freq = config.I2C_FREQ
+    # En ESP32/rp2 I2C(0, ...) devuelve siempre el mismo periférico y sólo
+    # lo reconfigura: se sigue la frecuencia con la que quedó, no el objeto
+    configured_freq = best_freq
+    for freq in [f for f in config.I2C_PROBE_FREQS if f > config.I2C_FREQ]:
+        try:
+            configured_freq = freq
+            bus = _make_i2c(freq)
+            if config.OLED_I2C_ADDR not in bus.scan():
+                raise OSError("no ACK from display")
+            display.i2c = bus
+            for _ in range(config.I2C_PROBE_FRAMES):
+                display.send_window(0, display.width - 1, 0, display.pages - 1)
+        except (OSError, ValueError) as e:
+            # ValueError: algunos ports rechazan así un freq= que no soportan
+            print(f"I2C {freq // 1000} kHz failed: {e}")
+            break
+        best_bus = bus
+        best_freq = freq
+    # Volver al bus estable y reenviar el frame por si quedó a medias
+    if configured_freq != best_freq:
+        best_bus = _make_i2c(best_freq)
+        display.i2c = best_bus
+        display.send_window(0, display.width - 1, 0, display.pages - 1)
+    print(f"I2C bus at {best_freq // 1000} kHz")
+    return best_bus, best_freq
+
+def benchmark_bus(display=None, frames=10):
+    """
+    Mide el tiempo de flush de un frame completo y de una sola página.
+    Sirve para comparar placas y cableado. Devuelve un dict con los
+    promedios en microsegundos.
+    """
+    if display is None:
+        display = oled
+    last = display.pages - 1
+    width = display.width
+
+    t0 = time.ticks_us()
+    for _ in range(frames):
+        display.send_window(0, width - 1, 0, last)
+    full_us = time.ticks_diff(time.ticks_us(), t0) // frames
+    full_bytes = display.show_bytes
+
+    t0 = time.ticks_us()
+    for _ in range(frames):
+        display.send_window(0, width - 1, 0, 0)
+    page_us = time.ticks_diff(time.ticks_us(), t0) // frames
+    page_bytes = display.show_bytes
+
+    freq = config.SPI_BAUDRATE if config.OLED_BUS == "spi" else i2c_freq
+    result = {
+        'bus': config.OLED_BUS,
+        'freq': freq,
+        'full_frame_us': full_us,
+        'full_frame_bytes': full_bytes,
+        'page_us': page_us,
+        'page_bytes': page_bytes,
+        'max_fps': 1_000_000 // full_us if full_us else 0,
+    }
+    print(f"Bus benchmark ({config.OLED_BUS} @ {freq}): full frame {full_us} us ({full_bytes} B), "
+          f"page {page_us} us ({page_bytes} B), max {result['max_fps']} fps")
+    return result
 
 def init_hardware():
     global oled, buzzer, button_a, button_b
@@ -17,9 +118,14 @@ def init_hardware():
     # Pausa para estabilizar el hardware
     time.sleep_ms(200)
     
-    # Inicializar I2C y OLED
-    i2c = I2C(0, scl=Pin(config.PIN_SCL), sda=Pin(config.PIN_SDA))
-    oled = SSD1306_I2C(config.OLED_WIDTH, config.OLED_HEIGHT, i2c)
+    # Inicializar bus (I2C o SPI) y OLED
+    oled = make_display(probe=config.I2C_PROBE)
+    if config.I2C_BENCHMARK:
+        benchmark_bus(oled)
+    if config.OLED_DIFF_MODE:
+        oled.set_diff_mode(True, config.OLED_DIFF_THRESHOLD)
+    if config.OLED_ASYNC_FLUSH and sys.platform in config.OLED_ASYNC_FLUSH_PLATFORMS:
+        oled.set_async_flush(True)
     
     # Inicializar Buzzer
     # Forzamos duty 0 al inicio para evitar pitidos residuales
@@ -33,6 +139,8 @@ def init_hardware():
     try:
         button_a = Pin(config.PIN_BUTTON_A, Pin.IN, Pin.PULL_UP)
         button_b = Pin(config.PIN_BUTTON_B, Pin.IN, Pin.PULL_UP)
+        # Los flancos entran por IRQ; las escenas leen gestos con buttons.of(pin)
+        buttons.attach(button_a, button_b)
     except Exception as e:
         print(f"Error initializing buttons: {e}")
         button_a = None
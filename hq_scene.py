@@ -1,13 +1,16 @@
 # hq_scene.py
 # Propósito: La base de operaciones (Headquarters). Desde aquí se lanzan misiones, se ve el estado, etc.
 
-import time
+import runtime
+import transitions
 
-def play_scene(oled):
-    oled.fill(0)
-    oled.text("HQ SCENE", 30, 25)
-    oled.text("Coming Soon...", 10, 40)
-    oled.show()
+async def play_scene(oled):
+    # La pantalla se arma aparte y entra con un dissolve desde lo que había
+    frame = transitions.offscreen(oled)
+    frame.fill(0)
+    frame.text("HQ SCENE", 30, 25)
+    frame.text("Coming Soon...", 10, 40)
+    await transitions.play(oled, transitions.Dissolve(oled, frame, 12))
     
-    # Pausa para ver el mensaje
-    time.sleep(2)
+    # Pausa para ver el mensaje (cede la CPU a las otras tareas)
+    await runtime.sleep_ms(2000)
@@ -3,39 +3,48 @@
 import time
 import framebuf
 import assets # Asumimos que tus bytearrays están acá
+import config
+import fonts
+import blitter
+import buttons
+import renderer
+import runtime
+import sound_manager
+import transitions
+from frame_clock import FrameClock
 
-def play_sequence(oled, button=None):
+async def play_sequence(oled, button=None):
     """
     Ejecuta la secuencia de inicio cinematográfica:
     Fade in de Cypher + Vuelo de Nomad/Protocol.
-    Bloquea la ejecución hasta terminar.
+    Termina cuando se aprieta el botón; las esperas ceden la CPU a las
+    otras tareas del runtime.
     """
     
     # ... (Rest of setup) ...
     # 1. Setup de Buffers (Dimensiones REALES de assets)
-    # Es vital que 'assets.LOGO_CYPHER', etc., existan en tu archivo assets.py
-    # Cypher Logo: 128x64
-    fb_cypher = framebuf.FrameBuffer(assets.LOGO_CYPHER, 128, 64, framebuf.MONO_HLSB)
-    # Nomad Logo: 46x13
-    fb_nomad = framebuf.FrameBuffer(assets.LOGO_NOMAD, 46, 13, framebuf.MONO_HLSB)
-    # Protocol Logo: 61x13
-    fb_proto = framebuf.FrameBuffer(assets.LOGO_PROTOCOL, 61, 13, framebuf.MONO_HLSB)
+    # Es vital que 'assets.LOGO_CYPHER', etc., existan (asset_data.py / assets.pack)
+    # Cypher Logo: 128x64, ya en MONO_VLSB (el layout del buffer del SSD1306)
+    fb_cypher = framebuf.FrameBuffer(assets.LOGO_CYPHER, 128, 64, framebuf.MONO_VLSB)
 
     # --- FASE 1: FADE IN (CONTRASTE) ---
     oled.contrast(0) # Empezar "apagado"
-    oled.fill(0)
-    # Dibujamos el logo principal centrado verticalmente si es necesario, o 0,0 si ocupa todo
-    oled.blit(fb_cypher, 0, 0) 
+    # El logo ocupa toda la pantalla: se copia entero al buffer, sin blit
+    if not blitter.copy_frame(oled, assets.LOGO_CYPHER):
+        oled.fill(0)
+        if hasattr(oled, 'mark_dirty'):
+            oled.blit(fb_cypher, 0, 0, w=128, h=64)
+        else:
+            oled.blit(fb_cypher, 0, 0)
     oled.show()
     
-    # Subir brillo gradualmente (optimizado: menos pasos, más rápido)
-    for i in range(0, 256, 16):  # Incrementos más grandes
-        oled.contrast(i)
-        time.sleep_ms(15)  # Menos tiempo entre pasos
+    # Subir brillo gradualmente: rampa de contraste de 16 pasos, uno por
+    # tick del reloj (si un paso se atrasa, se saltea)
+    await transitions.play(oled, transitions.Fade(oled, 16), 1000 // config.FADE_STEP_MS)
     
     # Pausa dramática de 3 segundos para leer CYPHER
-    # (Aquí sonaría el blues de fondo si se inició antes en main.py)
-    time.sleep(3) 
+    # (mientras tanto la tarea de música sigue con el blues de fondo)
+    await runtime.sleep_ms(3000)
 
     # --- FASE 2: ANIMACIÓN DE TEXTO (FLY-IN) ---
     # Optimizado para mejor rendimiento
@@ -48,50 +57,52 @@ def play_sequence(oled, button=None):
     left_x = -60    # Nomad entra desde izq (afuera)
     right_x = 128   # Protocol entra desde der (afuera)
     
-    step = 6 # Velocidad de movimiento (aumentada para menos frames)
-    frame_skip = 0  # Contador para saltar frames de actualización
-    last_nomad_x = -1000  # Para tracking de cambios
-    last_proto_x = 2000
+    step = 6 # Velocidad de movimiento por tick de simulación
+
+    # Fondo: el logo de Cypher con la franja de los textos en negro. Los
+    # logos (Nomad 46x13, Protocol 61x13) son sprites opacos: el compositor
+    # redibuja sólo por donde pasaron
+    background = bytearray(assets.LOGO_CYPHER)
+    blitter.Canvas(background, 128, 64).fill_rect(0, target_y, 128, 14, 0)
+    stage = renderer.Compositor(oled, background)
+    nomad = stage.add(renderer.Sprite(assets.LOGO_NOMAD, 46, 13, left_x, target_y))
+    proto = stage.add(renderer.Sprite(assets.LOGO_PROTOCOL, 61, 13, right_x, target_y))
+    # Paso fijo: la posición avanza por tick, el dibujo se saltea si el
+    # bus no da abasto, así la velocidad no depende del show()
+    clock = FrameClock(config.INTRO_FPS)
 
     while left_x < stop_nomad_x or right_x > stop_proto_x:
         # Calcular próximo paso primero
-        if left_x < stop_nomad_x: 
-            left_x += step
-            if left_x > stop_nomad_x: left_x = stop_nomad_x
-            
-        if right_x > stop_proto_x: 
-            right_x -= step
-            if right_x < stop_proto_x: right_x = stop_proto_x
+        for _ in range(await clock.tick()):
+            if left_x < stop_nomad_x: 
+                left_x += step
+                if left_x > stop_nomad_x: left_x = stop_nomad_x
+                
+            if right_x > stop_proto_x: 
+                right_x -= step
+                if right_x < stop_proto_x: right_x = stop_proto_x
+        clock.update_done()
         
-        # Solo actualizar display cada 2 frames para mejor rendimiento
-        frame_skip = (frame_skip + 1) % 2
-        if frame_skip == 0 or left_x >= stop_nomad_x and right_x <= stop_proto_x:
-            # Calcular área mínima que necesita actualización
-            min_x = min(int(left_x), int(right_x), 0)
-            max_x = max(int(left_x) + 46, int(right_x) + 61, 128)
-            width = max_x - min_x
-            
-            # Limpiar solo el área que necesita actualización (más eficiente)
-            oled.fill_rect(max(0, min_x), target_y, min(128, width), 14, 0)
-            
-            # Dibujar en nuevas posiciones
-            oled.blit(fb_nomad, int(left_x), target_y)
-            oled.blit(fb_proto, int(right_x), target_y)
+        if clock.render:
+            # Mover los sprites; el compositor limpia y redibuja lo justo
+            nomad.move_to(int(left_x), target_y)
+            proto.move_to(int(right_x), target_y)
+            stage.render()
+            clock.draw_done()
             
-            # Update físico (solo cuando hay cambios significativos)
-            oled.show()
-        
-        time.sleep_ms(8) # Control de FPS (reducido ligeramente)
+            # Update físico (lo hace la tarea de render)
+            runtime.present()
     
     # Asegurar dibujo final en posiciones exactas
-    oled.fill_rect(0, target_y, 128, 14, 0)
-    oled.blit(fb_nomad, stop_nomad_x, target_y)
-    oled.blit(fb_proto, stop_proto_x, target_y)
-    oled.show()
+    nomad.move_to(stop_nomad_x, target_y)
+    proto.move_to(stop_proto_x, target_y)
+    stage.render()
+    runtime.present()
+    stage = background = None
 
     # --- FASE 3: INPUT WAIT ---
     # Pequeño delay para apreciar el logo completo
-    time.sleep_ms(500)
+    await runtime.sleep_ms(500)
     
     # Mostramos PRESS TO START debajo de CYPHER (que termina en y=64)
     # Pero la pantalla tiene 64px de alto.
@@ -100,49 +111,57 @@ def play_sequence(oled, button=None):
     # Podemos poner PRESS TO START en y=55 (bottom) sin borrar los logos.
     
     prompt_y = 55
+    prompt = "PRESS TO START"
+    prompt_w, _ = fonts.measure(prompt, fonts.FONT_8X8)
+    prompt_x = (oled.width - prompt_w) // 2
     
     print("Waiting for button press...")
     if button:
-        # Debounce
-        time.sleep_ms(200)
+        # Los gestos llegan por IRQ: sólo cuenta lo que pase desde acá
+        keys = buttons.of(button)
+        index = keys.index(button)
+        keys.clear()
         
         blink_state = False
-        last_blink = time.ticks_ms()
+        next_blink = time.ticks_add(time.ticks_ms(), 800) # Parpadeo lento
         
         while True:
-            # Lógica de parpadeo del texto "PRESS TO START"
-            current_time = time.ticks_ms()
-            if time.ticks_diff(current_time, last_blink) > 800: # Parpadeo lento
-                blink_state = not blink_state
-                last_blink = current_time
-                
-                # Limpiar SOLO el área del texto prompt (abajo), no tocar logos
-                oled.fill_rect(0, prompt_y, 128, 8, 0)
-                
-                if blink_state:
-                    # Mostrar PRESS TO START
-                    # Centrado: "PRESS TO START" son ~14 chars * 8px = 112px
-                    # (128 - 112) / 2 = 8
-                    oled.text("PRESS TO START", 8, prompt_y) 
-                
-                oled.show()
-
-            # Check botón
-            val = button.value()
-            if val == 0:
+            # Check botón (una pulsación corta entre ticks no se pierde)
+            if keys.take(index, buttons.PRESS):
                 print("Button pressed!")
+                sound_manager.sfx(sound_manager.SFX_CONFIRM)
                 break
+
+            # Dormir hasta el próximo parpadeo o hasta que llegue un evento
+            left = time.ticks_diff(next_blink, time.ticks_ms())
+            if left > 0:
+                await runtime.wait_input(left)
+                continue
+
+            # Lógica de parpadeo del texto "PRESS TO START"
+            blink_state = not blink_state
+            next_blink = time.ticks_add(time.ticks_ms(), 800)
             
-            time.sleep_ms(50)
+            # Limpiar SOLO el área del texto prompt (abajo), no tocar logos
+            oled.fill_rect(0, prompt_y, 128, 8, 0)
+            
+            if blink_state:
+                # Mostrar PRESS TO START centrado, pre-renderizado una vez
+                fonts.draw_text(oled, prompt, prompt_x, prompt_y, fonts.FONT_8X8)
+            
+            runtime.present()
 
         # Feedback visual final
         oled.invert(True)
-        time.sleep_ms(100)
+        await runtime.sleep_ms(100)
         oled.invert(False)
-        
-        # Esperar a que suelte
-        while button.value() == 0:
-            time.sleep_ms(50)
+        # No se espera a que suelte: la escena siguiente descarta esa
+        # pulsación con keys.clear()
             
     else:
-        time.sleep(2)
\ No newline at end of file
+        await runtime.sleep_ms(2000)
+
+    # Los logos no se vuelven a usar: sus buffers quedan para otros assets
+    assets.release('LOGO_CYPHER')
+    assets.release('LOGO_NOMAD')
+    assets.release('LOGO_PROTOCOL')
@@ -1,13 +1,15 @@
 # main.py
-# Propósito:  El director de orquesta. Inicializa el hardware, corre el bucle principal (while True), lee los inputs y llama al engine para actualizar el juego y al renderer para dibujar.
+# Propósito:  El director de orquesta. Inicializa el hardware, corre el bucle principal (while True), lee los inputs y llama al engine para actualizar el juego y al renderer para dibujar. Todo corre como tareas del runtime (runtime.py): las escenas son corrutinas y la música, la entrada, el render y el engine van en tareas aparte.
 
 import time
-import _thread
 import hardware
 import renderer
 import sound_manager
 import assets
 import config
+import engine
+import runtime
+import transitions
 
 # Scenes
 import intro_scene
@@ -32,11 +34,8 @@ except Exception as e:
     sys.print_exception(e)
     # Intentar mostrar error en display si es posible
     try:
-        from machine import Pin, I2C
-        from ssd1306 import SSD1306_I2C
-        import config
-        i2c = I2C(0, scl=Pin(config.PIN_SCL), sda=Pin(config.PIN_SDA))
-        oled = SSD1306_I2C(config.OLED_WIDTH, config.OLED_HEIGHT, i2c)
+        # Mismo bus que config.OLED_BUS, sin probe ni modos extra
+        oled = hardware.make_display()
         oled.fill(0)
         oled.text("ERROR", 0, 0)
         oled.text("Hardware init", 0, 10)
@@ -46,6 +45,10 @@ except Exception as e:
         pass
     raise
 
+# Tareas de fondo: render e input; el engine hace un tick cada ENGINE_TICK_MS
+runtime.start(oled)
+runtime.every(config.ENGINE_TICK_MS, engine.update)
+
 # 2. Inicializar Sonido
 try:
     print("Loading song...")
@@ -56,13 +59,15 @@ try:
         # Cargamos la canción desde los assets
         # Nota: sound_manager.load_song espera un módulo con PIECE y NOTES
         sound_manager.load_song(assets.SONG_INTRO)
-        # Iniciamos la música en un hilo separado para que suene durante la intro
-        _thread.start_new_thread(sound_manager.play_music_loop, (buzzer,))
-        print("Song loaded and music thread started")
+        print("Song loaded")
 except Exception as e:
     print(f"WARNING: Could not start music: {e}")
     import sys
     sys.print_exception(e)
+# La música es una tarea del runtime: suena durante la intro y sigue
+# mientras las escenas esperan con await. Sin canción la tarea queda para
+# los efectos de sonido.
+runtime.spawn(sound_manager.play_music(buzzer))
 
 def draw_menu(oled, selected_index):
     oled.fill(0)
@@ -89,104 +94,99 @@ def show_qr_code(oled):
 
 # --- Bucle Principal ---
 
-# 1. Play Intro Scene
-try:
-    print("Playing intro scene...")
-    # Pasamos el botón para que espere la pulsación
-    # Asegúrate de que 'intro_scene.py' esté actualizado en el dispositivo
-    intro_scene.play_sequence(oled, button_a)
-    print("Intro scene completed")
-except Exception as e:
-    print(f"ERROR playing intro: {e}")
-    import sys
-    sys.print_exception(e)
-    # Mostrar error en display
+async def show_error(lines, ms):
+    # Mensaje de error en pantalla, sin frenar las otras tareas
+    sound_manager.sfx(sound_manager.SFX_ERROR)
     try:
         oled.fill(0)
-        oled.text("ERROR", 0, 0)
-        oled.text("Intro failed", 0, 10)
+        for i, line in enumerate(lines):
+            oled.text(line, 0, i * 10)
         oled.show()
-        time.sleep(3)
+        await runtime.sleep_ms(ms)
     except:
         pass
-    # Si falla la intro, esperamos un poco para que se pueda leer el error
-    time.sleep(2)
 
-# 2. Menu Loop
-try:
-    print("Initializing main menu...")
-    menu = main_menu.MainMenu(oled)
-    print("Main menu initialized")
-except Exception as e:
-    print(f"ERROR initializing menu: {e}")
-    import sys
-    sys.print_exception(e)
-    # Mostrar error en display
+async def main():
+    # 1. Play Intro Scene
     try:
-        oled.fill(0)
-        oled.text("ERROR", 0, 0)
-        oled.text("Menu init", 0, 10)
-        oled.text("failed", 0, 20)
-        oled.show()
-        time.sleep(3)
-    except:
-        pass
-    raise
+        print("Playing intro scene...")
+        # Pasamos el botón para que espere la pulsación
+        # Asegúrate de que 'intro_scene.py' esté actualizado en el dispositivo
+        await intro_scene.play_sequence(oled, button_a)
+        print("Intro scene completed")
+    except Exception as e:
+        print(f"ERROR playing intro: {e}")
+        import sys
+        sys.print_exception(e)
+        # Mostrar error en display
+        await show_error(("ERROR", "Intro failed"), 3000)
+        # Si falla la intro, esperamos un poco para que se pueda leer el error
+        await runtime.sleep_ms(2000)
 
-print("Entering main loop...")
-while True:
+    # 2. Menu Loop
     try:
-        # Ejecutar menú y esperar selección
-        # El método run() maneja el bucle de dibujo y input internamente
-        # Pasamos button_a para navegación (up/down) y button_b para selección (enter)
-        selected_action = menu.run(button_a, button_b)
-        
-        print(f"Action selected: {selected_action}")
-        
-        if selected_action == "launch":
-            print("Launching Game...")
-            try:
-                hq_scene.play_scene(oled)
-                walk_scene.play_scene(oled)
-            except Exception as e:
-                print(f"ERROR in game scenes: {e}")
-                import sys
-                sys.print_exception(e)
-        
-        elif selected_action == "uplink":
-            print("Starting Uplink...")
-            try:
-                wifi_manager.play_scene(oled)
-            except Exception as e:
-                print(f"ERROR in uplink scene: {e}")
-                import sys
-                sys.print_exception(e)
-        
-        elif selected_action == "manual":
-            print("Showing Manual...")
-            # Definir show_qr_code o moverlo a un módulo
-            # show_qr_code(oled) # Asumiendo que existe localmente o mover a modulo
-            pass # Placeholder
-        
-        elif selected_action == "contact":
-            print("Contact info...")
-            oled.fill(0)
-            oled.text("CONTACT", 20, 20)
-            oled.show()
-            time.sleep(2)
+        print("Initializing main menu...")
+        menu = main_menu.MainMenu(oled)
+        print("Main menu initialized")
     except Exception as e:
-        print(f"ERROR in main loop: {e}")
+        print(f"ERROR initializing menu: {e}")
         import sys
         sys.print_exception(e)
-        # Intentar mostrar error en display
+        # Mostrar error en display
+        await show_error(("ERROR", "Menu init", "failed"), 3000)
+        raise
+
+    print("Entering main loop...")
+    while True:
         try:
-            oled.fill(0)
-            oled.text("ERROR", 0, 0)
-            oled.text("Main loop", 0, 10)
-            oled.text("error", 0, 20)
-            oled.show()
-            time.sleep(2)
-        except:
-            pass
-        
-    # Al volver, el bucle while True reinicia el menú
+            # Ejecutar menú y esperar selección
+            # El método run() maneja el bucle de dibujo y input internamente
+            # Pasamos button_a para navegación (up/down) y button_b para selección (enter)
+            selected_action = await menu.run(button_a, button_b)
+            
+            print(f"Action selected: {selected_action}")
+            
+            if selected_action == "launch":
+                print("Launching Game...")
+                try:
+                    await hq_scene.play_scene(oled)
+                    # Fundido a negro; la caminata vuelve a subir el contraste
+                    # mientras ya está animando
+                    await transitions.play(oled, transitions.Fade(oled, 8, 255, 0))
+                    await walk_scene.play_scene(oled)
+                except Exception as e:
+                    print(f"ERROR in game scenes: {e}")
+                    import sys
+                    sys.print_exception(e)
+            
+            elif selected_action == "uplink":
+                print("Starting Uplink...")
+                try:
+                    await wifi_manager.play_scene(oled)
+                except Exception as e:
+                    print(f"ERROR in uplink scene: {e}")
+                    import sys
+                    sys.print_exception(e)
+            
+            elif selected_action == "manual":
+                print("Showing Manual...")
+                # Definir show_qr_code o moverlo a un módulo
+                # show_qr_code(oled) # Asumiendo que existe localmente o mover a modulo
+                pass # Placeholder
+            
+            elif selected_action == "contact":
+                print("Contact info...")
+                oled.fill(0)
+                oled.text("CONTACT", 20, 20)
+                runtime.present()
+                await runtime.sleep_ms(2000)
+        except Exception as e:
+            print(f"ERROR in main loop: {e}")
+            import sys
+            sys.print_exception(e)
+            # Intentar mostrar error en display
+            await show_error(("ERROR", "Main loop", "error"), 2000)
+            
+        # Al volver, el bucle while True reinicia el menú
+
+runtime.run(main())
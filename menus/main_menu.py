@@ -1,17 +1,28 @@
 # menus/main_menu.py
 # Propósito: Menú principal estilo Flipper Zero con scroll, iconos y navegación avanzada.
 
-import time
 import math
 import framebuf
 import assets
-import config
 import fonts
+import blitter
+import buttons
+import runtime
+import sound_manager
+from viewport import Viewport
+from frame_clock import FrameClock
 
 class MainMenu:
-    # Constantes de tiempo para botones (ms)
-    LONG_PRESS_MS = 400
-    DOUBLE_CLICK_MS = 350
+    # Deslizamiento de la lista (píxeles por paso y pausa entre pasos)
+    SCROLL_STEP = 2
+    SCROLL_FRAME_MS = 10
+    # Deslizamiento del resaltado entre filas (paso mínimo y pausa)
+    SLIDE_STEP = 2
+    SLIDE_FRAME_MS = 16
+    # Pista del scroll bar: píxeles alternados (1 x 9 MONO_HLSB; se empieza
+    # en la fila 0 o 1 según la paridad)
+    TRACK_X = 126  # Posición X a la derecha (128 - 2)
+    _TRACK = b'\x80\x00\x80\x00\x80\x00\x80\x00\x80'
 
     def __init__(self, oled):
         self.oled = oled
@@ -43,146 +54,228 @@ class MainMenu:
         # y vamos a probar dibujarlo directamente.
         self.icon_fb = framebuf.FrameBuffer(assets.CPU_ICON, 16, 16, framebuf.MONO_HLSB)
 
-    def _fill_round_rect(self, x, y, w, h, r, col):
+        # La lista completa es más alta que la pantalla: se desplaza con la
+        # línea de inicio del panel (ver viewport.py).
+        self.start_y = 5  # Padding superior (64 - 3 * 18) / 2
+        content_height = self.start_y * 2 + len(self.options) * self.item_height
+        self.viewport = Viewport(oled, self._render_rows, content_height)
+
+        # Cromo estático pre-renderizado antes del primer frame: cada fila
+        # en sus dos estados y el resaltado solo. Las páginas del viewport
+        # se arman con un blit por fila en vez de texto, icono y rectángulos.
+        self._build_rows()
+        self._highlight_y = None  # Fila de contenido del resaltado mientras se desliza
+        self._show_handle = True
+        self._bar_height = max(4, 64 // len(self.options))
+        self._bar_pos = self._bar_y()
+
+    def _fill_round_rect(self, x, y, w, h, r, col, target=None):
+        if target is None:
+            target = self.oled
         # Hand-tuned for r=4 look to be smoother on 128x64
         if r == 4:
-            self.oled.fill_rect(x + 2, y, w - 4, 1, col)
-            self.oled.fill_rect(x + 1, y + 1, w - 2, 1, col)
-            self.oled.fill_rect(x, y + 2, w, h - 4, col)
-            self.oled.fill_rect(x + 1, y + h - 2, w - 2, 1, col)
-            self.oled.fill_rect(x + 2, y + h - 1, w - 4, 1, col)
+            target.fill_rect(x + 2, y, w - 4, 1, col)
+            target.fill_rect(x + 1, y + 1, w - 2, 1, col)
+            target.fill_rect(x, y + 2, w, h - 4, col)
+            target.fill_rect(x + 1, y + h - 2, w - 2, 1, col)
+            target.fill_rect(x + 2, y + h - 1, w - 4, 1, col)
             return
 
         # Fallback for other radii
         if r <= 0:
-            self.oled.fill_rect(x, y, w, h, col)
+            target.fill_rect(x, y, w, h, col)
             return
         for dy in range(r):
             dx = int(math.floor(math.sqrt(r * r - dy * dy)))
             left = x + r - dx
             right = x + w - r + dx
-            self.oled.fill_rect(left, y + dy, right - left, 1, col)
-            self.oled.fill_rect(left, y + h - 1 - dy, right - left, 1, col)
-        self.oled.fill_rect(x, y + r, w, h - 2 * r, col)
+            target.fill_rect(left, y + dy, right - left, 1, col)
+            target.fill_rect(left, y + h - 1 - dy, right - left, 1, col)
+        target.fill_rect(x, y + r, w, h - 2 * r, col)
 
-    def draw(self):
-        self.oled.fill(0)
-        
-        # Calcular posición inicial para mostrar siempre 3 items visibles
-        # Total altura para 3 items: 3 * 18 = 54px
-        # Pantalla tiene 64px, espacio disponible: 64 - 54 = 10px
-        # Padding superior: 10 / 2 = 5px
-        start_y = 5
-        
+    def _draw_item(self, target, item_idx, x, y, selected):
+        label, _ = self.options[item_idx]
+        text_y = y + 2  # Alineación vertical
+        text_x = x + 20  # Espacio para el icono
+        if selected:
+            self._fill_round_rect(x, y, self.menu_width, self.item_height, 4, 1, target)
+            fonts.draw_text(target, label, text_x, text_y, font_data=fonts.FONT_BOLD, color=0)
+            # Icono en negro sobre el resaltado: se apagan los píxeles en 0
+            # del asset (lo que antes hacía blit con key=1)
+            if not blitter.blit(target, assets.CPU_ICON, 16, 16, x + 4, y + 2,
+                                blitter.CLEAR, invert=True):
+                if hasattr(target, 'mark_dirty'):
+                    target.blit(self.icon_fb, x + 4, y + 2, 1, w=16, h=16)
+                else:
+                    target.blit(self.icon_fb, x + 4, y + 2, 1)
+        else:
+            # No seleccionado - usar FONT_REGULAR para consistencia visual
+            fonts.draw_text(target, label, text_x, text_y, font_data=fonts.FONT_REGULAR, color=1)
+
+    def _build_rows(self):
+        # Bitmaps MONO_HLSB de menu_width x item_height: [normal, seleccionada]
+        # por opción, y el resaltado (rectángulo redondeado) para deslizarlo
+        w = self.menu_width
+        h = self.item_height
+        size = ((w + 7) >> 3) * h
+        self._rows = []
+        for item_idx in range(len(self.options)):
+            states = []
+            for selected in (False, True):
+                buf = bytearray(size)
+                fb = framebuf.FrameBuffer(buf, w, h, framebuf.MONO_HLSB)
+                self._draw_item(fb, item_idx, 0, 0, selected)
+                states.append(buf)
+            self._rows.append(states)
+        self._highlight = bytearray(size)
+        fb = framebuf.FrameBuffer(self._highlight, w, h, framebuf.MONO_HLSB)
+        self._fill_round_rect(0, 0, w, h, 4, 1, fb)
+
+    def _render_rows(self, fb, y):
+        # Callback del viewport: dibuja en fb (una página) las filas de
+        # contenido y..y+7 de la lista completa.
+        w = self.menu_width
+        h = self.item_height
+        sliding = self._highlight_y is not None
+        for item_idx in range(len(self.options)):
+            item_y = self.start_y + item_idx * h - y
+            if item_y >= 8 or item_y + h <= 0:
+                continue
+            state = 1 if item_idx == self.selected_index and not sliding else 0
+            blitter.blit(fb, self._rows[item_idx][state], w, h, self.menu_x, item_y, blitter.COPY)
+        if sliding:
+            # El resaltado en camino invierte lo que tapa de las filas normales
+            blitter.blit(fb, self._highlight, w, h, self.menu_x, self._highlight_y - y, blitter.XOR)
+        # Pista del scroll bar en las filas pares de pantalla (el
+        # desplazamiento siempre es par, así que coincide con el contenido)
+        blitter.blit(fb, self._TRACK, 1, 8, self.TRACK_X, 0, blitter.OR, offset=y & 1)
+        if self._show_handle:
+            # Barra (handle) de 3px centrada en la pista, fija en pantalla:
+            # la fila 0 de fb es la fila de pantalla y - viewport.y
+            top = self._bar_pos - (y - self.viewport.y)
+            fb.fill_rect(self.TRACK_X - 1, top, 3, self._bar_height, 1)
+
+    def _bar_y(self):
+        return int((self.selected_index / max(1, len(self.options) - 1)) * (64 - self._bar_height))
+
+    def _display_start(self):
         # Calcular qué items mostrar basándose en el índice seleccionado
         # Siempre mostrar 3 items: intentar centrar el seleccionado si es posible
         if len(self.options) <= self.visible_items:
             # Si hay 3 o menos items, mostrar todos desde el inicio
-            display_start = 0
-        else:
-            # Si hay más de 3 items, centrar el seleccionado cuando sea posible
-            # El seleccionado debería estar en la posición media (índice 1 de los 3 visibles)
-            display_start = max(0, self.selected_index - 1)
-            # Asegurar que no se salga del rango
-            display_start = min(display_start, len(self.options) - self.visible_items)
-        
-        # Dibujar los 3 items visibles
-        for display_idx in range(self.visible_items):
-            item_idx = display_start + display_idx
-            
-            # Si no hay más items, no dibujar
-            if item_idx >= len(self.options):
-                break
-            
-            label, _ = self.options[item_idx]
-            y = start_y + (display_idx * self.item_height)
-            
-            # Si es el seleccionado
-            if item_idx == self.selected_index:
-                self._fill_round_rect(self.menu_x, y, self.menu_width, self.item_height, 4, 1)
-                text_y = y + 2  # Alineación vertical
-                text_x = self.menu_x + 20  # Espacio para el icono
-                fonts.draw(self.oled, label, text_x, text_y, font_data=fonts.FONT_BOLD, color=0)
-                self.oled.blit(self.icon_fb, self.menu_x + 4, y + 2, 1)
-                
-            else:
-                # No seleccionado - usar FONT_REGULAR para consistencia visual
-                text_y = y + 2  # Misma alineación vertical que el seleccionado
-                text_x = self.menu_x + 20  # Mismo offset que el seleccionado
-                fonts.draw(self.oled, label, text_x, text_y, font_data=fonts.FONT_REGULAR, color=1)
-        
-        # Scroll Bar (Derecha) - patrón de píxeles alternados
-        bar_height = max(4, 64 // len(self.options))
-        bar_y = int((self.selected_index / max(1, len(self.options) - 1)) * (64 - bar_height))
-        
-        # Scroll bar a la derecha
-        scroll_bar_x = 126  # Posición X a la derecha (128 - 2)
-        
-        # Dibujar pista con patrón de píxeles alternados (on/off)
-        # Patrón: un píxel on, un píxel off
-        for y_pos in range(0, 64):
-            if y_pos % 2 == 0:  # Píxeles pares: on
-                self.oled.pixel(scroll_bar_x, y_pos, 1)
-            # Píxeles impares: off (ya está en 0 por el fill(0))
-        
-        # Dibujar barra (handle) centrada horizontalmente en la pista
-        # La barra es un rectángulo sólido de 3px de ancho centrado
-        bar_width = 3
-        bar_x = scroll_bar_x - (bar_width // 2)  # Centrar la barra en la pista
-        self.oled.fill_rect(bar_x, bar_y, bar_width, bar_height, 1)
-        
+            return 0
+        # Si hay más de 3 items, centrar el seleccionado cuando sea posible
+        # El seleccionado debería estar en la posición media (índice 1 de los 3 visibles)
+        display_start = max(0, self.selected_index - 1)
+        # Asegurar que no se salga del rango
+        return min(display_start, len(self.options) - self.visible_items)
+
+    async def draw(self, previous=None):
+        # previous: índice seleccionado antes (None = dibujar todo)
+        vp = self.viewport
+        if previous is None:
+            self._bar_pos = self._bar_y()
+            vp.redraw()
+            return
+
+        target_y = self._display_start() * self.item_height
+        old_bar = self._bar_pos
+        if vp.y != target_y:
+            # La barra está fija en pantalla pero el anillo se desplaza: se
+            # esconde mientras la lista se desliza y después se redibuja.
+            self._show_handle = False
+            vp.redraw_rows(old_bar, self._bar_height, show=False)
+            old_bar = None
+            # Deslizar la lista píxel a píxel: cada paso es un comando de
+            # línea de inicio más la página que queda expuesta.
+            clock = FrameClock(1000 // self.SCROLL_FRAME_MS)
+            while vp.y != target_y:
+                step = min(self.SCROLL_STEP * await clock.tick(), abs(target_y - vp.y))
+                vp.scroll_by(step if target_y > vp.y else -step)
+            self._show_handle = True
+
+        # Scroll bar: antes del deslizamiento se restaura la pista donde
+        # estaba y se dibuja la barra nueva entera, así se ve en todos los
+        # pasos (el primero la manda a la pantalla junto con el resaltado)
+        self._bar_pos = self._bar_y()
+        if old_bar is not None and old_bar != self._bar_pos:
+            vp.redraw_rows(old_bar, self._bar_height, show=False)
+        vp.redraw_rows(self._bar_pos, self._bar_height, show=False)
+        await self._slide(previous)
         self.oled.show()
 
-    def run(self, button_up_down, button_select):
+    async def _slide(self, previous):
+        # Lleva el resaltado de la fila previous a la seleccionada. Cada
+        # paso redibuja sólo las páginas entre la posición vieja y la nueva.
+        vp = self.viewport
+        h = self.item_height
+        y = self.start_y + previous * h
+        end = self.start_y + self.selected_index * h
+        self._highlight_y = y
+        clock = FrameClock(1000 // self.SLIDE_FRAME_MS)
+        while y != end:
+            # Más rápido al principio de un salto largo, frena al llegar
+            dist = abs(end - y)
+            step = min(max(self.SLIDE_STEP, dist >> 2) * await clock.tick(), dist)
+            last = y
+            y += step if end > y else -step
+            self._highlight_y = y
+            vp.redraw_rows(min(last, y) - vp.y, step + h)
+        # Ya en su fila: el resaltado vuelve a ser el bitmap de la fila
+        # seleccionada (bold e icono)
+        self._highlight_y = None
+        vp.redraw_rows(end - vp.y, h, show=False)
+
+    async def run(self, button_up_down, button_select):
         """
         Bucle principal del menú
-        button_up_down (A): Click = Bajar, Long Press = Subir
-        button_select (B): Click = Aceptar
+        button_up_down (A): Click = Bajar, Long Press = Subir (y repite
+        mientras se mantiene)
+        button_select (B): Apretar = Aceptar
         """
         last_selected_index = -1
         needs_redraw = True
+        # Al entrar, posicionar la lista sin animación
+        self.viewport.y = self._display_start() * self.item_height
+        # Gestos desde la IRQ de los botones; lo que quedó de la escena
+        # anterior (p.ej. el botón todavía apretado) se descarta
+        keys = buttons.of(button_up_down)
+        nav = keys.index(button_up_down)
+        select = keys.index(button_select)
+        keys.clear()
         
         while True:
             # Solo redibujar si hay cambios o es la primera vez
             if needs_redraw or self.selected_index != last_selected_index:
-                self.draw()
+                await self.draw(last_selected_index if last_selected_index >= 0 else None)
                 last_selected_index = self.selected_index
                 needs_redraw = False
             
-            # --- Botón A (Navegación) ---
-            if button_up_down.value() == 0: # Presionado
-                press_start = time.ticks_ms()
+            for button, kind in keys.events():
+                # --- Botón A (Navegación) ---
+                if button == nav:
+                    if kind == buttons.CLICK:
+                        # Acción: Bajar (Siguiente)
+                        print("Button A Short: DOWN")
+                        sound_manager.sfx(sound_manager.SFX_CLICK)
+                        self.selected_index = (self.selected_index + 1) % len(self.options)
+                        needs_redraw = True
+                    elif kind == buttons.LONG or kind == buttons.REPEAT:
+                        # Acción: Subir (Anterior)
+                        print("Button A Long: UP")
+                        sound_manager.sfx(sound_manager.SFX_CLICK)
+                        self.selected_index = (self.selected_index - 1) % len(self.options)
+                        needs_redraw = True
                 
-                # Esperar a que suelte o supere umbral de "largo"
-                long_press = False
-                while button_up_down.value() == 0:
-                    if time.ticks_diff(time.ticks_ms(), press_start) > self.LONG_PRESS_MS:
-                        long_press = True
-                        break
-                    time.sleep_ms(10)
-                
-                if long_press:
-                    # Acción: Subir (Anterior)
-                    print("Button A Long: UP")
-                    self.selected_index = (self.selected_index - 1) % len(self.options)
-                    needs_redraw = True
-                    
-                    # Esperar a que suelte
-                    while button_up_down.value() == 0:
-                        time.sleep_ms(50)
-                else:
-                    # Acción: Bajar (Siguiente)
-                    print("Button A Short: DOWN")
-                    self.selected_index = (self.selected_index + 1) % len(self.options)
-                    needs_redraw = True
-            
-            # --- Botón B (Selección) ---
-            if button_select.value() == 0: # Presionado
-                print("Button B: SELECT")
-                # Debounce simple
-                while button_select.value() == 0:
-                    time.sleep_ms(50)
-                return self.options[self.selected_index][1]
+                # --- Botón B (Selección) ---
+                elif button == select and kind == buttons.PRESS:
+                    print("Button B: SELECT")
+                    sound_manager.sfx(sound_manager.SFX_CONFIRM)
+                    # Las escenas siguientes dibujan con la línea de inicio en 0
+                    self.viewport.release()
+                    return self.options[self.selected_index][1]
             
-            # Aumentar el sleep para dar más tiempo al hilo de música
-            time.sleep_ms(50)
+            # Dormir hasta el próximo evento de botones (la música y el
+            # engine siguen en sus tareas)
+            if not needs_redraw:
+                await runtime.wait_input()
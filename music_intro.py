@@ -1,48 +1,33 @@
+# music_intro.py
+# Convertido con scripts/music_gen.py --convert desde la versión anterior
+# de este módulo (ajustada a mano; no sale del .mid de assets/):
+# 32 notas, 6848 ms.
+# PIECE da (frecuencia, ms) desde EVENTS, pares (índice en FREQS, ms) en
+# uint16 little-endian con los tempos ya resueltos: sin una tupla por nota.
+
+from assets import Piece
+
 NOTES = {
     'SILENCE': 0,
-    'F4': 349,
-    'G4': 392,
-    'Gb4': 415,
+    'Ab4': 466,
     'C5': 523,
-    'F5': 698,
     'Db4': 311,
-    'Fb4': 370,
-    'Ab4': 466,
     'Db5': 622,
+    'F4': 349,
+    'F5': 698,
+    'Fb4': 370,
+    'G4': 392,
+    'Gb4': 415,
 }
-TEMPO = 429
-SUBDIV = 480
-PIECE = [
-    (NOTES['F4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['G4'], 214),
-    (NOTES['Gb4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['C5'], 214),
-    (NOTES['Gb4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['G4'], 214),
-    (NOTES['Gb4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['C5'], 214),
-    (NOTES['F5'], 214),
-    (NOTES['C5'], 214),
-    (NOTES['Db4'], 214),
-    (NOTES['Db4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['Fb4'], 214),
-    (NOTES['Db4'], 214),
-    (NOTES['Db4'], 214),
-    (NOTES['Ab4'], 214),
-    (NOTES['Fb4'], 214),
-    (NOTES['Db4'], 214),
-    (NOTES['Db4'], 214),
-    (NOTES['F4'], 214),
-    (NOTES['Fb4'], 214),
-    (NOTES['Db5'], 214),
-    (NOTES['Ab4'], 214),
-    (NOTES['Fb4'], 214),
-    (NOTES['Db4'], 214),
-]
+FREQS = (0, 466, 523, 311, 622, 349, 698, 370, 392, 415,)
+EVENTS = (
+    b'\x05\x00\xd6\x00\x05\x00\xd6\x00\x08\x00\xd6\x00\x09\x00\xd6\x00'
+    b'\x05\x00\xd6\x00\x05\x00\xd6\x00\x02\x00\xd6\x00\x09\x00\xd6\x00'
+    b'\x05\x00\xd6\x00\x05\x00\xd6\x00\x08\x00\xd6\x00\x09\x00\xd6\x00'
+    b'\x05\x00\xd6\x00\x02\x00\xd6\x00\x06\x00\xd6\x00\x02\x00\xd6\x00'
+    b'\x03\x00\xd6\x00\x03\x00\xd6\x00\x05\x00\xd6\x00\x07\x00\xd6\x00'
+    b'\x03\x00\xd6\x00\x03\x00\xd6\x00\x01\x00\xd6\x00\x07\x00\xd6\x00'
+    b'\x03\x00\xd6\x00\x03\x00\xd6\x00\x05\x00\xd6\x00\x07\x00\xd6\x00'
+    b'\x04\x00\xd6\x00\x01\x00\xd6\x00\x07\x00\xd6\x00\x03\x00\xd6\x00'
+)
+PIECE = Piece(FREQS, EVENTS)
@@ -1,29 +1,452 @@
 # renderer.py
 # Propósito: La "Vista". Sabe cómo dibujar las pantallas. Tiene funciones como draw_hq_screen(), draw_log_entry(), draw_combat_anim(). Combina los sprites con el texto.
 
+import sys
 import framebuf
 import assets
+import blitter
+
+_KEYFRAME = 0x01  # Flag del primer byte de un chunk DELTA_RLE
+
+if sys.implementation.name == 'micropython':
+    import micropython
+
+    @micropython.viper
+    def _apply_delta(dst, src, extents, width: int) -> int:
+        # Aplica los tokens de un chunk DELTA_RLE (ver
+        # scripts/generate_animation.py) con XOR sobre dst. Anota en extents
+        # la primera y última columna tocada de cada página y devuelve la
+        # máscara de páginas cambiadas.
+        d = ptr8(dst)
+        s = ptr8(src)
+        e = ptr8(extents)
+        n = int(len(src))
+        i = 1
+        pos = 0
+        mask = 0
+        while i < n:
+            op = s[i]
+            i += 1
+            if op < 0x80:
+                pos += op + 1
+                continue
+            count = (op & 0x3f) + 1
+            page = pos // width
+            col = pos - page * width
+            if e[page * 2] > col:
+                e[page * 2] = col
+            if e[page * 2 + 1] < col + count - 1:
+                e[page * 2 + 1] = col + count - 1
+            mask |= 1 << page
+            end = pos + count
+            if op >= 0xC0:
+                v = s[i]
+                i += 1
+                while pos < end:
+                    d[pos] = d[pos] ^ v
+                    pos += 1
+            else:
+                while pos < end:
+                    d[pos] = d[pos] ^ s[i]
+                    i += 1
+                    pos += 1
+        return mask
+else:
+    def _apply_delta(dst, src, extents, width):
+        n = len(src)
+        i = 1
+        pos = 0
+        mask = 0
+        while i < n:
+            op = src[i]
+            i += 1
+            if op < 0x80:
+                pos += op + 1
+                continue
+            count = (op & 0x3f) + 1
+            page = pos // width
+            col = pos - page * width
+            if extents[page * 2] > col:
+                extents[page * 2] = col
+            if extents[page * 2 + 1] < col + count - 1:
+                extents[page * 2 + 1] = col + count - 1
+            mask |= 1 << page
+            if op >= 0xC0:
+                v = src[i]
+                i += 1
+                for k in range(pos, pos + count):
+                    dst[k] ^= v
+            else:
+                for k in range(pos, pos + count):
+                    dst[k] ^= src[i]
+                    i += 1
+            pos += count
+        return mask
+
+
+class DeltaAnimation:
+    """
+    Reproduce una animación DELTA_RLE directo sobre el buffer MONO_VLSB del
+    destino (SSD1306 o Canvas): cada frame es un XOR contra el anterior, así
+    que el destino tiene que seguir mostrando el último frame dibujado. Si
+    se dibujó otra cosa encima, llamar a reset() para arrancar de un
+    keyframe. Saltar frames (escena atrasada) o volver al principio se
+    resuelve con el camino más corto: seguir aplicando deltas o arrancar del
+    keyframe anterior.
+    """
+
+    def __init__(self, chunks, loop, width, height):
+        self.chunks = chunks
+        self.loop = loop
+        self.width = width
+        self.pages = height // 8
+        self.keyframes = [i for i, c in enumerate(chunks) if c[0] & _KEYFRAME]
+        # Por página, primera y última columna: lo que cambió en este draw()
+        # y lo que ocupa el frame en pantalla (para borrar sólo eso en un
+        # keyframe)
+        self.extents = bytearray(self.pages * 2)
+        self.content = bytearray(self.pages * 2)
+        self.full = False  # El último draw() tuvo que borrar toda la pantalla
+        self.pos = -1
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def reset(self):
+        self.pos = -1
+
+    def _steps(self, idx):
+        # Deltas a aplicar para llegar a idx desde el frame actual
+        pos = self.pos
+        n = len(self.chunks)
+        if pos < 0:
+            return n + 1
+        if idx > pos:
+            return idx - pos
+        if self.loop is None:
+            return n + 1
+        return n - pos + idx
+
+    def _empty(self, ext):
+        for p in range(self.pages):
+            ext[p * 2] = 0xff
+            ext[p * 2 + 1] = 0
+
+    def _union(self, dst, src):
+        for i in range(0, self.pages * 2, 2):
+            if src[i] < dst[i]:
+                dst[i] = src[i]
+            if src[i + 1] > dst[i + 1]:
+                dst[i + 1] = src[i + 1]
+
+    def _apply(self, target, buf, chunk, known):
+        ext = self.extents
+        content = self.content
+        if chunk[0] & _KEYFRAME:
+            # Un keyframe va sobre negro: se borra lo que ocupaba el frame
+            # anterior, o toda la pantalla si no se sabe qué hay
+            if known:
+                for p in range(self.pages):
+                    lo = content[p * 2]
+                    hi = content[p * 2 + 1]
+                    if lo <= hi:
+                        target.fill_rect(lo, p * 8, hi - lo + 1, 8, 0)
+                self._union(ext, content)
+            else:
+                target.fill(0)
+                self.full = True
+            self._empty(content)
+            _apply_delta(buf, chunk, content, self.width)
+            self._union(ext, content)
+        else:
+            _apply_delta(buf, chunk, ext, self.width)
+            self._union(content, ext)
+
+    def draw(self, target, idx):
+        """
+        Deja el frame idx en el destino y marca sucio sólo lo que cambió.
+        Devuelve la máscara de páginas cambiadas (bit p = página p).
+        """
+        chunks = self.chunks
+        n = len(chunks)
+        idx %= n
+        if idx == self.pos:
+            return 0
+        buf = blitter.surface(target)[0]
+        ext = self.extents
+        self._empty(ext)
+        self.full = False
+
+        key = 0
+        for k in self.keyframes:
+            if k > idx:
+                break
+            key = k
+        if self._steps(idx) <= idx - key + 1:
+            pos = self.pos
+            while pos != idx:
+                if pos == n - 1:
+                    pos = 0
+                    self._apply(target, buf, self.loop, True)
+                else:
+                    pos += 1
+                    self._apply(target, buf, chunks[pos], True)
+        else:
+            known = self.pos >= 0
+            for pos in range(key, idx + 1):
+                self._apply(target, buf, chunks[pos], known)
+                known = True
+        self.pos = idx
+
+        if self.full:
+            # fill(0) ya marcó toda la pantalla
+            return (1 << self.pages) - 1
+        mask = 0
+        mark_dirty = getattr(target, 'mark_dirty', None)
+        for p in range(self.pages):
+            lo = ext[p * 2]
+            hi = ext[p * 2 + 1]
+            if lo <= hi:
+                mask |= 1 << p
+                if mark_dirty is not None:
+                    mark_dirty(lo, p * 8, hi - lo + 1, 8)
+        return mask
+
+
+class Sprite:
+    """
+    Bitmap MONO_HLSB con posición, orden (z) y transparencia para el
+    Compositor. key es como en framebuf.blit: -1 opaco, 0 deja ver lo de
+    abajo donde el bitmap vale 0, 1 donde vale 1. Con mask (MONO_HLSB del
+    mismo tamaño, 1 = tapa) se dibuja como blitter.blit_masked. Se cambia con
+    move_to()/set_image()/set_visible()/set_z() para que el compositor sepa
+    qué redibujar.
+    """
+
+    def __init__(self, data, w, h, x=0, y=0, z=0, key=-1, mask=None):
+        self.data = data
+        self.w = w
+        self.h = h
+        self.x = x
+        self.y = y
+        self.z = z
+        self.key = key
+        self.mask = mask
+        self.visible = True
+        self.stage = None
+
+    def _touch(self):
+        if self.stage is not None and self.visible:
+            self.stage.touch(self.x, self.y, self.w, self.h)
+
+    def move_to(self, x, y):
+        if x == self.x and y == self.y:
+            return
+        self._touch()
+        self.x = x
+        self.y = y
+        self._touch()
+
+    def set_image(self, data, w=None, h=None, mask=None):
+        self._touch()
+        self.data = data
+        self.mask = mask
+        if w is not None:
+            self.w = w
+            self.h = h
+        self._touch()
+
+    def set_visible(self, visible):
+        if visible == self.visible:
+            return
+        self._touch()
+        self.visible = visible
+        self._touch()
+
+    def set_z(self, z):
+        self.z = z
+        if self.stage is not None:
+            self.stage.sprites.remove(self)
+            self.stage._insert(self)
+        self._touch()
+
+    def draw(self, buf, dst_w, dst_h):
+        x = self.x
+        y = self.y
+        if self.mask is not None:
+            blitter.blit_buffer(buf, dst_w, dst_h, self.mask, self.w, self.h, x, y, blitter.CLEAR)
+            blitter.blit_buffer(buf, dst_w, dst_h, self.data, self.w, self.h, x, y, blitter.OR)
+        elif self.key == 0:
+            blitter.blit_buffer(buf, dst_w, dst_h, self.data, self.w, self.h, x, y, blitter.OR)
+        elif self.key == 1:
+            blitter.blit_buffer(buf, dst_w, dst_h, self.data, self.w, self.h, x, y, blitter.CLEAR, True)
+        else:
+            blitter.blit_buffer(buf, dst_w, dst_h, self.data, self.w, self.h, x, y, blitter.COPY)
+
+
+class Compositor:
+    """
+    Escena en modo retenido: un fondo fijo (pantalla MONO_VLSB completa, o
+    negro) y sprites encima por orden de z. Cuando un sprite se mueve o
+    cambia se anota la unión de su rectángulo viejo y el nuevo; render()
+    restaura el fondo sólo ahí (por página, de la primera a la última
+    columna tocada), redibuja los sprites recortados a esa zona y marca
+    sucio sólo eso para el próximo show(). Las escenas sólo mueven sprites.
+    """
+
+    def __init__(self, oled, background=None):
+        self.oled = oled
+        self.width = oled.width
+        self.height = oled.height
+        self.pages = oled.height // 8
+        self.sprites = []
+        self.extents = bytearray(self.pages * 2)
+        self._zeros = memoryview(bytes(self.width))
+        self.canvas = None
+        if blitter.surface(oled) is None:
+            self.canvas = blitter.Canvas(bytearray(self.width * self.pages), self.width, self.height)
+        self.set_background(background)
+
+    def set_background(self, background):
+        self.background = memoryview(background) if background is not None else None
+        self.invalidate()
+
+    def add(self, sprite):
+        sprite.stage = self
+        self._insert(sprite)
+        sprite._touch()
+        return sprite
+
+    def remove(self, sprite):
+        sprite._touch()
+        self.sprites.remove(sprite)
+        sprite.stage = None
+
+    def _insert(self, sprite):
+        # Después de los de igual z: a igual z, el último agregado va arriba
+        i = len(self.sprites)
+        while i > 0 and self.sprites[i - 1].z > sprite.z:
+            i -= 1
+        self.sprites.insert(i, sprite)
+
+    def touch(self, x, y, w, h):
+        # Anota un rectángulo de pantalla para redibujar en el próximo render()
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w) - 1
+        y1 = min(self.height, y + h) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        ext = self.extents
+        for p in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < ext[p * 2]:
+                ext[p * 2] = x0
+            if x1 > ext[p * 2 + 1]:
+                ext[p * 2 + 1] = x1
+
+    def invalidate(self):
+        ext = self.extents
+        for p in range(self.pages):
+            ext[p * 2] = 0
+            ext[p * 2 + 1] = self.width - 1
+
+    def render(self):
+        """
+        Redibuja lo anotado desde el último render() y lo marca sucio.
+        Devuelve la máscara de páginas redibujadas (0 si no había nada).
+        """
+        target = self.oled if self.canvas is None else self.canvas
+        buf = blitter.surface(target)[0]
+        w = self.width
+        h = self.height
+        bg = self.background
+        ext = self.extents
+        mask = 0
+        for p in range(self.pages):
+            lo = ext[p * 2]
+            hi = ext[p * 2 + 1]
+            if lo > hi:
+                continue
+            mask |= 1 << p
+            a = p * w + lo
+            b = p * w + hi + 1
+            if bg is not None:
+                buf[a:b] = bg[a:b]
+            else:
+                buf[a:b] = self._zeros[lo:hi + 1]
+            top = p * 8
+            blitter.set_clip(lo, top, hi - lo + 1, 8)
+            for s in self.sprites:
+                if (s.visible and s.x <= hi and s.x + s.w > lo
+                        and s.y < top + 8 and s.y + s.h > top):
+                    s.draw(buf, w, h)
+            ext[p * 2] = 0xff
+            ext[p * 2 + 1] = 0
+            if self.canvas is None:
+                self.oled.mark_dirty(lo, top, hi - lo + 1, 8)
+        blitter.reset_clip()
+        if mask and self.canvas is not None:
+            self.oled.blit(self.canvas, 0, 0)
+        return mask
+
 
 class Renderer:
     def __init__(self, oled):
         self.oled = oled
         self.anim_fb = []
+        self.anim = None
         self._load_assets()
-        
+
     def _load_assets(self):
+        if assets.WALK_ANIMATION_ENCODING == 'DELTA_RLE':
+            # Frames comprimidos: se decodifican sobre el buffer del display,
+            # o sobre un Canvas propio si el destino no lo deja ver
+            self.anim = DeltaAnimation(assets.WALK_ANIMATION, assets.WALK_ANIMATION_LOOP, 128, 64)
+            self.canvas = None
+            if blitter.surface(self.oled) is None:
+                self.canvas = blitter.Canvas(bytearray(128 * 8), 128, 64)
+            return
         # Convertimos cada bytearray de nuestros assets en un objeto de imagen
+        # (sólo se usan si no se puede copiar el frame directo al buffer)
+        self.anim_vlsb = assets.WALK_ANIMATION_FORMAT == 'MONO_VLSB'
+        fmt = framebuf.MONO_VLSB if self.anim_vlsb else framebuf.MONO_HLSB
         for frame_data in assets.WALK_ANIMATION:
-            fb = framebuf.FrameBuffer(frame_data, 128, 64, framebuf.MONO_HLSB)
+            fb = framebuf.FrameBuffer(frame_data, 128, 64, fmt)
             self.anim_fb.append(fb)
-            
-    def draw_walk_frame(self, frame_index):
+
+    def draw_walk_frame(self, frame_index, show=True):
+        # Devuelve la máscara de páginas que cambiaron (todas si no se sabe)
+        if self.anim is not None:
+            if self.canvas is None:
+                changed = self.anim.draw(self.oled, frame_index)
+            else:
+                changed = self.anim.draw(self.canvas, frame_index)
+                self.oled.blit(self.canvas, 0, 0)
+            if show:
+                self.oled.show()
+            return changed
+
         # Aseguramos que el índice esté dentro del rango
         idx = frame_index % len(self.anim_fb)
-        frame_a_dibujar = self.anim_fb[idx]
-        
-        self.oled.fill(0)
-        self.oled.blit(frame_a_dibujar, 0, 0)
-        self.oled.show()
-        
+
+        # Los frames VLSB ya tienen el layout del SSD1306: se copian enteros
+        # (1 KB) en vez de blitear píxel a píxel, y tapan toda la pantalla
+        if not (self.anim_vlsb and blitter.copy_frame(self.oled, assets.WALK_ANIMATION[idx])):
+            self.oled.fill(0)
+            if hasattr(self.oled, 'mark_dirty'):
+                self.oled.blit(self.anim_fb[idx], 0, 0, w=128, h=64)
+            else:
+                self.oled.blit(self.anim_fb[idx], 0, 0)
+        if show:
+            self.oled.show()
+        return 0xff
+
+    def reset_walk(self):
+        # Llamar si se dibujó otra cosa sobre la animación
+        if self.anim is not None:
+            self.anim.reset()
+
     def get_frame_count(self):
+        if self.anim is not None:
+            return len(self.anim)
         return len(self.anim_fb)
@@ -0,0 +1,126 @@
+# runtime.py
+# Propósito: Runtime cooperativo sobre asyncio. Cada escena es una corrutina y al lado corren tareas propias para el render (show), la entrada (botones), la música y los ticks del engine. Las esperas largas son `await runtime.sleep_ms(...)`: mientras tanto corren las otras tareas o la CPU queda libre, en vez de bloquear todo con time.sleep.
+#
+# main.py hace:
+#
+#     runtime.start(oled)
+#     runtime.spawn(sound_manager.play_music(buzzer))
+#     runtime.every(config.ENGINE_TICK_MS, engine.update)
+#     runtime.run(main())
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+import time
+import buttons
+import config
+
+sleep_ms = asyncio.sleep_ms
+Event = asyncio.Event
+
+_oled = None
+_frame = asyncio.Event()  # Una escena terminó de dibujar un frame
+_input = asyncio.Event()  # Llegaron eventos de botones
+_pending = []             # Tareas pedidas antes de run()
+_running = False
+tasks = []
+
+
+def start(oled):
+    # Registra el display y las tareas de render y de entrada
+    global _oled
+    _oled = oled
+    spawn(_render_task())
+    spawn(_input_task())
+
+
+def spawn(coro):
+    # Agrega una tarea; antes de run() queda en espera hasta que arranque el loop
+    if _running:
+        task = asyncio.create_task(coro)
+        tasks.append(task)
+        return task
+    _pending.append(coro)
+    return None
+
+
+def every(period_ms, func):
+    # Tarea que llama func(now_ms) cada period_ms (p.ej. el engine)
+    async def periodic():
+        deadline = time.ticks_ms()
+        while True:
+            func(deadline)
+            deadline = time.ticks_add(deadline, period_ms)
+            wait = time.ticks_diff(deadline, time.ticks_ms())
+            if wait < 0:
+                # Atrasados: se pierde ese tiempo en vez de encadenar ticks
+                deadline = time.ticks_ms()
+                wait = 0
+            await asyncio.sleep_ms(wait)
+    return spawn(periodic())
+
+
+def run(main):
+    # Corre la corrutina principal con las tareas de fondo hasta que termine
+    async def boot():
+        global _running
+        _running = True
+        while _pending:
+            spawn(_pending.pop(0))
+        return await main
+    return asyncio.run(boot())
+
+
+def present():
+    """
+    La escena terminó de dibujar: la tarea de render hace el show() la
+    próxima vez que la escena ceda (await). Dos present() seguidos sin
+    ceder salen en un solo show().
+    """
+    _frame.set()
+
+
+async def show():
+    # present() y ceder hasta que la tarea de render hizo el show(), para
+    # lo que tiene que pasar con el frame ya en pantalla
+    present()
+    await asyncio.sleep_ms(0)
+
+
+async def _render_task():
+    while True:
+        await _frame.wait()
+        _frame.clear()
+        _oled.show()
+
+
+async def _input_task():
+    # Pasa los flancos de la IRQ a eventos (antirrebote, gestos) a ritmo
+    # fijo y despierta a la escena que esté esperando en wait_input()
+    while True:
+        if buttons.poll_all():
+            _input.set()
+        await asyncio.sleep_ms(config.INPUT_TASK_MS)
+
+
+async def wait_input(timeout_ms=None):
+    """
+    Espera hasta que haya eventos de botones (keys.events() los devuelve) o
+    hasta timeout_ms. Devuelve False si se cumplió el timeout.
+    """
+    _input.clear()
+    return await wait(_input, timeout_ms)
+
+
+async def wait(event, timeout_ms=None):
+    # Espera a que se active event o a que pase timeout_ms (False si pasó)
+    if timeout_ms is None:
+        await event.wait()
+        return True
+    try:
+        await asyncio.wait_for_ms(event.wait(), timeout_ms)
+    except asyncio.TimeoutError:
+        return False
+    return True
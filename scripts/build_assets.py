@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Asset Pack Builder
+
+Packs every bitmap (asset_data.py), animation (*_animation.py) and song
+listed in assets.SOURCES into one binary file, assets.pack, with a header
+index (name, format, frames, width, height, offset, length). On the device
+assets.py reads each asset from the pack the first time it is used, so the
+source modules don't have to be copied (or parsed) at all.
+
+Usage:
+    python3 scripts/build_assets.py                 # writes ./assets.pack
+    python3 scripts/build_assets.py --out x.pack
+    python3 scripts/build_assets.py --list-sources  # modules now in the pack
+"""
+import argparse
+import os
+import re
+import struct
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+import assets
+
+ALIGN = 4  # Every entry starts on a word boundary
+
+
+def read_bitmaps(path):
+    """
+    Bitmaps of asset_data.py with the size and format of their "# Source:"
+    line: {name: (fmt, width, height, data)}.
+    """
+    namespace = {}
+    with open(path) as f:
+        source = f.read()
+    exec(source, namespace)
+
+    bitmaps = {}
+    info = None
+    for line in source.splitlines():
+        if line.startswith("# Source:"):
+            size = re.search(r"\((\d+)x(\d+)\)", line)
+            vlsb = "[MONO_VLSB]" in line
+            info = (int(size.group(1)), int(size.group(2)), vlsb) if size else None
+            continue
+        match = re.match(r"([A-Z_][A-Z0-9_]*) = bytearray", line)
+        if match and info is not None:
+            w, h, vlsb = info
+            fmt = assets.FMT_VLSB if vlsb else assets.FMT_HLSB
+            bitmaps[match.group(1)] = (fmt, w, h, bytes(namespace[match.group(1)]))
+            info = None
+    return bitmaps
+
+
+def animation_blob(frames, loop):
+    """DELTA_RLE entry: frame count, loop chunk, chunk index per frame, chunk offsets, chunks."""
+    unique = []
+    for chunk in list(frames) + ([loop] if loop is not None else []):
+        if bytes(chunk) not in unique:
+            unique.append(bytes(chunk))
+    seq = [unique.index(bytes(c)) for c in frames]
+    loop_index = unique.index(bytes(loop)) if loop is not None else 0xffff
+
+    head = 4 + 2 * len(seq) + 4 * (len(unique) + 1)
+    offsets = []
+    pos = head
+    for chunk in unique:
+        offsets.append(pos)
+        pos += len(chunk)
+    offsets.append(pos)
+
+    blob = struct.pack("<HH", len(seq), loop_index)
+    blob += struct.pack("<%dH" % len(seq), *seq)
+    blob += struct.pack("<%dI" % len(offsets), *offsets)
+    return blob + b"".join(unique)
+
+
+def song_blob(song):
+    """
+    Song entry: frequency count and note count (uint16), the frequency
+    table (uint16, index 0 = silence) and (index, ms) uint16 pairs. Modules
+    from music_gen.py already carry FREQS and EVENTS in this layout; older
+    ones (a PIECE list of (frequency, ms)) are converted here.
+    """
+    if hasattr(song, "FREQS") and hasattr(song, "EVENTS"):
+        freqs = list(song.FREQS)
+        events = bytes(song.EVENTS)
+    else:
+        silence = song.NOTES.get("SILENCE", 0)
+        freqs = [0]
+        values = []
+        for frequency, duration in song.PIECE:
+            frequency = 0 if frequency == silence else min(int(frequency), 0xffff)
+            if frequency not in freqs:
+                freqs.append(frequency)
+            duration = int(duration)
+            while duration > 0:
+                values += (freqs.index(frequency), min(duration, 0xffff))
+                duration -= 0xffff
+        events = struct.pack("<%dH" % len(values), *values)
+    header = struct.pack("<HH", len(freqs), len(events) // 4)
+    return header + struct.pack("<%dH" % len(freqs), *freqs) + events
+
+
+def collect():
+    """[(name, fmt, frames, width, height, data)] and the source modules used."""
+    entries = []
+    modules = set()
+
+    bitmaps = read_bitmaps(os.path.join(ROOT, "asset_data.py"))
+    modules.add("asset_data")
+    for name, (fmt, w, h, data) in bitmaps.items():
+        entries.append((name, fmt, 1, w, h, data))
+
+    for name, (module_name, attr) in assets.SOURCES.items():
+        if module_name == "asset_data":
+            continue
+        module = __import__(module_name)
+        modules.add(module_name)
+        if attr is None:
+            entries.append((name, assets.FMT_SONG, 1, 0, 0, song_blob(module)))
+            continue
+        frames = getattr(module, attr)
+        w = getattr(module, "WIDTH", 128)
+        h = getattr(module, "HEIGHT", 64)
+        if getattr(module, "ENCODING", "RAW") == "DELTA_RLE":
+            loop = getattr(module, attr + "_LOOP", None)
+            entries.append((name, assets.FMT_DELTA_RLE, len(frames), w, h, animation_blob(frames, loop)))
+        else:
+            fmt = assets.FMT_VLSB if getattr(module, "FORMAT", "MONO_HLSB") == "MONO_VLSB" else assets.FMT_HLSB
+            entries.append((name, fmt, len(frames), w, h, b"".join(bytes(f) for f in frames)))
+    return entries, sorted(modules)
+
+
+def build(entries):
+    header = struct.pack(assets.PACK_HEADER, assets.PACK_MAGIC, assets.PACK_VERSION, len(entries))
+    offset = assets.PACK_HEADER_SIZE + assets.PACK_ENTRY_SIZE * len(entries)
+    index = b""
+    body = b""
+    for name, fmt, frames, w, h, data in entries:
+        encoded = name.encode()
+        if len(encoded) > 16:
+            raise ValueError(f"asset name too long (16 max): {name}")
+        pad = (-offset) % ALIGN
+        body += b"\x00" * pad
+        offset += pad
+        index += struct.pack(assets.PACK_ENTRY, encoded, fmt, frames, w, h, offset, len(data))
+        body += data
+        offset += len(data)
+    return header + index + body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack bitmaps, animations and songs into assets.pack")
+    parser.add_argument("--out", default=os.path.join(ROOT, assets.PACK_FILE), help="output file")
+    parser.add_argument("--list-sources", action="store_true",
+                        help="only print the source modules that go into the pack")
+    args = parser.parse_args()
+
+    entries, modules = collect()
+    if args.list_sources:
+        print("\n".join(m + ".py" for m in modules))
+        return
+
+    pack = build(entries)
+    with open(args.out, "wb") as f:
+        f.write(pack)
+
+    names = ("HLSB", "VLSB", "DELTA", "SONG")
+    for name, fmt, frames, w, h, data in entries:
+        print(f"  {name:<16} {names[fmt]:<6} {frames:>3} x {w:>3}x{h:<3} {len(data):>6} B")
+    print(f"✓ {args.out}: {len(entries)} assets, {len(pack)} bytes")
+
+
+if __name__ == "__main__":
+    main()
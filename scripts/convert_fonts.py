@@ -9,8 +9,23 @@ from rich.prompt import Prompt
 
 # --- CONFIG ---
 OUTPUT_FILE = "fonts.py"
+FIRST_CHAR = 32
+LAST_CHAR = 126
 PREVIEW_TEXT = "ABC 123"
 
+def read_runtime():
+    """
+    Return the hand-written part of fonts.py (imports, glyph cache, draw):
+    everything above the first generated "# --- Font:" section. It is kept
+    as is when the font tables are regenerated.
+    """
+    with open(OUTPUT_FILE) as f:
+        content = f.read()
+    end = content.find("# --- Font:")
+    if end < 0:
+        raise SystemExit(f"{OUTPUT_FILE} has no font sections to keep the runtime from")
+    return content[:end].rstrip("\n")
+
 def get_char_data(font, char):
     """
     Render a character and return (width, height, bytearray_hlsb).
@@ -116,60 +131,52 @@ def generate_font_module(font_path, size, var_name):
     # ASCII range 32-126
     chars_data = {}
     
-    # We will store:
-    # FONT_NAME = {
-    #   'height': H,
-    #   'chars': {
-    #      ord('A'): (width, height, bytearray),
-    #      ...
-    #   }
-    # }
-    
     console = Console()
     console.print(f"[dim]Rendering {var_name}...[/dim]")
     
     max_h = 0
     
-    for i in range(32, 127):
+    for i in range(FIRST_CHAR, LAST_CHAR + 1):
         char = chr(i)
         w, h, data = get_char_data(font, char)
         if w > 0:
             chars_data[i] = (w, h, data)
             if h > max_h: max_h = h
             
-    # Generate Python Code
+    return pack_font(var_name, chars_data, max_h)
+
+def pack_font(var_name, chars_data, max_h):
+    """
+    Packed atlas for fonts.Font: width and height tables indexed by
+    codepoint - FIRST_CHAR (width 0 = missing glyph) and all MONO_HLSB
+    bitmaps back to back in one bytearray. Offsets are derived from the
+    sizes when the module loads, so the whole font is a handful of heap
+    objects instead of one tuple + bytearray per glyph.
+    """
+    widths = bytearray()
+    heights = bytearray()
+    blobs = []
+    for code in range(FIRST_CHAR, LAST_CHAR + 1):
+        w, h, data = chars_data.get(code, (0, 0, b""))
+        if w > 255 or h > 255:
+            raise ValueError(f"Glyph {code} is too big for the packed format ({w}x{h})")
+        widths.append(w)
+        heights.append(h)
+        if data:
+            blobs.append((code, data))
+
+    def literal(data):
+        return "b'" + "".join(f"\\x{b:02x}" for b in data) + "'"
+
     lines = []
-    lines.append(f"# Font: {os.path.basename(font_path)} ({size}px)")
-    lines.append("import framebuf")
-    lines.append("")
     lines.append(f"{var_name}_HEIGHT = {max_h}")
-    lines.append(f"{var_name} = {{}}")
-    lines.append("")
-    
-    for code, (w, h, data) in chars_data.items():
-        byte_str = "".join([f"\\x{b:02x}" for b in data])
-        lines.append(f"{var_name}[{code}] = ({w}, {h}, bytearray(b'{byte_str}'))")
-        
-    lines.append("")
-    lines.append("# --- DRAW FUNCTION ---")
-    lines.append("def draw(oled, text, x, y, font_data=None, color=1):")
-    lines.append(f"    if font_data is None: font_data = {var_name}")
-    lines.append("    cursor_x = x")
-    lines.append("    for char in text:")
-    lines.append("        code = ord(char)")
-    lines.append("        if code not in font_data: continue")
-    lines.append("        w, h, data = font_data[code]")
-    lines.append("        if h > 0:")
-    lines.append("            fb = framebuf.FrameBuffer(data, w, h, framebuf.MONO_HLSB)")
-    lines.append("            oled.blit(fb, cursor_x, y + ({var_name}_HEIGHT - h), 1) # Align bottom?")
-    lines.append("            # Actually usually align top. Let's just blit at y.")
-    lines.append("            # oled.blit(fb, cursor_x, y)")
-    lines.append("        cursor_x += w + 1")
-    lines.append("")
-    
-    # Improved Draw Function that handles the generated dictionary
-    # We'll make a generic one that gets appended
-    
+    lines.append(f"{var_name} = Font({FIRST_CHAR}, {var_name}_HEIGHT,")
+    lines.append(f"    {literal(widths)},")
+    lines.append(f"    {literal(heights)},")
+    lines.append("    bytearray(")
+    for code, data in blobs:
+        lines.append(f"        {literal(data)}  # {chr(code)!r}")
+    lines.append("    ))")
     return "\n".join(lines)
 
 def main():
@@ -196,98 +203,11 @@ def main():
         # size = int(Prompt.ask("Font Size for ALL (px)", default="10"))
         
         # We wipe the file first
+        runtime = read_runtime()
         with open(OUTPUT_FILE, "w") as f:
-            f.write("import framebuf\n\n")
-            
-            # Add generic draw function immediately
-            f.write("""
-def draw(oled, text, x, y, font_data=None, color=1):
-    # Default to FONT_REGULAR if available and font_data is None
-    if font_data is None:
-        if 'FONT_REGULAR' in globals():
-            font_data = FONT_REGULAR
-        else:
-            return # No font to draw
-            
-    cursor_x = x
-    for char in text:
-        code = ord(char)
-        if code not in font_data: 
-            cursor_x += 4 # Default spacing for missing char
-            continue
-        w, h, data = font_data[code]
-        if h > 0 and len(data) > 0:
-            # Invert data if color=0 (Black on White)
-            # But data is read-only bytes usually.
-            # We can invert at blit time? SSD1306 doesn't support key=1 for inverted blit easily
-            # without changing the buffer.
-            # Better: Create a temporary mutable bytearray if needed?
-            # Or pre-generate inverted fonts? No, waste of space.
-            # SSD1306 FrameBuffer operations:
-            # blit(fbuf, x, y, key)
-            # If key is specified, pixels matching key are transparent.
-            
-            # If we want BLACK text (color=0) on WHITE background:
-            # The font bitmap has 1s where the character is.
-            # If we blit with color=0, we want to clear pixels?
-            # FrameBuffer.blit doesn't have 'color' param, it just copies bits.
-            # It copies 1s as 1s (White).
-            
-            # To draw BLACK text, we need to use a different raster operation (XOR, OR, AND, NOT).
-            # MicroPython standard framebuf only supports simple copy with transparency key.
-            
-            # Workaround for BLACK text (color=0):
-            # We need to invert the source bytes before blitting?
-            # Or draw a white box and then XOR? framebuf doesn't do XOR easily.
-            
-            # BUT: We are drawing on a white background (already filled).
-            # So we need to clear pixels where the font has 1s.
-            # This means we need 0s where font has 1s.
-            # Since we can't change the operation mode of blit, we have to invert the buffer manually.
-            
-            if color == 0:
-                # Invert bytes on the fly
-                inv_data = bytearray([~b & 0xFF for b in data])
-                fb = framebuf.FrameBuffer(inv_data, w, h, framebuf.MONO_HLSB)
-                # We want to draw '0's (Black) where text is.
-                # But blit copies 1s.
-                # If we have inverted data, we have 1s where background is.
-                # If we blit that, we draw white background and keep holes?
-                # No, that overwrites background.
-                
-                # Wait, SSD1306 driver usually maps 1->On, 0->Off.
-                # If background is White (1), we want to set pixels to 0.
-                # There is no "clear bits" blit in standard MicroPython framebuf.
-                
-                # SLOW BUT WORKING FALLBACK for color=0:
-                # Iterate pixels? No too slow.
-                
-                # TRICK: Use 'key' for transparency.
-                # If we invert the image:
-                # Original: Text=1, Bg=0.
-                # Inverted: Text=0, Bg=1.
-                # If we blit Inverted with key=1 (White is transparent):
-                # We copy only the 0s? No, key makes the MATCHING color transparent.
-                # So if key=1, 1s are skipped. 0s are copied.
-                # 0s are Black.
-                # So if we invert the font (Text=0, Bg=1) and blit with key=1:
-                # The Bg (1) is transparent.
-                # The Text (0) is copied (as Black).
-                # THIS IS THE WAY!
-                
-                # Let's implement this trick.
-                inv_data = bytearray([~b & 0xFF for b in data])
-                fb = framebuf.FrameBuffer(inv_data, w, h, framebuf.MONO_HLSB)
-                oled.blit(fb, cursor_x, y, 1) # 1 is transparent, so 0s (Black Text) are drawn.
-                
-            else:
-                # Normal White text
-                fb = framebuf.FrameBuffer(data, w, h, framebuf.MONO_HLSB)
-                oled.blit(fb, cursor_x, y, 0) # 0 is transparent, so 1s (White Text) are drawn.
-                
-        cursor_x += w + 1
-""")
-        
+            # Keep the runtime (draw, glyph cache) that lives above the fonts
+            f.write(runtime)
+
         console.print("\n[bold]Starting Batch Conversion...[/bold]")
         
         for f in fonts:
@@ -320,18 +240,13 @@ def draw(oled, text, x, y, font_data=None, color=1):
             code = generate_font_module(f, size, var_name)
             if code:
                 # Extract HEIGHT first to use in comment
-                height_line = [l for l in code.splitlines() if f"{var_name}_HEIGHT =" in l][0]
+                height_line = code.splitlines()[0]
                 actual_height = int(height_line.split("=")[1].strip())
                 
                 # Append to file with accurate height in comment
                 new_content = f"\n\n# --- Font: {var_name} (size: {size}px, height: {actual_height}px) ---\n"
                 new_content += f"# Source: {os.path.basename(f)}\n"
-                new_content += f"{height_line}\n"
-                new_content += f"{var_name} = {{}}\n"
-                
-                # Extract Data Lines
-                data_lines = [l for l in code.splitlines() if l.startswith(f"{var_name}[")]
-                new_content += "\n".join(data_lines)
+                new_content += code
                 
                 with open(OUTPUT_FILE, "a") as out:
                     out.write(new_content)
@@ -353,7 +268,7 @@ def draw(oled, text, x, y, font_data=None, color=1):
         # Check if fonts.py exists
         mode = "w"
         existing_content = ""
-        write_header = True
+        new_content = ""
         
         if os.path.exists(OUTPUT_FILE):
             console.print(f"\n[yellow]{OUTPUT_FILE} exists.[/yellow]")
@@ -369,13 +284,11 @@ def draw(oled, text, x, y, font_data=None, color=1):
                 mode = "w"
             elif action == "append_to_file":
                 mode = "a"
-                write_header = False
                 with open(OUTPUT_FILE, "r") as f:
                     existing_content = f.read()
             elif action == "replace_font":
                 # Read file, remove old font section, append new
-                mode = "w"
-                write_header = False # We will write full reconstructed content
+                mode = "w" # We will write full reconstructed content
                 with open(OUTPUT_FILE, "r") as f:
                     existing_content = f.read()
                 
@@ -426,123 +339,18 @@ def draw(oled, text, x, y, font_data=None, color=1):
         # Prepare content
         # new_content = "" # DO NOT RESET new_content here, it kills replace_font logic
         
-        if write_header:
-            new_content += "import framebuf\n\n"
-            
-            # Define Generic Draw Function only once at the top (or bottom)
-            # We will add it at the end if it doesn't exist, or here.
-            # Let's add it at the end to be safe, or check if it exists.
-            
         new_content += f"# --- Font: {var_name} ({size}px) ---\n"
         new_content += f"# Source: {os.path.basename(font_file)}\n"
         
-        # Extract HEIGHT
-        height_line = [l for l in code.splitlines() if f"{var_name}_HEIGHT =" in l][0]
-        new_content += f"{height_line}\n"
-        
-        # Extract Dictionary Definition
-        new_content += f"{var_name} = {{}}\n"
-        
-        # Extract Data Lines
-        data_lines = [l for l in code.splitlines() if l.startswith(f"{var_name}[")]
-        new_content += "\n".join(data_lines)
+        new_content += code
         new_content += "\n\n"
         
         # Add draw function if it's not already there (simple check)
         # Or if we are overwriting, we must add it.
         # If appending, check existing_content.
         
-        draw_func_code = """
-def draw(oled, text, x, y, font_data=None, color=1):
-    # Default to FONT_REGULAR if available and font_data is None
-    if font_data is None:
-        if 'FONT_REGULAR' in globals():
-            font_data = FONT_REGULAR
-        else:
-            return # No font to draw
-            
-    cursor_x = x
-    for char in text:
-        code = ord(char)
-        if code not in font_data: 
-            cursor_x += 4 # Default spacing for missing char
-            continue
-        w, h, data = font_data[code]
-        if h > 0 and len(data) > 0:
-            # Invert data if color=0 (Black on White)
-            # But data is read-only bytes usually.
-            # We can invert at blit time? SSD1306 doesn't support key=1 for inverted blit easily
-            # without changing the buffer.
-            # Better: Create a temporary mutable bytearray if needed?
-            # Or pre-generate inverted fonts? No, waste of space.
-            # SSD1306 FrameBuffer operations:
-            # blit(fbuf, x, y, key)
-            # If key is specified, pixels matching key are transparent.
-            
-            # If we want BLACK text (color=0) on WHITE background:
-            # The font bitmap has 1s where the character is.
-            # If we blit with color=0, we want to clear pixels?
-            # FrameBuffer.blit doesn't have 'color' param, it just copies bits.
-            # It copies 1s as 1s (White).
-            
-            # To draw BLACK text, we need to use a different raster operation (XOR, OR, AND, NOT).
-            # MicroPython standard framebuf only supports simple copy with transparency key.
-            
-            # Workaround for BLACK text (color=0):
-            # We need to invert the source bytes before blitting?
-            # Or draw a white box and then XOR? framebuf doesn't do XOR easily.
-            
-            # BUT: We are drawing on a white background (already filled).
-            # So we need to clear pixels where the font has 1s.
-            # This means we need 0s where font has 1s.
-            # Since we can't change the operation mode of blit, we have to invert the buffer manually.
-            
-            if color == 0:
-                # Invert bytes on the fly
-                inv_data = bytearray([~b & 0xFF for b in data])
-                fb = framebuf.FrameBuffer(inv_data, w, h, framebuf.MONO_HLSB)
-                # We want to draw '0's (Black) where text is.
-                # But blit copies 1s.
-                # If we have inverted data, we have 1s where background is.
-                # If we blit that, we draw white background and keep holes?
-                # No, that overwrites background.
-                
-                # Wait, SSD1306 driver usually maps 1->On, 0->Off.
-                # If background is White (1), we want to set pixels to 0.
-                # There is no "clear bits" blit in standard MicroPython framebuf.
-                
-                # SLOW BUT WORKING FALLBACK for color=0:
-                # Iterate pixels? No too slow.
-                
-                # TRICK: Use 'key' for transparency.
-                # If we invert the image:
-                # Original: Text=1, Bg=0.
-                # Inverted: Text=0, Bg=1.
-                # If we blit Inverted with key=1 (White is transparent):
-                # We copy only the 0s? No, key makes the MATCHING color transparent.
-                # So if key=1, 1s are skipped. 0s are copied.
-                # 0s are Black.
-                # So if we invert the font (Text=0, Bg=1) and blit with key=1:
-                # The Bg (1) is transparent.
-                # The Text (0) is copied (as Black).
-                # THIS IS THE WAY!
-                
-                # Let's implement this trick.
-                inv_data = bytearray([~b & 0xFF for b in data])
-                fb = framebuf.FrameBuffer(inv_data, w, h, framebuf.MONO_HLSB)
-                oled.blit(fb, cursor_x, y, 1) # 1 is transparent, so 0s (Black Text) are drawn.
-                
-            else:
-                # Normal White text
-                fb = framebuf.FrameBuffer(data, w, h, framebuf.MONO_HLSB)
-                oled.blit(fb, cursor_x, y, 0) # 0 is transparent, so 1s (White Text) are drawn.
-                
-        cursor_x += w + 1
-"""
-        
-        # Check both new_content (for preserved draw) and existing_content (for appended file)
         if "def draw(" not in new_content and "def draw(" not in existing_content:
-            new_content += draw_func_code
+            new_content = read_runtime() + "\n\n" + new_content
 
         with open(OUTPUT_FILE, mode) as f:
             f.write(new_content)
@@ -7,6 +7,9 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 
+# Bitmap sources; scripts/build_assets.py packs them into assets.pack
+ASSET_MODULE = "asset_data.py"
+
 # --- UTILS ---
 
 def image_to_hlsb_bytes(img, invert=False):
@@ -36,17 +39,41 @@ def image_to_hlsb_bytes(img, invert=False):
             
     return buffer
 
+def image_to_vlsb_bytes(img, invert=False):
+    """
+    Convert a PIL Image to MONO_VLSB bytearray (the SSD1306 buffer layout).
+    One byte per column per 8-row page, top row in bit 0, so a full-screen
+    image can be copied straight into the display buffer.
+    """
+    img = img.convert('1') # Ensure 1-bit
+    width, height = img.size
+    
+    buffer = bytearray(width * ((height + 7) // 8))
+    
+    # VLSB: Vertical mapping, page by page
+    for y in range(height):
+        bit = 1 << (y & 7)
+        base = (y >> 3) * width
+        for x in range(width):
+            is_on = img.getpixel((x, y)) > 0 # White pixel
+            if invert:
+                is_on = not is_on
+            if is_on:
+                buffer[base + x] |= bit
+            
+    return buffer
+
 def append_to_assets(var_name, data, source_info, console):
-    """Appends or updates the generated bytearray in assets.py"""
+    """Appends or updates the generated bytearray in asset_data.py"""
     byte_str = "".join([f"\\x{b:02x}" for b in data])
     
     # Read existing content
-    with open("assets.py", "r") as f:
+    with open(ASSET_MODULE, "r") as f:
         content = f.read()
         
     # Check if variable already exists
     if f"{var_name} =" in content:
-        console.print(f"\n[yellow]Warning: Variable '{var_name}' already exists in assets.py[/yellow]")
+        console.print(f"\n[yellow]Warning: Variable '{var_name}' already exists in {ASSET_MODULE}[/yellow]")
         overwrite = Prompt.ask("Do you want to overwrite it?", choices=["y", "n"], default="y")
         
         if overwrite.lower() == 'n':
@@ -86,7 +113,7 @@ def append_to_assets(var_name, data, source_info, console):
         # Clean up multiple empty lines at the end
         content = content.rstrip() + "\n"
         
-        with open("assets.py", "w") as f:
+        with open(ASSET_MODULE, "w") as f:
             f.write(content)
             
         console.print(f"[dim]Removed old definition of '{var_name}'.[/dim]")
@@ -97,7 +124,7 @@ def append_to_assets(var_name, data, source_info, console):
     lines.append(f"{var_name} = bytearray(b'{byte_str}')")
     lines.append("")
     
-    with open("assets.py", "a") as f:
+    with open(ASSET_MODULE, "a") as f:
         f.write("\n" + "\n".join(lines))
         
     return True
@@ -132,22 +159,31 @@ def main():
     invert = Prompt.ask("[bold]Invert colors? (Black->White)[/bold]", choices=["y", "n"], default="n")
     do_invert = (invert.lower() == 'y')
     
-    # 5. Process
+    # 5. Format (VLSB for full-screen images copied as-is to the display)
+    fmt = Prompt.ask("[bold]Format[/bold]", choices=["hlsb", "vlsb"], default="hlsb")
+    
+    # 6. Process
     console.print(f"\n[dim]Processing {selected_file}...[/dim]")
     try:
         img = Image.open(selected_file)
         width, height = img.size
         console.print(f"  Size: {width}x{height}")
         
-        data = image_to_hlsb_bytes(img, do_invert)
+        if fmt == "vlsb":
+            data = image_to_vlsb_bytes(img, do_invert)
+        else:
+            data = image_to_hlsb_bytes(img, do_invert)
         
-        # 6. Write to assets.py
+        # 7. Write to asset_data.py
         info_str = f"{selected_file} ({width}x{height})"
         if do_invert:
             info_str += " [INVERTED]"
+        if fmt == "vlsb":
+            info_str += " [MONO_VLSB]"
             
         if append_to_assets(var_name, data, info_str, console):
-            console.print(f"[bold green]✓ Successfully updated '{var_name}' in assets.py[/bold green]")
+            console.print(f"[bold green]✓ Successfully updated '{var_name}' in {ASSET_MODULE}[/bold green]")
+            console.print("[dim]Run scripts/build_assets.py to update assets.pack.[/dim]")
         
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -37,8 +37,126 @@ def parse_frames_from_file(path, invert_colors=False):
         
     return all_frames
 
-def write_output(frames, out_path, variable_name):
+def hlsb_to_vlsb(data, width=128, height=64):
+    """
+    Reordena un frame MONO_HLSB (filas de bytes horizontales, como los exporta
+    image2cpp) a MONO_VLSB: una página de 8 filas por vez, un byte por columna
+    con la fila de arriba en el bit 0. Es el layout del buffer del SSD1306,
+    así el frame se copia entero a la pantalla sin convertir píxel a píxel.
+    """
+    stride = (width + 7) // 8
+    out = [0] * (width * ((height + 7) // 8))
+    for y in range(height):
+        bit = 1 << (y & 7)
+        base = (y >> 3) * width
+        for x in range(width):
+            if data[y * stride + (x >> 3)] & (0x80 >> (x & 7)):
+                out[base + x] |= bit
+    return out
+
+# --- Formato DELTA_RLE (lo decodifica renderer.DeltaAnimation) ---
+# Cada frame es un chunk de bytes: un byte de flags y después tokens que se
+# aplican con XOR sobre el buffer MONO_VLSB que tiene el frame anterior. Un
+# keyframe (flag KEYFRAME) se aplica sobre la pantalla en negro.
+#   0x00-0x7F: saltear n+1 bytes sin cambios
+#   0x80-0xBF: n+1 bytes literales
+#   0xC0-0xFF: el byte siguiente repetido n+1 veces
+# Los literales y repeticiones no cruzan un límite de página, así el
+# decoder marca las columnas cambiadas por página de una sola vez.
+KEYFRAME = 0x01
+
+def encode_delta(delta, width=128, flags=0):
+    """Codifica un delta (o un frame contra negro) en un chunk DELTA_RLE."""
+    out = bytearray([flags])
+    n = len(delta)
+    i = 0
+    while i < n:
+        if delta[i] == 0:
+            j = i
+            while j < n and delta[j] == 0 and j - i < 128:
+                j += 1
+            if j < n:
+                out.append(j - i - 1)  # Los ceros del final no hace falta escribirlos
+            i = j
+            continue
+        page_end = (i // width + 1) * width
+        j = i
+        while j < page_end and delta[j] == delta[i] and j - i < 64:
+            j += 1
+        if j - i >= 3:
+            out.append(0xC0 | (j - i - 1))
+            out.append(delta[i])
+            i = j
+            continue
+        j = i
+        while j < page_end and j - i < 64:
+            if delta[j] == 0 and (j + 1 >= page_end or delta[j + 1] == 0):
+                break
+            if j + 2 < page_end and delta[j] == delta[j + 1] == delta[j + 2] != 0:
+                break
+            j += 1
+        out.append(0x80 | (j - i - 1))
+        out.extend(delta[i:j])
+        i = j
+    return bytes(out)
+
+def encode_animation(frames, keyframe_every=8, width=128):
+    """
+    Devuelve (chunks, loop): un chunk por frame y el delta del último al
+    primero para volver a empezar sin keyframe. Cada N frames va un keyframe
+    obligatorio; en el resto se usa el delta o el frame entero, lo que ocupe
+    menos (si el personaje se mueve, el XOR puede salir más caro).
+    """
+    def best(prev, frame, key):
+        keyed = encode_delta(frame, width, KEYFRAME)
+        if key:
+            return keyed
+        delta = encode_delta([a ^ b for a, b in zip(frame, prev)], width)
+        return delta if len(delta) <= len(keyed) else keyed
+
+    chunks = []
+    for i, frame in enumerate(frames):
+        chunks.append(best(frames[i - 1], frame, i % keyframe_every == 0))
+    loop = best(frames[-1], frames[0], False) if len(frames) > 1 else None
+    return chunks, loop
+
+def write_encoded_output(frames, out_path, variable_name, keyframe_every=8, width=128, height=64):
+    chunks, loop = encode_animation(frames, keyframe_every, width)
+    prefix = variable_name.lower().replace('_animation', '')
+    lines = [f"# {out_path}", "# Autogenerated by generate_animation.py", ""]
+    lines.append("FORMAT = 'MONO_VLSB'")
+    lines.append("ENCODING = 'DELTA_RLE'  # Ver renderer.DeltaAnimation")
+    lines.append(f"WIDTH = {width}")
+    lines.append(f"HEIGHT = {height}")
+    lines.append("")
+
+    # Los chunks iguales (frames repetidos) se escriben una sola vez
+    names = {}
+    for chunk in chunks + ([loop] if loop is not None else []):
+        if chunk in names:
+            continue
+        names[chunk] = f"{prefix}_chunk_{len(names)}"
+        byte_string = "b'" + "".join([f"\\x{b:02x}" for b in chunk]) + "'"
+        lines.append(f"{names[chunk]} = {byte_string}")
+
+    lines.append("")
+    lines.append(f"{variable_name} = [")
+    for chunk in chunks:
+        lines.append(f"    {names[chunk]},")
+    lines.append("]")
+    lines.append(f"{variable_name}_LOOP = {names[loop] if loop is not None else None}")
+
+    with open(out_path, "w") as f:
+        f.write("\n".join(lines))
+
+    raw = sum(len(frame) for frame in frames)
+    return raw, sum(len(chunk) for chunk in names)
+
+def write_output(frames, out_path, variable_name, frame_format="MONO_HLSB"):
     lines = [f"# {out_path}", "# Autogenerated by generate_animation.py", ""]
+    # Layout de los frames (nombre de la constante de framebuf)
+    lines.append(f"FORMAT = '{frame_format}'")
+    lines.append("")
     frame_vars = []
     frame_prefix = variable_name.lower().replace('_animation', '')
 
@@ -80,12 +198,23 @@ def main():
     invert_choice = Prompt.ask("\n[bold]Invert colors?[/bold]", choices=["y", "n"], default="n")
     invert = (invert_choice.lower() == 'y')
 
+    # --- Selección de Formato ---
+    # VLSB es el layout nativo del SSD1306: el renderer copia el frame directo
+    # al buffer. HLSB queda para destinos que no son la pantalla.
+    format_choice = Prompt.ask("\n[bold]Output format[/bold]", choices=["vlsb", "hlsb"], default="vlsb")
+    frame_format = "MONO_VLSB" if format_choice == "vlsb" else "MONO_HLSB"
+
+    # --- Compresión (sólo VLSB: los deltas se aplican sobre el buffer) ---
+    keyframe_every = 0
+    if frame_format == "MONO_VLSB":
+        keyframe_every = int(Prompt.ask("\n[bold]Keyframe every N frames (0 = uncompressed)[/bold]", default="8"))
+
     # --- Procesamiento ---
     output_filename = f"{selected_animation}_animation.py"
     variable_name = selected_animation.upper() + '_ANIMATION'
     single_file_path = f'assets/{selected_animation}.c'
 
-    console.print(Panel(f"  - Source: {single_file_path}\n  - Output: {output_filename}\n  - Invert: {'Yes' if invert else 'No'}", title="[bold cyan]Processing[/bold cyan]"))
+    console.print(Panel(f"  - Source: {single_file_path}\n  - Output: {output_filename}\n  - Invert: {'Yes' if invert else 'No'}\n  - Format: {frame_format}", title="[bold cyan]Processing[/bold cyan]"))
 
     frames = parse_frames_from_file(single_file_path, invert_colors=invert)
 
@@ -93,7 +222,14 @@ def main():
         console.print(f"[bold red]Error:[/bold red] No valid animation frames found in the source file.")
         sys.exit(1)
 
-    write_output(frames, output_filename, variable_name)
+    if frame_format == "MONO_VLSB":
+        frames = [hlsb_to_vlsb(frame) for frame in frames]
+
+    if keyframe_every > 0:
+        raw, packed = write_encoded_output(frames, output_filename, variable_name, keyframe_every)
+        console.print(f"  - DELTA_RLE: {raw} -> {packed} bytes")
+    else:
+        write_output(frames, output_filename, variable_name, frame_format)
     console.print(f"\n[bold green]✓ Successfully generated '{output_filename}' with {len(frames)} frames.[/bold green]")
 
 if __name__ == "__main__":
@@ -7,7 +7,15 @@ Usage:
        Supported formats: .mid, .midi (and .abc coming soon)
     2. Run this script: python3 scripts/music_gen.py
     3. Select the file you want to convert.
-    4. The script will generate a Python module with the song data.
+    4. The script will generate a Python module with the song data: a
+       frequency table (FREQS) and packed (note index, ms) uint16 pairs
+       (EVENTS), with every tempo change already resolved to ms.
+
+    python3 scripts/music_gen.py --convert song.py rewrites an existing song
+    module (old NOTES/PIECE tuples or this format) in place, keeping its
+    notes and durations as they are. That is how the shipped music_intro.py
+    and blues_corto.py were made: they were hand-tuned after generation, so
+    running the MIDI conversion again would not give back the same data.
 
 Dependencies:
     - rich
@@ -16,6 +24,7 @@ import sys
 import os
 import glob
 import math
+import struct
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -72,7 +81,6 @@ def parse_midi(path):
         pos += trk_len
         tracks.append(trk_data)
 
-    tempo_us_per_qn = 500000
     melody_track_index = 0
     note_on_counts = []
     parsed_tracks = []
@@ -152,58 +160,120 @@ def parse_midi(path):
 
     chosen = parsed_tracks[melody_track_index]
     evs = sorted(chosen["events"], key=lambda e: e[0])
-    global_tempo = None
-    if parsed_tracks and parsed_tracks[0]["tempos"]:
-        global_tempo = parsed_tracks[0]["tempos"][0][1]
-    if global_tempo is None:
-        for tr in parsed_tracks:
-            if tr["tempos"]:
-                tempo_0 = next((us for tick, us in tr["tempos"] if tick == 0), None)
-                global_tempo = tempo_0 if tempo_0 is not None else tr["tempos"][0][1]
-                break
-    if global_tempo is not None:
-        tempo_us_per_qn = global_tempo
+    # Tempo map: every tempo change of every track (format 1 files keep
+    # them in track 0), applied from its tick on
+    tempos = sorted(t for tr in parsed_tracks for t in tr["tempos"])
 
     pieces = []
     last_end = 0
     used_notes = {}
     for s, e, p in evs:
         if s > last_end:
-            gap_ticks = s - last_end
-            if gap_ticks > 0:
-                pieces.append(("SILENCE", gap_ticks))
-        dur_ticks = max(1, e - s)
-        freq = midi_note_freq(p)
+            pieces.append(("SILENCE", tick_ms(s, tempos, tpqn) - tick_ms(last_end, tempos, tpqn)))
+        if e <= s:
+            e = s + 1
         name = midi_note_name(p)
-        used_notes[name] = freq
-        pieces.append((name, dur_ticks))
+        used_notes[name] = midi_note_freq(p)
+        pieces.append((name, tick_ms(e, tempos, tpqn) - tick_ms(s, tempos, tpqn)))
         last_end = e
 
     notes_dict = {"SILENCE": 0}
     for k, v in used_notes.items():
         notes_dict[k] = v
+    return notes_dict, round_durations(pieces), tempos
+
+def tick_ms(tick, tempos, tpqn):
+    """Absolute time of a tick in ms, following every tempo change before it."""
+    ms = 0.0
+    last_tick = 0
+    us = 500000  # MIDI default: 120 bpm
+    for t, new_us in tempos:
+        if t >= tick:
+            break
+        ms += (t - last_tick) * us / tpqn / 1000
+        last_tick = t
+        us = new_us
+    return ms + (tick - last_tick) * us / tpqn / 1000
 
-    tick_ms = max(1, int(round(tempo_us_per_qn / tpqn / 1000)))
-    tempo_ms_qn = max(1, int(round(tempo_us_per_qn / 1000)))
-    return notes_dict, pieces, tick_ms, tpqn, tempo_ms_qn
+def round_durations(pieces):
+    """(name, ms) with whole ms, rounding the running end time and not each
+    duration, so the rounding error never accumulates. Events that round to
+    0 ms are dropped."""
+    out = []
+    t = 0.0
+    for name, ms in pieces:
+        dur = int(round(t + ms)) - int(round(t))
+        t += ms
+        if dur > 0:
+            out.append((name, dur))
+    return out
 
-def write_song_module(notes, pieces, out_path, tempo_ms_qn, tpqn):
+def pack_events(notes, pieces):
+    """Frequency table (SILENCE first) and the (table index, ms) uint16
+    little-endian pairs; notes longer than 65535 ms are split."""
+    names = sorted(notes.keys(), key=lambda x: (x != "SILENCE", x))
+    freqs = [notes[n] for n in names]
+    data = bytearray()
+    for name, ms in pieces:
+        index = freqs.index(notes[name])
+        while ms > 0:
+            data += struct.pack("<HH", index, min(ms, 0xffff))
+            ms -= 0xffff
+    return names, freqs, bytes(data)
+
+def write_song_module(notes, pieces, out_path, source=None, converted=False):
+    names, freqs, data = pack_events(notes, pieces)
+    total = sum(ms for _, ms in pieces)
     lines = []
+    lines.append(f"# {os.path.basename(out_path)}")
+    if converted:
+        lines.append("# Convertido con scripts/music_gen.py --convert desde la versión anterior")
+        lines.append("# de este módulo (ajustada a mano; no sale del .mid de assets/):")
+        lines.append(f"# {len(data) // 4} notas, {total} ms.")
+    else:
+        origin = f" desde {source}" if source else ""
+        lines.append(f"# Generado por scripts/music_gen.py{origin}: {len(data) // 4} notas, {total} ms.")
+    lines.append("# PIECE da (frecuencia, ms) desde EVENTS, pares (índice en FREQS, ms) en")
+    lines.append("# uint16 little-endian con los tempos ya resueltos: sin una tupla por nota.")
+    lines.append("")
+    lines.append("from assets import Piece")
+    lines.append("")
     lines.append("NOTES = {")
-    for k in sorted(notes.keys(), key=lambda x: (x != "SILENCE", x)):
-        lines.append(f"    '{k}': {notes[k]},")
+    for name in names:
+        lines.append(f"    '{name}': {notes[name]},")
     lines.append("}")
-    lines.append(f"TEMPO = {tempo_ms_qn}")
-    lines.append(f"SUBDIV = {tpqn}")
-    lines.append("PIECE = [")
-    for name, ticks in pieces:
-        dur_expr = "TEMPO // SUBDIV" if int(ticks) == 1 else f"TEMPO * {int(ticks)} // SUBDIV"
-        lines.append(f"    (NOTES['{name}'], {dur_expr}),")
-    lines.append("]")
+    lines.append(f"FREQS = ({', '.join(str(f) for f in freqs)},)")
+    lines.append("EVENTS = (")
+    for i in range(0, len(data), 16):
+        chunk = "".join(f"\\x{b:02x}" for b in data[i:i + 16])
+        lines.append(f"    b'{chunk}'")
+    if not data:
+        lines.append("    b''")
+    lines.append(")")
+    lines.append("PIECE = Piece(FREQS, EVENTS)")
     with open(out_path, "w") as f:
-        f.write("\n".join(lines))
+        f.write("\n".join(lines) + "\n")
+
+def song_from_module(path):
+    """(notes, pieces) of an existing song module, old or packed: PIECE
+    gives (frequency, ms) in both."""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+    scope = {}
+    with open(path) as f:
+        exec(f.read(), scope)
+    notes = dict(scope["NOTES"])
+    by_freq = {}
+    for name, freq in notes.items():
+        by_freq.setdefault(freq, name)
+    pieces = [(by_freq[int(freq)], int(ms)) for freq, ms in scope["PIECE"] if int(ms) > 0]
+    return notes, pieces
 
 def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--convert":
+        notes, pieces = song_from_module(sys.argv[2])
+        write_song_module(notes, pieces, sys.argv[2], converted=True)
+        print(f"Converted {sys.argv[2]} ({len(pieces)} events)")
+        return
     console = Console()
     console.print(Panel("MIDI files available in 'assets/':", title="[bold cyan]Music Generator[/bold cyan]"))
     midi_files = glob.glob("assets/*.mid") + glob.glob("assets/*.midi")
@@ -220,12 +290,13 @@ def main():
     out_path = os.path.join(os.getcwd(), out_name)
     console.print(Panel(f"  - Source: {src_path}\n  - Output: {out_name}", title="[bold cyan]Processing[/bold cyan]"))
     try:
-        notes, pieces, tick_ms, tpqn, tempo_ms_qn = parse_midi(src_path)
+        notes, pieces, tempos = parse_midi(src_path)
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         sys.exit(1)
-    write_song_module(notes, pieces, out_path, tempo_ms_qn, tpqn)
-    console.print(f"\n[bold green]✓ Successfully generated '{out_name}' ({len(pieces)} events).[/bold green]")
+    write_song_module(notes, pieces, out_path, src_path)
+    console.print(f"\n[bold green]✓ Successfully generated '{out_name}' ({len(pieces)} events, "
+                  f"{max(1, len(tempos))} tempo(s)).[/bold green]")
 
 if __name__ == "__main__":
     main()
@@ -82,6 +82,18 @@ echo ""
 rich_printer "[b]Paso 2: Comparando archivos locales y remotos...[/b]"
 device_files_raw=$(mp fs ls 2>/dev/null || true)
 local_py_files=($(ls *.py))
+
+# Los gráficos, animaciones y canciones van empaquetados en assets.pack; sus
+# módulos fuente no se copian (y se borran del dispositivo si estaban)
+pack_built=0
+if $PY scripts/build_assets.py >/dev/null; then
+  pack_built=1
+  packed_sources=($($PY scripts/build_assets.py --list-sources))
+  local_py_files=(${local_py_files:|packed_sources})
+  rich_printer "[green]✓ assets.pack generado.[/green]"
+else
+  rich_printer "[yellow]Advertencia: No se pudo generar assets.pack; se copian los módulos fuente.[/yellow]"
+fi
 remote_py_files=()
 for line in ${(f)device_files_raw}; do
   name=$(echo "$line" | awk '{print $2}')
@@ -135,6 +147,12 @@ for file in "${local_py_files[@]}"; do
     COPY_OPS+=(":/${file}")
 done
 
+# Pack de assets
+if [[ $pack_built -eq 1 ]]; then
+    COPY_OPS+=("assets.pack")
+    COPY_OPS+=(":/assets.pack")
+fi
+
 # Archivos de menús
 # Asegurar directorio (rápido, una sola llamada)
 mp fs mkdir :menus >/dev/null 2>&1 || true
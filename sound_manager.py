@@ -1,10 +1,26 @@
 # sound_manager.py
-# Propósito: Ya esta terminado.
+# Propósito: Música de fondo y efectos. Un secuenciador (Sequencer) sigue la línea de tiempo de la canción (cuándo empieza cada nota, en ms desde el principio) y cambia de nota en deadlines absolutos de ticks_ms: lo que tarden freq()/duty, un flush del bus o la tarea anterior no se suma al tempo. Los efectos (SFX_*) tapan la música por un momento y la música vuelve en la nota que corresponde a ese momento. Lo maneja una tarea del runtime o un machine.Timer, así que no hace falta un hilo aparte.
 
-from machine import PWM
+from array import array
+from machine import PWM, Timer
 import time
+import config
+import runtime
 
 current_song = None
+sequencer = None  # El Sequencer de la música de fondo (play_music)
+
+
+def _effect(priority, *pairs):
+    # Efecto precompilado: prioridad y pares (frecuencia, ms), 0 = silencio
+    return array('H', (priority,) + pairs)
+
+# Efectos de sonido. Uno nuevo corta al que suena si su prioridad es igual
+# o mayor.
+SFX_CLICK = _effect(0, 2093, 12)                           # Mover el cursor
+SFX_CONFIRM = _effect(1, 1568, 35, 0, 10, 2093, 60)        # Elegir una opción
+SFX_ERROR = _effect(2, 196, 90, 0, 25, 147, 140)
+SFX_HIT = _effect(2, 880, 15, 587, 15, 392, 20, 262, 40)   # Golpe en combate
 
 def load_song(song_module):
     global current_song
@@ -26,39 +42,350 @@ def _duty_on(b):
     elif hasattr(b, 'duty'):
         b.duty(512)
 
-def play_music_loop(buzzer):
-    global current_song
+
+class Sequencer:
+    """
+    Toca una canción (NOTES y PIECE) en el buzzer sobre una línea de tiempo
+    absoluta: la próxima nota empieza en t0 + _at, con t0 el tick en que la
+    canción estaría en 0 ms y _at la suma de las duraciones anteriores.
+    service() toca las notas cuyo deadline ya pasó y devuelve cuánto falta
+    para el próximo, así que un atraso en una nota no corre a las
+    siguientes. Si se atrasó más que una nota entera (p.ej. un flush largo)
+    se saltea hasta la que tendría que estar sonando.
+
+    PIECE se recorre en orden y se pide de a una nota (la siguiente se lee
+    apenas empieza la actual), así que una canción que se lee del pack de a
+    pedazos (assets.Piece) usa la misma RAM sea del largo que sea.
+
+    Controles: play(), stop(), pause(), resume(), seek(ms) y el atributo
+    loop. position() da los ms dentro de la canción y stats() el jitter
+    medido (cuánto tarde sonó cada nota respecto de su deadline).
+
+    Se maneja con `await seq.run()` (tarea del runtime) o con
+    seq.use_timer(id), que llama a service() desde un machine.Timer.
+    """
+
+    def __init__(self, buzzer, song=None, loop=True):
+        self.buzzer = buzzer
+        self.loop = loop
+        self.playing = False
+        self.paused = False
+        self.index = -1       # Nota sonando (-1: ninguna)
+        self._next = 0        # Próxima nota a empezar
+        self._at = 0          # Cuándo empieza, en ms desde el principio
+        self._note = None     # Su (frecuencia, ms), ya leído
+        self._t0 = 0
+        self._pos = 0         # Posición guardada mientras está en pausa
+        self._timer = None
+        self._wake = None     # Event de la tarea run() (se crea ahí)
+        self._freq = 0        # Frecuencia de la nota de la música
+        self._sfx = None      # Efecto sonando (tapa la música)
+        self._sfx_i = 1       # Próximo par del efecto
+        self._sfx_at = 0      # Tick en que empieza ese par
+        self.piece = None
+        self.silence = 0
+        self.count = 0
+        self.length = 0
+        self.reset_stats()
+        if song is not None:
+            self.load(song)
+
+    def load(self, song):
+        # Largo total en ms (una pasada por las notas)
+        self.stop()
+        self.piece = song.PIECE
+        self.silence = song.NOTES['SILENCE']
+        self.count = len(self.piece)
+        t = 0
+        for i in range(self.count):
+            t += self.piece[i][1]
+        self.length = t
+
+    def reset_stats(self):
+        self.notes = 0        # Notas tocadas
+        self.skipped = 0      # Notas salteadas por atraso
+        self._late_sum = 0
+        self._late_sq = 0
+        self.late_max = 0
+
+    def stats(self):
+        """
+        Jitter medido desde reset_stats(): notas tocadas y salteadas, y el
+        atraso respecto del deadline en ms (promedio, desvío y máximo).
+        """
+        n = self.notes
+        avg = self._late_sum / n if n else 0
+        var = self._late_sq / n - avg * avg if n else 0
+        return {
+            'notes': n,
+            'skipped': self.skipped,
+            'late_avg': avg,
+            'late_dev': var ** 0.5 if var > 0 else 0,
+            'late_max': self.late_max,
+        }
+
+    def play(self, position_ms=0):
+        # Empieza (o vuelve a empezar) desde position_ms
+        if not self.length:
+            return
+        self.playing = True
+        self.paused = False
+        self.seek(position_ms)
+
+    def stop(self):
+        self.playing = False
+        self.paused = False
+        self.index = -1
+        self._next = 0
+        self._note = None
+        self._pos = 0
+        self._quiet()
+        self._kick()
+
+    def pause(self):
+        if not self.playing or self.paused:
+            return
+        self._pos = self.position()
+        self.paused = True
+        self._quiet()
+        self._kick()
+
+    def resume(self):
+        if self.playing and self.paused:
+            self.paused = False
+            self.seek(self._pos)
+
+    def seek(self, position_ms):
+        # Salta a position_ms (acotado al largo de la canción); si está
+        # sonando, la nota de ese momento empieza ya
+        if not self.length:
+            return
+        if self.loop:
+            position_ms %= self.length
+        position_ms = max(0, min(position_ms, self.length - 1))
+        if not self.playing or self.paused:
+            self._pos = position_ms
+            return
+        # La nota que contiene position_ms
+        piece = self.piece
+        i = 0
+        at = 0
+        while True:
+            note = piece[i]
+            if at + note[1] > position_ms:
+                break
+            at += note[1]
+            i += 1
+        self._t0 = time.ticks_add(time.ticks_ms(), -position_ms)
+        self.index = i
+        self._sound(note[0])
+        self._advance(i + 1, at + note[1])
+        self._kick()
+
+    def position(self):
+        # Ms dentro de la canción
+        if not self.playing:
+            return 0
+        if self.paused:
+            return self._pos
+        pos = time.ticks_diff(time.ticks_ms(), self._t0)
+        return max(0, min(pos, self.length))
+
+    def _sound(self, frequency):
+        # Nota de la música: mientras suena un efecto sólo se recuerda
+        self._freq = 0 if frequency == self.silence else frequency
+        if self._sfx is None:
+            self._tone(self._freq)
+
+    def _tone(self, frequency):
+        if frequency:
+            self.buzzer.freq(frequency)
+            _duty_on(self.buzzer)
+        else:
+            _duty_off(self.buzzer)
+
+    def _quiet(self):
+        # La música se calla; un efecto que esté sonando sigue
+        self._freq = 0
+        if self._sfx is None:
+            _duty_off(self.buzzer)
+
+    def effect(self, sfx):
+        """
+        Toca un efecto (SFX_*) encima de la música: arranca ya y el resto
+        lo hace service(). Tiempo constante, así que se puede llamar desde
+        el manejo de botones. Devuelve False si suena uno de más prioridad.
+        """
+        current = self._sfx
+        if current is not None and sfx[0] < current[0]:
+            return False
+        self._sfx = sfx
+        self._sfx_i = 1
+        self._sfx_at = time.ticks_ms()
+        self._service_sfx(self._sfx_at)
+        self._kick()
+        return True
+
+    def _service_sfx(self, now):
+        # Pasos del efecto que ya llegaron; al terminar vuelve la música
+        # con la nota que suena ahora en su línea de tiempo
+        sfx = self._sfx
+        while sfx is not None:
+            late = time.ticks_diff(now, self._sfx_at)
+            if late < 0:
+                return -late
+            i = self._sfx_i
+            if i >= len(sfx):
+                self._sfx = None
+                self._tone(self._freq)
+                return None
+            self._tone(sfx[i])
+            self._sfx_i = i + 2
+            self._sfx_at = time.ticks_add(self._sfx_at, sfx[i + 1])
+        return None
+
+    def _advance(self, i, at):
+        # La próxima nota es la i, que empieza en at ms
+        self._next = i
+        self._at = at
+        self._note = self.piece[i] if i < self.count else None
+
+    def service(self, now=None):
+        """
+        Toca las notas y los pasos de efecto que ya llegaron a su deadline.
+        Devuelve los ms hasta el próximo, o None si no suena nada (música
+        parada o en pausa y ningún efecto).
+        """
+        if now is None:
+            now = time.ticks_ms()
+        # Primero la música, así un efecto que termina ahora la retoma en
+        # la nota de este momento
+        wait = self._service_music(now)
+        sfx_wait = self._service_sfx(now)
+        if wait is None or (sfx_wait is not None and sfx_wait < wait):
+            return sfx_wait
+        return wait
+
+    def _service_music(self, now):
+        if not self.playing or self.paused:
+            return None
+        n = self.count
+        while True:
+            i = self._next
+            late = time.ticks_diff(now, time.ticks_add(self._t0, self._at))
+            if late < 0:
+                return -late
+            if i == n:
+                # Terminó la canción: la vuelta empieza justo donde termina
+                if not self.loop:
+                    self.stop()
+                    return None
+                # (si pasó más de una vuelta entera no se tocan todas)
+                self._t0 = time.ticks_add(self._t0, self.length * (1 + late // self.length))
+                self._advance(0, 0)
+                continue
+            frequency, duration = self._note
+            if late >= duration:
+                # Esta nota ya tendría que haber terminado
+                if duration:
+                    self.skipped += 1
+                self._advance(i + 1, self._at + duration)
+                continue
+            self.index = i
+            self._sound(frequency)
+            self.notes += 1
+            self._late_sum += late
+            self._late_sq += late * late
+            if late > self.late_max:
+                self.late_max = late
+            self._advance(i + 1, self._at + duration)
+
+    async def run(self):
+        # Tarea del runtime: duerme hasta el próximo deadline o hasta que
+        # un control (play, seek, ...) cambie la línea de tiempo
+        self._wake = runtime.Event()
+        while True:
+            try:
+                wait = self.service()
+            except Exception as e:
+                self._fail(e)
+                wait = None
+            self._wake.clear()
+            await runtime.wait(self._wake, wait)
+
+    def _fail(self, e):
+        # Un error al tocar (p.ej. al leer el pack) para la música y el
+        # efecto en vez de dejar el secuenciador a medias
+        print(f"Error en el bucle de música: {e}")
+        self._sfx = None
+        self.stop()
+
+    def use_timer(self, timer_id=0):
+        # Maneja el secuenciador con un machine.Timer de un disparo que se
+        # rearma en cada deadline, en vez de una tarea. Ojo: en este modo
+        # las lecturas del pack de una canción en pedazos (assets.Piece)
+        # también corren en el callback del timer.
+        self._timer = Timer(timer_id)
+        self._kick()
+
+    def _on_timer(self, timer):
+        try:
+            wait = self.service()
+        except Exception as e:
+            self._fail(e)
+            return
+        if wait is not None and self._timer is timer:
+            timer.init(mode=Timer.ONE_SHOT, period=max(1, wait), callback=self._on_timer)
+
+    def _kick(self):
+        # Avisa al que maneja el secuenciador que cambió la línea de tiempo
+        if self._wake is not None:
+            self._wake.set()
+        if self._timer is not None:
+            self._timer.init(mode=Timer.ONE_SHOT, period=1, callback=self._on_timer)
+
+
+async def play_music(buzzer):
+    # La música de fondo como tarea del runtime (o con un machine.Timer si
+    # config.MUSIC_TIMER_ID no es None). El Sequencer queda en `sequencer`
+    # para pausarla, moverla o leer el jitter desde otras escenas. Sin
+    # canción la tarea corre igual, para los efectos.
+    global sequencer
     if not current_song:
         print("Error: No hay ninguna canción cargada en el sound_manager.")
+
+    sequencer = Sequencer(buzzer, current_song)
+    sequencer.play()
+    if config.MUSIC_TIMER_ID is not None:
+        sequencer.use_timer(config.MUSIC_TIMER_ID)
         return
+    await sequencer.run()
+
+def sfx(effect):
+    # Efecto de sonido (SFX_*) sobre la música; no hace nada antes de que
+    # arranque play_music
+    if sequencer is None:
+        return False
+    return sequencer.effect(effect)
 
-    piece = current_song.PIECE
-    notes = current_song.NOTES
-    
-    note_index = 0
-    total_notes = len(piece)
+def play_music_loop(buzzer):
+    # Versión bloqueante (sin runtime): mismo Sequencer, durmiendo entre
+    # deadlines
+    if not current_song:
+        print("Error: No hay ninguna canción cargada en el sound_manager.")
+        return
 
+    seq = Sequencer(buzzer, current_song)
+    seq.play()
     while True:
         try:
-            # Get the current note
-            frequency, duration = piece[note_index]
-
-            # Play the note
-            if frequency == notes['SILENCE']:
-                _duty_off(buzzer)
-            else:
-                buzzer.freq(frequency)
-                _duty_on(buzzer)
-            
-            # Wait for the duration of the note
-            time.sleep_ms(int(duration))
-
-            # Move to the next note
-            note_index = (note_index + 1) % total_notes
-
+            wait = seq.service()
+            if wait is None:
+                return
+            time.sleep_ms(wait)
         except Exception as e:
             print(f"Error en el bucle de música: {e}")
             _duty_off(buzzer)
-            # Reset index on error and wait before retrying
-            note_index = 0
+            # Reset on error and wait before retrying
             time.sleep_ms(1000)
+            seq.play()
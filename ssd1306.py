@@ -1,5 +1,6 @@
 #MicroPython SSD1306 OLED driver, I2C and SPI interfaces created by Adafruit
 
+import sys
 import time
 import framebuf
 from micropython import const
@@ -22,6 +23,55 @@ SET_DISP_CLK_DIV    = const(0xd5)
 SET_PRECHARGE       = const(0xd9)
 SET_VCOM_DESEL      = const(0xdb)
 SET_CHARGE_PUMP     = const(0x8d)
+SET_HSCROLL         = const(0x26) # | 0x01 for left
+SET_DSCROLL         = const(0x29) # | 0x01 for left, plus vertical offset
+SET_SCROLL_OFF      = const(0x2e)
+SET_SCROLL_ON       = const(0x2f)
+SET_VSCROLL_AREA    = const(0xa3)
+
+# marker for a page with no pending changes
+_CLEAN              = const(0xff)
+# bus bytes a window costs on top of its data (six addressing commands)
+_WINDOW_COST        = const(12)
+
+# scroll step interval in frames -> 3-bit code used by the scroll commands
+_SCROLL_FRAMES = ((2, 7), (3, 4), (4, 5), (5, 0), (25, 6), (64, 1), (128, 2), (256, 3))
+
+
+# Diff helper for the shadow-buffer mode. Compares n 32-bit words of a and b
+# starting at word index start and returns (first << 16) | last for the first
+# and last differing words, or -1 when the range is identical. Both buffers
+# must be word aligned at start.
+if sys.implementation.name == 'micropython':
+    import micropython
+
+    @micropython.viper
+    def _diff_words(a, b, start: int, n: int) -> int:
+        pa = ptr32(a)
+        pb = ptr32(b)
+        end = start + n
+        i = start
+        while i < end and pa[i] == pb[i]:
+            i += 1
+        if i == end:
+            return -1
+        j = end - 1
+        while pa[j] == pb[j]:
+            j -= 1
+        return (i << 16) | j
+else:
+    def _diff_words(a, b, start, n):
+        first = -1
+        last = -1
+        for i in range(start, start + n):
+            j = i << 2
+            if a[j:j + 4] != b[j:j + 4]:
+                if first < 0:
+                    first = i
+                last = i
+        if first < 0:
+            return -1
+        return (first << 16) | last
 
 
 class SSD1306:
@@ -33,11 +83,40 @@ class SSD1306:
         # Note the subclass must initialize self.framebuf to a framebuffer.
         # This is necessary because the underlying data buffer is different
         # between I2C and SPI implementations (I2C needs an extra byte).
+        #
+        # Dirty tracking: for every page we keep the first and last column
+        # touched by a drawing call since the last show(). A page is clean
+        # when its first column is _CLEAN. show() only sends those windows.
+        self._dirty_x0 = bytearray(self.pages)
+        self._dirty_x1 = bytearray(self.pages)
+        # Scratch buffer used to gather windows that are not contiguous in
+        # the framebuffer. data_offset leaves room for the I2C control byte.
+        self._scratch = bytearray(self.pages * self.width + self.data_offset)
+        self._scratch[0] = self.data_prefix
+        self.bytes_sent = 0      # Total bytes written to the bus
+        self.show_bytes = 0      # Bytes written by the last show()
+        # Diff mode (see set_diff_mode): copy of what the panel holds.
+        self._shadow = None
+        self._shadow_valid = False
+        self.diff_threshold = 0
+        # Async flush (see set_async_flush): spare buffer and worker locks.
+        self._async = False
+        self._back = None
+        self._job = None
+        self._req = None
+        self._idle = None
+        self.reset_flush_stats()
+        # Hardware effects state (see start_scroll / flip).
+        self._scrolling = False
+        self._scroll_pages = (0, 0)
+        self.start_line = 0
+        self.flipped = False
+        self.mark_dirty()
         self.poweron()
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds((
             SET_DISP | 0x00, # off
             # address setting
             SET_MEM_ADDR, 0x00, # horizontal
@@ -58,120 +137,603 @@ class SSD1306:
             SET_NORM_INV, # not inverted
             # charge pump
             SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01): # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01)) # on
         self.fill(0)
         self.show()
 
+    def _new_buffer(self, width, height):
+        # Returns (buffer, frame, view, framebuf). view is the pixel data the
+        # FrameBuffer draws into, frame is what goes on the bus for a full
+        # write (the I2C control byte included). _header bytes precede the
+        # pixel data so that it starts on a word boundary.
+        header = self._header
+        buf = bytearray(header + (height // 8) * width)
+        if header:
+            buf[header - 1] = self.data_prefix
+        frame = memoryview(buf)[header - self.data_offset:]
+        view = memoryview(buf)[header:]
+        return buf, frame, view, framebuf.FrameBuffer1(view, width, height)
+
+    def write_cmds(self, cmds):
+        # Send a sequence of commands as one bus transaction, staged in the
+        # preallocated command buffer. Long sequences go out in chunks.
+        buf = self._cmd
+        start = self.cmd_offset
+        n = start
+        for cmd in cmds:
+            if n == len(buf):
+                self.write_cmd_buf(n)
+                n = start
+            buf[n] = cmd
+            n += 1
+        if n > start:
+            self.write_cmd_buf(n)
+
     def poweroff(self):
+        self.wait_flush()
         self.write_cmd(SET_DISP | 0x00)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.wait_flush()
+        self.write_cmds((SET_CONTRAST, contrast))
 
     def invert(self, invert):
+        self.wait_flush()
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    def mark_dirty(self, x=0, y=0, w=None, h=None):
+        # Flag a region as modified so the next show() sends it. Without
+        # arguments the whole screen is flagged.
+        if w is None:
+            w = self.width - x
+        if h is None:
+            h = self.height - y
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        if x + w > self.width:
+            w = self.width - x
+        if y + h > self.height:
+            h = self.height - y
+        if w <= 0 or h <= 0:
+            return
+        x1 = x + w - 1
+        lo = self._dirty_x0
+        hi = self._dirty_x1
+        for page in range(y >> 3, ((y + h - 1) >> 3) + 1):
+            if lo[page] == _CLEAN:
+                lo[page] = x
+                hi[page] = x1
+            else:
+                if x < lo[page]:
+                    lo[page] = x
+                if x1 > hi[page]:
+                    hi[page] = x1
+
+    def is_dirty(self):
+        for x0 in self._dirty_x0:
+            if x0 != _CLEAN:
+                return True
+        return False
+
+    def _clear_dirty(self):
+        for page in range(self.pages):
+            self._dirty_x0[page] = _CLEAN
+            self._dirty_x1[page] = 0
+
+    def _windows(self):
+        # Group consecutive dirty pages into (x0, x1, page0, page1) windows.
+        # A page joins the current window when sending the union of their
+        # column ranges is cheaper than opening a new window for it.
+        windows = []
+        lo = self._dirty_x0
+        hi = self._dirty_x1
+        page = 0
+        while page < self.pages:
+            if lo[page] == _CLEAN:
+                page += 1
+                continue
+            p0 = page
+            x0 = lo[page]
+            x1 = hi[page]
+            page += 1
+            while page < self.pages and lo[page] != _CLEAN:
+                nx0 = min(x0, lo[page])
+                nx1 = max(x1, hi[page])
+                rows = page - p0
+                merged = (rows + 1) * (nx1 - nx0 + 1)
+                separate = rows * (x1 - x0 + 1) + (hi[page] - lo[page] + 1) + _WINDOW_COST
+                if merged > separate:
+                    break
+                x0 = nx0
+                x1 = nx1
+                page += 1
+            windows.append((x0, x1, p0, page - 1))
+        return windows
+
+    def _gather(self, src, x0, x1, p0, p1):
+        # Copy a window of src into the scratch buffer, page by page, in the
+        # order the controller expects it in horizontal addressing mode.
+        w = x1 - x0 + 1
+        dst = self._scratch
+        pos = self.data_offset
+        for page in range(p0, p1 + 1):
+            start = page * self.width + x0
+            dst[pos:pos + w] = src[start:start + w]
+            pos += w
+        return memoryview(dst)[:pos]
+
+    def set_window(self, x0, x1, p0, p1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_framebuf()
+        self.write_cmds((SET_COL_ADDR, x0, x1, SET_PAGE_ADDR, p0, p1))
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        # Address a window and send its data. Subclasses fuse both into a
+        # single transaction when the bus allows it.
+        self.set_window(x0, x1, p0, p1)
+        self.write_data(buf)
+
+    def set_diff_mode(self, enabled=True, threshold=None):
+        # Diff mode keeps a copy of the last frame sent to the panel and, at
+        # show() time, only sends the words that really changed. Useful for
+        # scenes that clear and redraw everything but only change a little.
+        # When the diff exceeds threshold bytes a full frame is sent instead.
+        if not enabled:
+            self._shadow = None
+            return
+        if self._shadow is None:
+            self._shadow = bytearray(self.pages * self.width)
+        self._shadow_valid = False
+        if threshold is None:
+            threshold = self.pages * self.width * 3 // 4
+        self.diff_threshold = threshold
+
+    def _diff_dirty(self):
+        # Narrow each dirty page to the word range that differs from the
+        # shadow copy. Pages that ended up identical are marked clean.
+        lo = self._dirty_x0
+        hi = self._dirty_x1
+        view = self.framebuf_view
+        shadow = self._shadow
+        words = self.width >> 2
+        for page in range(self.pages):
+            if lo[page] == _CLEAN:
+                continue
+            base = page * self.width
+            r = _diff_words(view, shadow, base >> 2, words)
+            if r < 0:
+                lo[page] = _CLEAN
+                hi[page] = 0
+            else:
+                lo[page] = ((r >> 16) << 2) - base
+                hi[page] = ((r & 0xffff) << 2) + 3 - base
+
+    def _plan(self):
+        # Turn the pending changes into the list of windows to send and
+        # reset the dirty state. In diff mode the shadow copy is updated to
+        # the frame being sent.
+        full = (0, self.width - 1, 0, self.pages - 1)
+        if self._shadow is not None and not self._shadow_valid:
+            # Unknown panel contents: resend everything once.
+            windows = [full]
+            self._shadow_valid = True
+        else:
+            if self._shadow is not None:
+                self._diff_dirty()
+            windows = self._windows()
+            if self._shadow is not None:
+                size = 0
+                for x0, x1, p0, p1 in windows:
+                    size += (x1 - x0 + 1) * (p1 - p0 + 1) + _WINDOW_COST
+                if size > self.diff_threshold:
+                    windows = [full]
+        if self._shadow is not None:
+            self._shadow[:] = self.framebuf_view
+        self._clear_dirty()
+        return windows
+
+    def _flush(self, windows, frame, view):
+        start = self.bytes_sent
+        t0 = time.ticks_us()
+        for x0, x1, p0, p1 in windows:
+            if x0 == 0 and x1 == self.width - 1 and p0 == 0 and p1 == self.pages - 1:
+                self.write_window(x0, x1, p0, p1, frame)
+            else:
+                self.write_window(x0, x1, p0, p1, self._gather(view, x0, x1, p0, p1))
+        us = time.ticks_diff(time.ticks_us(), t0)
+        self.show_bytes = self.bytes_sent - start
+        self.flush_us = us
+        self.flush_count += 1
+        self.flush_total_us += us
+        if us > self.flush_max_us:
+            self.flush_max_us = us
+
+    def show(self):
+        if self._scrolling:
+            # The panel must not be written while it scrolls; the changes
+            # stay dirty and go out when stop_scroll() resyncs.
+            return
+        windows = self._plan()
+        if not self._async:
+            self._flush(windows, self._frame, self.framebuf_view)
+            return
+        t0 = time.ticks_us()
+        self._idle.acquire()
+        self.wait_us = time.ticks_diff(time.ticks_us(), t0)
+        if not windows:
+            self.show_bytes = 0
+            self._idle.release()
+            return
+        # Swap: the frame just drawn becomes the front buffer and goes to the
+        # worker. The new back buffer starts as a copy of it because scenes
+        # draw incrementally on top of the previous frame.
+        front = (self.buffer, self._frame, self.framebuf_view, self.framebuf)
+        self.buffer, self._frame, self.framebuf_view, self.framebuf = self._back
+        self._back = front
+        self.framebuf_view[:] = front[2]
+        self._job = windows
+        self._req.release()
+
+    def send_window(self, x0, x1, p0, p1):
+        # Send a window now, whatever the dirty/diff state says. Used to push
+        # test frames when probing and benchmarking the bus.
+        self.wait_flush()
+        self._flush([(x0, x1, p0, p1)], self._frame, self.framebuf_view)
+
+    def set_async_flush(self, enabled=True):
+        # Double-buffered mode: show() hands the finished frame to a worker
+        # thread and returns, so the next frame is drawn while the previous
+        # one is still going out on the bus. Use wait_flush() when the frame
+        # must be on the panel before continuing. Returns whether async mode
+        # is on: if the worker thread can't start (no _thread, or no thread
+        # left, as on rp2) flushes stay synchronous.
+        if enabled == self._async:
+            return self._async
+        if enabled:
+            try:
+                import _thread
+                self._req = _thread.allocate_lock()
+                self._req.acquire()
+                self._idle = _thread.allocate_lock()
+                _thread.start_new_thread(self._flush_worker, ())
+            except (ImportError, OSError, RuntimeError) as e:
+                print(f"Async flush unavailable, flushing synchronously: {e}")
+                self._req = None
+                self._idle = None
+                return False
+            self._back = self._new_buffer(self.width, self.height)
+            self._async = True
+        else:
+            self._idle.acquire()
+            self._job = None
+            self._req.release()
+            # The worker releases _idle on its way out.
+            self._idle.acquire()
+            self._idle.release()
+            self._async = False
+            self._back = None
+        return self._async
+
+    def _flush_worker(self):
+        while True:
+            self._req.acquire()
+            windows = self._job
+            if windows is None:
+                self._idle.release()
+                return
+            front = self._back
+            try:
+                self._flush(windows, front[1], front[2])
+            except Exception as e:
+                print("SSD1306 flush error:", e)
+            self._job = None
+            self._idle.release()
+
+    def wait_flush(self):
+        # Block until the frame handed to the worker is on the panel.
+        if self._async:
+            self._idle.acquire()
+            self._idle.release()
+
+    def reset_flush_stats(self):
+        self.flush_us = 0
+        self.flush_max_us = 0
+        self.flush_count = 0
+        self.flush_total_us = 0
+        self.wait_us = 0
+
+    def flush_stats(self):
+        count = self.flush_count
+        return {
+            'count': count,
+            'last_us': self.flush_us,
+            'max_us': self.flush_max_us,
+            'avg_us': self.flush_total_us // count if count else 0,
+            'wait_us': self.wait_us,
+            'bytes': self.show_bytes,
+        }
+
+    # --- Hardware effects ---
+    # The controller can move the picture on its own: continuous scrolling,
+    # a vertical scroll area, the display start line and a 180 degree flip.
+    # These cost a few command bytes once instead of a frame per step.
+
+    def invalidate(self):
+        # The panel no longer matches the framebuffer (e.g. after a scroll
+        # rotated GDDRAM): the next show() resends everything.
+        self.mark_dirty()
+        self._shadow_valid = False
+
+    def _scroll_code(self, frames):
+        best = _SCROLL_FRAMES[0]
+        for item in _SCROLL_FRAMES:
+            if abs(item[0] - frames) < abs(best[0] - frames):
+                best = item
+        return best[1]
+
+    def start_scroll(self, direction=1, page0=0, page1=None, frames=2, dy=0):
+        # Start continuous scrolling of pages page0..page1. direction is 1
+        # (right) or -1 (left), frames the number of panel frames between
+        # steps. dy != 0 adds a vertical offset per step (diagonal scroll,
+        # inside the area set by set_scroll_area).
+        if page1 is None:
+            page1 = self.pages - 1
+        self.wait_flush()
+        if self._scrolling:
+            self.write_cmd(SET_SCROLL_OFF)
+        # Pending drawing goes out before the panel takes over.
+        self._flush(self._plan(), self._frame, self.framebuf_view)
+        left = 1 if direction < 0 else 0
+        code = self._scroll_code(frames)
+        if dy:
+            self.write_cmds((SET_DSCROLL | left, 0x00, page0, code, page1,
+                             dy % self.height))
+        else:
+            self.write_cmds((SET_HSCROLL | left, 0x00, page0, code, page1,
+                             0x00, 0xff))
+        self.write_cmd(SET_SCROLL_ON)
+        self._scrolling = True
+        self._scroll_pages = (page0, page1)
+
+    def stop_scroll(self):
+        # Stop scrolling. GDDRAM is left rotated by an amount we can't read
+        # back, so the scrolled pages (and anything drawn meanwhile) are
+        # rewritten from the framebuffer and panel and driver agree again.
+        if not self._scrolling:
+            return
+        self.wait_flush()
+        self.write_cmd(SET_SCROLL_OFF)
+        self._scrolling = False
+        page0, page1 = self._scroll_pages
+        self.mark_dirty(0, page0 * 8, self.width, (page1 - page0 + 1) * 8)
+        self._shadow_valid = False
+        self.show()
+
+    def set_scroll_area(self, top=0, rows=None):
+        # Rows top..top+rows-1 move with a diagonal scroll, the rest stays.
+        if rows is None:
+            rows = self.height - top
+        self.wait_flush()
+        self.write_cmds((SET_VSCROLL_AREA, top, rows))
+
+    def set_start_line(self, line):
+        # Panel row 0 shows GDDRAM row `line`; the picture wraps around.
+        # Only the view moves, the framebuffer is not touched.
+        self.start_line = line % self.height
+        self.wait_flush()
+        self.write_cmd(SET_DISP_START_LINE | self.start_line)
+
+    def flip(self, flipped=True):
+        # Rotate the picture 180 degrees. The segment remap only applies to
+        # data written afterwards, so the whole frame is resent.
+        self.flipped = bool(flipped)
+        self.wait_flush()
+        self.write_cmds((SET_SEG_REMAP | (0x00 if flipped else 0x01),
+                         SET_COM_OUT_DIR | (0x00 if flipped else 0x08)))
+        self.invalidate()
+        self.show()
 
     def fill(self, col):
         self.framebuf.fill(col)
+        self.mark_dirty()
 
-    def pixel(self, x, y, col):
+    def pixel(self, x, y, col=None):
+        if col is None:
+            return self.framebuf.pixel(x, y)
         self.framebuf.pixel(x, y, col)
+        self.mark_dirty(x, y, 1, 1)
 
     def scroll(self, dx, dy):
         self.framebuf.scroll(dx, dy)
+        self.mark_dirty()
 
-    def blit(self, fbuf, x, y, key=-1, palette=None):
+    def blit(self, fbuf, x, y, key=-1, palette=None, w=None, h=None):
+        # The dirty region is the source's size: w/h if given, else the
+        # width/height a blitter.Canvas exposes. Only a plain FrameBuffer
+        # (which does not expose its size) blitted without w/h flags
+        # everything from (x, y) to the bottom-right corner.
         self.framebuf.blit(fbuf, x, y, key, palette)
+        if w is None:
+            w = getattr(fbuf, 'width', None)
+        if h is None:
+            h = getattr(fbuf, 'height', None)
+        self.mark_dirty(x, y, w, h)
 
     def text(self, string, x, y, col=1):
         self.framebuf.text(string, x, y, col)
+        self.mark_dirty(x, y, len(string) * 8, 8)
 
     def fill_rect(self, x, y, w, h, col):
         self.framebuf.fill_rect(x, y, w, h, col)
+        self.mark_dirty(x, y, w, h)
 
     def rect(self, x, y, w, h, col):
         self.framebuf.rect(x, y, w, h, col)
+        self.mark_dirty(x, y, w, h)
         
     def line(self, x1, y1, x2, y2, col):
         self.framebuf.line(x1, y1, x2, y2, col)
-
+        self.mark_dirty(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
 
 
 class SSD1306_I2C(SSD1306):
+    # Windowed writes are prefixed with the Co=0, D/C=1 control byte.
+    data_offset = 1
+    data_prefix = 0x40
+    _header = 4
+    # Command batches are prefixed with the Co=0, D/C#=0 control byte.
+    cmd_offset = 1
+
     def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
+        self._cmd = bytearray(32)
+        self._cmd[0] = 0x00 # Co=0, D/C#=0: a stream of commands follows
+        # Addressing prefix for write_window: six (Co=1, command) pairs so the
+        # window and the 0x40-prefixed data go out in one transaction.
+        self._win = bytearray(b'\x80\x21\x80\x00\x80\x00\x80\x22\x80\x00\x80\x00')
+        self._win_list = [self._win, None]
+        self._fused = hasattr(i2c, 'writevto')
         # Add an extra byte to the data buffer to hold an I2C data/command byte
         # to use hardware-compatible I2C transactions.  A memoryview of the
         # buffer is used to mask this byte from the framebuffer operations
         # (without a major memory hit as memoryview doesn't copy to a separate
-        # buffer).
-        self.buffer = bytearray(((height // 8) * width) + 1)
-        self.buffer[0] = 0x40  # Set first byte of data buffer to Co=0, D/C=1
-        self.framebuf = framebuf.FrameBuffer1(memoryview(self.buffer)[1:], width, height)
+        # buffer). The byte sits at index 3 so the pixel data starts on a word
+        # boundary, which the diff mode compares a word at a time.
+        self.buffer, self._frame, self.framebuf_view, self.framebuf = \
+            self._new_buffer(width, height)
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80 # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
+        self.bytes_sent += 2
+
+    def write_cmd_buf(self, n):
+        self.i2c.writeto(self.addr, memoryview(self._cmd)[:n])
+        self.bytes_sent += n
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        if not self._fused:
+            super().write_window(x0, x1, p0, p1, buf)
+            return
+        if self.width == 64:
+            # displays with width of 64 pixels are shifted by 32
+            x0 += 32
+            x1 += 32
+        win = self._win
+        win[3] = x0
+        win[5] = x1
+        win[9] = p0
+        win[11] = p1
+        self._win_list[1] = buf
+        self.i2c.writevto(self.addr, self._win_list)
+        self._win_list[1] = None
+        self.bytes_sent += len(win) + len(buf)
 
     def write_framebuf(self):
         # Blast out the frame buffer using a single I2C transaction to support
         # hardware I2C interfaces.
-        self.i2c.writeto(self.addr, self.buffer)
+        self.write_data(self._frame)
+
+    def write_data(self, buf):
+        # buf already starts with the 0x40 control byte (see _new_buffer and
+        # _gather).
+        self.i2c.writeto(self.addr, buf)
+        self.bytes_sent += len(buf)
 
     def poweron(self):
         pass
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
-        self.rate = 10 * 1024 * 1024
+    data_offset = 0
+    data_prefix = 0x00
+    _header = 0
+    cmd_offset = 0
+
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False,
+                 baudrate=10 * 1024 * 1024):
+        # cs may be None when the display is alone on the bus with CS tied
+        # low; then only DC is driven.
+        self.rate = baudrate
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
-        cs.init(cs.OUT, value=1)
+        if cs is not None:
+            cs.init(cs.OUT, value=1)
+        # The bus is only used by this display, configure it once.
+        spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.spi = spi
         self.dc = dc
         self.res = res
         self.cs = cs
-        self.buffer = bytearray((height // 8) * width)
-        self.framebuf = framebuf.FrameBuffer1(self.buffer, width, height)
+        self._dc_level = 0
+        self._cmd = bytearray(32)
+        self._win = bytearray(6)
+        self._win[0] = SET_COL_ADDR
+        self._win[3] = SET_PAGE_ADDR
+        self.buffer, self._frame, self.framebuf_view, self.framebuf = \
+            self._new_buffer(width, height)
         super().__init__(width, height, external_vcc)
 
+    def _set_dc(self, level):
+        # DC only changes when switching between commands and data.
+        if level != self._dc_level:
+            self.dc(level)
+            self._dc_level = level
+
+    def _write(self, buf, level):
+        self._set_dc(level)
+        cs = self.cs
+        if cs is not None:
+            cs(0)
+        self.spi.write(buf)
+        if cs is not None:
+            cs(1)
+        self.bytes_sent += len(buf)
+
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
-        self.cs.high()
-        self.dc.low()
-        self.cs.low()
-        self.spi.write(bytearray([cmd]))
-        self.cs.high()
+        self._cmd[0] = cmd
+        self.write_cmd_buf(1)
+
+    def write_cmd_buf(self, n):
+        self._write(memoryview(self._cmd)[:n], 0)
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        # Commands and data in a single chip-select cycle, only DC changes.
+        if self.width == 64:
+            # displays with width of 64 pixels are shifted by 32
+            x0 += 32
+            x1 += 32
+        win = self._win
+        win[1] = x0
+        win[2] = x1
+        win[4] = p0
+        win[5] = p1
+        cs = self.cs
+        if cs is not None:
+            cs(0)
+        self._set_dc(0)
+        self.spi.write(win)
+        self._set_dc(1)
+        self.spi.write(buf)
+        if cs is not None:
+            cs(1)
+        self.bytes_sent += len(win) + len(buf)
 
     def write_framebuf(self):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
-        self.cs.high()
-        self.dc.high()
-        self.cs.low()
-        self.spi.write(self.buffer)
-        self.cs.high()
+        self.write_data(self._frame)
+
+    def write_data(self, buf):
+        self._write(buf, 1)
 
     def poweron(self):
         self.res.high()
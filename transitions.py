@@ -0,0 +1,414 @@
+# transitions.py
+# Propósito: Transiciones entre escenas (fade, wipe, dissolve, iris) que avanzan un paso por tick del FrameClock en vez de dormir: el que llama sigue leyendo botones o animando mientras tanto. El fade es una rampa de contraste (no toca el buffer); el dissolve usa máscaras de dither ordenado (Bayer 8x8) precalculadas. Los efectos se combinan con Sequence/Parallel y se pueden cancelar o terminar de golpe.
+#
+# Uso típico, dentro del bucle de una escena:
+#
+#     fx = transitions.Dissolve(oled, frame, 16)   # frame: buffer MONO_VLSB de destino
+#     while ...:
+#         ticks = await clock.tick()
+#         if fx.step(ticks):
+#             runtime.present()
+#
+# o, si no hay otra cosa que hacer, await transitions.play(oled, fx).
+
+import sys
+import math
+from array import array
+import blitter
+import buttons
+import config
+import runtime
+from frame_clock import FrameClock
+
+# Matriz de Bayer 8x8 (umbrales 0..63), por fila: _BAYER[y * 8 + x]
+_BAYER = bytes((
+    0, 32, 8, 40, 2, 34, 10, 42,
+    48, 16, 56, 24, 50, 18, 58, 26,
+    12, 44, 4, 36, 14, 46, 6, 38,
+    60, 28, 52, 20, 62, 30, 54, 22,
+    3, 35, 11, 43, 1, 33, 9, 41,
+    51, 19, 59, 27, 49, 17, 57, 25,
+    15, 47, 7, 39, 13, 45, 5, 37,
+    63, 31, 55, 23, 61, 29, 53, 21,
+))
+DITHER_LEVELS = 64
+
+# Parámetros de los helpers viper (aceptan hasta 4 argumentos):
+# _merge: inicio, fin, máscara; _dissolve: cantidad, offset de la máscara
+_params = array('i', (0, 0, 0))
+_masks = None
+_scratch = None
+
+
+def dither_masks():
+    """
+    Máscaras MONO_VLSB del dither ordenado, 8 bytes por nivel (0..64): el
+    byte x de un nivel tiene en 1 las filas de una página donde, en la
+    columna x % 8, el umbral de Bayer es menor que el nivel. Cada nivel
+    contiene al anterior, así que un dissolve sólo agrega píxeles.
+    """
+    global _masks
+    if _masks is None:
+        masks = bytearray(8 * (DITHER_LEVELS + 1))
+        for level in range(DITHER_LEVELS + 1):
+            for x in range(8):
+                m = 0
+                for y in range(8):
+                    if _BAYER[y * 8 + x] < level:
+                        m |= 1 << y
+                masks[level * 8 + x] = m
+        _masks = bytes(masks)
+    return _masks
+
+
+if sys.implementation.name == 'micropython':
+    import micropython
+
+    @micropython.viper
+    def _merge(dst, src, params) -> int:
+        # dst[i] toma de src los bits de la máscara, para i en inicio..fin-1
+        d = ptr8(dst)
+        s = ptr8(src)
+        p = ptr32(params)
+        i = p[0]
+        end = p[1]
+        m = p[2]
+        keep = m ^ 0xff
+        while i < end:
+            d[i] = (d[i] & keep) | (s[i] & m)
+            i += 1
+        return 0
+
+    @micropython.viper
+    def _dissolve(dst, src, masks, params) -> int:
+        # Como _merge, con la máscara de la columna (i % 8) de un nivel
+        d = ptr8(dst)
+        s = ptr8(src)
+        k = ptr8(masks)
+        p = ptr32(params)
+        n = p[0]
+        base = p[1]
+        i = 0
+        while i < n:
+            m = k[base + (i & 7)]
+            d[i] = (d[i] & (m ^ 0xff)) | (s[i] & m)
+            i += 1
+        return 0
+else:
+    def _merge(dst, src, params):
+        start, end, m = params[0], params[1], params[2]
+        keep = m ^ 0xff
+        for i in range(start, end):
+            dst[i] = (dst[i] & keep) | (src[i] & m)
+        return 0
+
+    def _dissolve(dst, src, masks, params):
+        n, base = params[0], params[1]
+        for i in range(n):
+            m = masks[base + (i & 7)]
+            dst[i] = (dst[i] & (m ^ 0xff)) | (src[i] & m)
+        return 0
+
+
+def _copy(buf, src, start, end, mask):
+    p = _params
+    p[0] = start
+    p[1] = end
+    p[2] = mask
+    _merge(buf, src, p)
+
+
+def offscreen(oled):
+    # Canvas del tamaño de la pantalla para armar el frame de destino. Es
+    # uno solo y compartido: vale hasta la próxima transición.
+    global _scratch
+    size = oled.width * oled.height // 8
+    if _scratch is None or len(_scratch.buffer) != size:
+        _scratch = blitter.Canvas(bytearray(size), oled.width, oled.height)
+    return _scratch
+
+
+class Transition:
+    """
+    Efecto de `frames` pasos. step(ticks) avanza tantos pasos como ticks
+    devolvió FrameClock.wait() y devuelve True si cambió el buffer (hay que
+    hacer show). cancel() lo deja donde está; finish() salta al final.
+    """
+
+    def __init__(self, frames):
+        self.frames = max(1, frames)
+        self.pos = 0
+        self.done = False
+
+    def step(self, ticks=1):
+        if self.done:
+            return False
+        pos = min(self.frames, self.pos + ticks)
+        changed = self._apply(self.pos, pos)
+        self.pos = pos
+        if pos >= self.frames:
+            self.done = True
+        return changed
+
+    def finish(self):
+        return self.step(self.frames)
+
+    def cancel(self):
+        self.done = True
+
+    def _apply(self, old, new):
+        # Dibuja el paso new (viniendo de old); True si tocó el buffer
+        return False
+
+
+class _Screen(Transition):
+    # Efecto que lleva el buffer del oled (lo que se ve) hacia dst, un
+    # buffer MONO_VLSB del mismo tamaño (bytearray o Canvas). El buffer se
+    # pide en cada paso: con el flush asíncrono show() lo intercambia.
+
+    def __init__(self, oled, dst, frames):
+        super().__init__(frames)
+        surf = blitter.surface(oled)
+        if surf is None:
+            raise ValueError("transition target has no MONO_VLSB buffer")
+        self.oled = oled
+        _, self.width, self.height = surf
+        self.dst = getattr(dst, 'buffer', dst)
+        if len(self.dst) != len(surf[0]):
+            raise ValueError("transition frame size mismatch")
+
+    @property
+    def buf(self):
+        return blitter.surface(self.oled)[0]
+
+    def _mark(self, x, y, w, h):
+        mark_dirty = getattr(self.oled, 'mark_dirty', None)
+        if mark_dirty is not None:
+            mark_dirty(x, y, w, h)
+
+
+class Fade(Transition):
+    """
+    Rampa de contraste de start a end (0..255). No toca el buffer: cada
+    paso es un solo comando al panel.
+    """
+
+    def __init__(self, oled, frames, start=0, end=255):
+        super().__init__(frames)
+        self.oled = oled
+        n = self.frames
+        self.levels = bytes(start + (end - start) * k // n for k in range(n + 1))
+
+    def _apply(self, old, new):
+        if self.levels[new] != self.levels[old]:
+            self.oled.contrast(self.levels[new])
+        return False
+
+
+class Cut(_Screen):
+    # Copia dst de una (un paso): para armar fundidos con Sequence
+    def __init__(self, oled, dst):
+        super().__init__(oled, dst, 1)
+
+    def _apply(self, old, new):
+        self.buf[:] = self.dst
+        self._mark(0, 0, self.width, self.height)
+        return True
+
+
+class Wipe(_Screen):
+    """
+    Barrido: dst entra desde un borde. direction es el borde de entrada:
+    'left', 'right', 'top' o 'bottom'.
+    """
+
+    def __init__(self, oled, dst, frames, direction='left'):
+        super().__init__(oled, dst, frames)
+        self.direction = direction
+
+    def _apply(self, old, new):
+        w = self.width
+        h = self.height
+        horizontal = self.direction in ('left', 'right')
+        size = w if horizontal else h
+        a = size * old // self.frames
+        b = size * new // self.frames
+        if a == b:
+            return False
+        if self.direction in ('right', 'bottom'):
+            a, b = size - b, size - a
+        buf = self.buf
+        if horizontal:
+            for page in range(h >> 3):
+                _copy(buf, self.dst, page * w + a, page * w + b, 0xff)
+            self._mark(a, 0, b - a, h)
+            return True
+        for page in range(a >> 3, ((b - 1) >> 3) + 1):
+            top = max(a - page * 8, 0)
+            bottom = min(b - page * 8, 8)
+            mask = ((0xff << top) & 0xff) & (0xff >> (8 - bottom))
+            _copy(buf, self.dst, page * w, (page + 1) * w, mask)
+        self._mark(0, a, w, b - a)
+        return True
+
+
+class Dissolve(_Screen):
+    # Dither ordenado: en cada paso aparecen los píxeles de dst cuyo umbral
+    # de Bayer quedó debajo del nivel del paso
+    def __init__(self, oled, dst, frames):
+        super().__init__(oled, dst, frames)
+        self.masks = dither_masks()
+
+    def _apply(self, old, new):
+        level = DITHER_LEVELS * new // self.frames
+        if level == DITHER_LEVELS * old // self.frames:
+            return False
+        buf = self.buf
+        p = _params
+        p[0] = len(buf)
+        p[1] = level * 8
+        _dissolve(buf, self.dst, self.masks, p)
+        self._mark(0, 0, self.width, self.height)
+        return True
+
+
+class Iris(_Screen):
+    """
+    Círculo que se abre desde (cx, cy) mostrando dst. Cada paso copia sólo
+    los tramos de fila que el radio nuevo agrega al anterior.
+    """
+
+    def __init__(self, oled, dst, frames, cx=None, cy=None):
+        super().__init__(oled, dst, frames)
+        self.cx = self.width // 2 if cx is None else cx
+        self.cy = self.height // 2 if cy is None else cy
+        # Radio que cubre la esquina más lejana
+        far = 0
+        for x in (0, self.width - 1):
+            for y in (0, self.height - 1):
+                far = max(far, (x - self.cx) ** 2 + (y - self.cy) ** 2)
+        self.radius = int(math.sqrt(far)) + 1
+
+    def _half(self, r, dy):
+        # Media cuerda del círculo de radio r en la fila dy (-1 = no la toca)
+        if r <= 0 or dy * dy > r * r:
+            return -1
+        return int(math.sqrt(r * r - dy * dy))
+
+    def _apply(self, old, new):
+        r0 = self.radius * old // self.frames
+        r1 = self.radius * new // self.frames
+        if r0 == r1:
+            return False
+        w = self.width
+        cx = self.cx
+        buf = self.buf
+        dst = self.dst
+        for y in range(max(0, self.cy - r1), min(self.height, self.cy + r1 + 1)):
+            dy = y - self.cy
+            a = self._half(r0, dy)
+            b = self._half(r1, dy)
+            if b <= a:
+                continue
+            base = (y >> 3) * w
+            bit = 1 << (y & 7)
+            if a < 0:
+                _copy(buf, dst, base + max(0, cx - b), base + min(w, cx + b + 1), bit)
+                continue
+            _copy(buf, dst, base + max(0, cx - b), base + max(0, min(w, cx - a)), bit)
+            _copy(buf, dst, base + min(w, max(0, cx + a + 1)), base + min(w, cx + b + 1), bit)
+        self._mark(cx - r1, self.cy - r1, 2 * r1 + 1, 2 * r1 + 1)
+        return True
+
+
+class Sequence(Transition):
+    # Efectos uno detrás de otro; los ticks que sobran de uno pasan al siguiente
+    def __init__(self, *effects):
+        self.effects = effects
+        self.index = 0
+        super().__init__(sum(e.frames for e in effects))
+
+    def step(self, ticks=1):
+        changed = False
+        while ticks > 0 and self.index < len(self.effects):
+            e = self.effects[self.index]
+            if not e.done:
+                n = min(ticks, e.frames - e.pos)
+                changed = e.step(n) or changed
+                ticks -= n
+                self.pos += n
+            if e.done:
+                self.index += 1
+        if self.index >= len(self.effects):
+            self.done = True
+        return changed
+
+    def finish(self):
+        changed = False
+        for e in self.effects[self.index:]:
+            changed = e.finish() or changed
+        self.index = len(self.effects)
+        self.pos = self.frames
+        self.done = True
+        return changed
+
+    def cancel(self):
+        for e in self.effects[self.index:]:
+            e.cancel()
+        self.done = True
+
+
+class Parallel(Transition):
+    # Efectos a la vez (p.ej. un dissolve mientras sube el contraste)
+    def __init__(self, *effects):
+        self.effects = effects
+        super().__init__(max(e.frames for e in effects))
+
+    def step(self, ticks=1):
+        changed = False
+        for e in self.effects:
+            changed = e.step(ticks) or changed
+        self.pos = min(self.frames, self.pos + ticks)
+        self.done = all(e.done for e in self.effects)
+        return changed
+
+    def finish(self):
+        changed = False
+        for e in self.effects:
+            changed = e.finish() or changed
+        self.pos = self.frames
+        self.done = True
+        return changed
+
+    def cancel(self):
+        for e in self.effects:
+            e.cancel()
+        self.done = True
+
+
+def fade_through(oled, dst, frames):
+    # Fundido a negro, cambio de frame y vuelta del contraste
+    half = max(1, frames // 2)
+    return Sequence(Fade(oled, half, 255, 0), Cut(oled, dst), Fade(oled, half, 0, 255))
+
+
+async def play(oled, effect, fps=None, button=None):
+    """
+    Corre el efecto hasta el final, un paso por tick (las otras tareas del
+    runtime siguen corriendo). Con button, apretarlo termina el efecto de
+    golpe. Para animar otra cosa a la vez, llamar a effect.step() desde el
+    bucle propio.
+    """
+    keys = None
+    if button is not None:
+        keys = buttons.of(button)
+        index = keys.index(button)
+        keys.clear()
+    clock = FrameClock(fps or config.TRANSITION_FPS)
+    while not effect.done:
+        if keys is not None and keys.take(index, buttons.PRESS):
+            changed = effect.finish()
+        else:
+            changed = effect.step(await clock.tick())
+        if changed:
+            runtime.present()
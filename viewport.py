@@ -0,0 +1,135 @@
+# viewport.py
+# Propósito: Scroll vertical por hardware para listas y logs. Usa la GDDRAM del panel como un anillo de 64 filas y mueve la línea de inicio (SET_DISP_START_LINE): desplazar N píxeles cuesta un comando más la página que queda expuesta, en vez de redibujar y reenviar toda la pantalla.
+
+import blitter
+
+
+class Viewport:
+    """
+    Ventana vertical sobre un contenido más alto que la pantalla.
+
+    render(fb, y) dibuja el contenido en fb (una página: ancho x 8 px) de
+    forma que la fila de contenido `y` quede en la fila 0 de fb. Sólo se le
+    pide lo que queda expuesto al desplazar.
+
+    Mientras el viewport está activo el framebuffer del oled está en orden de
+    anillo (la fila visible de arriba es start_line), así que para dibujar
+    encima hay que usar fill_rect()/pixel() de esta clase, que reciben
+    coordenadas de pantalla. release() deja el panel como lo esperan las demás
+    escenas.
+    """
+
+    def __init__(self, oled, render, content_height):
+        self.oled = oled
+        self.render = render
+        self.content_height = content_height
+        self.height = oled.height  # El anillo es toda la GDDRAM (64 filas)
+        self.y = 0      # Fila de contenido visible arriba
+        self.start = 0  # Fila del anillo que se ve arriba
+        # Buffers de una página para renderizar (dos para la página partida)
+        self._page = bytearray(oled.width)
+        self._page_fb = blitter.Canvas(self._page, oled.width, 8)
+        self._split = bytearray(oled.width)
+        self._split_fb = blitter.Canvas(self._split, oled.width, 8)
+
+    def max_y(self):
+        return max(0, self.content_height - self.height)
+
+    def _render_page(self, page):
+        h = self.height
+        top = page * 8
+        # Fila de contenido que cae en la primera fila de la página
+        c0 = self.y + (top - self.start) % h
+        self._page_fb.fill(0)
+        self.render(self._page_fb, c0)
+        cut = self.start - top
+        if 0 < cut < 8:
+            # La línea de inicio cae dentro de la página: las filas desde
+            # `cut` vuelven al principio del contenido visible.
+            self._split_fb.fill(0)
+            self.render(self._split_fb, self.y - cut)
+            mask = (0xFF << cut) & 0xFF
+            keep = ~mask & 0xFF
+            a = self._page
+            b = self._split
+            for i in range(len(a)):
+                a[i] = (a[i] & keep) | (b[i] & mask)
+        w = self.oled.width
+        self.oled.framebuf_view[page * w:(page + 1) * w] = self._page
+        self.oled.mark_dirty(0, top, w, 8)
+
+    def redraw(self, show=True):
+        # Vuelve a renderizar todas las páginas (p.ej. cambió la selección)
+        for page in range(self.height // 8):
+            self._render_page(page)
+        if show:
+            self.oled.show()
+
+    def redraw_rows(self, y, h, show=True):
+        # Vuelve a renderizar sólo las páginas del anillo que cubren las
+        # filas de pantalla y..y+h-1 (p.ej. dos filas de un menú)
+        y0 = max(0, y)
+        y1 = min(self.height, y + h)
+        done = 0
+        for r in range(y0, y1):
+            page = ((r + self.start) % self.height) >> 3
+            if not done & (1 << page):
+                self._render_page(page)
+                done |= 1 << page
+        if show and done:
+            self.oled.show()
+        return done
+
+    def scroll_to(self, y):
+        y = max(0, min(y, self.max_y()))
+        d = y - self.y
+        if d == 0:
+            return
+        h = self.height
+        if abs(d) >= h:
+            self.y = y
+            self.redraw()
+            return
+        if d > 0:
+            # El contenido sube: las filas de arriba pasan a ser las de abajo
+            first = self.start
+        else:
+            first = (self.start + d) % h
+        self.start = (self.start + d) % h
+        self.y = y
+        rows = abs(d)
+        done = -1
+        for r in range(first, first + rows):
+            page = (r % h) >> 3
+            if page != done:
+                self._render_page(page)
+                done = page
+        self.oled.show()
+        self.oled.set_start_line(self.start)
+
+    def scroll_by(self, dy):
+        self.scroll_to(self.y + dy)
+
+    def fill_rect(self, x, y, w, h, col):
+        # Rectángulo en coordenadas de pantalla, partido si cruza el anillo
+        y = max(0, y)
+        h = min(h, self.height - y)
+        if h <= 0:
+            return
+        ring = (y + self.start) % self.height
+        first = min(h, self.height - ring)
+        self.oled.fill_rect(x, ring, w, first, col)
+        if first < h:
+            self.oled.fill_rect(x, 0, w, h - first, col)
+
+    def pixel(self, x, y, col):
+        self.oled.pixel(x, (y + self.start) % self.height, col)
+
+    def release(self):
+        # Deja la pantalla en negro y la línea de inicio en 0 para que el
+        # resto de las escenas dibuje en orden normal.
+        self.oled.fill(0)
+        self.oled.show()
+        self.oled.set_start_line(0)
+        self.start = 0
+        self.y = 0
@@ -1,11 +1,13 @@
 # walk_scene.py
 # Propósito: Muestra la animación de caminata (la escena original).
 
-import time
 import renderer
 import config
+import runtime
+import transitions
+from frame_clock import FrameClock
 
-def play_scene(oled):
+async def play_scene(oled):
     """
     Ejecuta la escena de caminata.
     Retorna cuando el usuario sale (o infinito si no hay salida definida aún).
@@ -15,19 +17,32 @@ def play_scene(oled):
     
     print("Starting walk scene...")
     
-    frame_actual = 0
+    frame_actual = -1  # El primer tick avanza al frame 0
     keep_playing = True
+    # Un tick de simulación = un frame de la caminata
+    clock = FrameClock(1000 // config.ANIMATION_SPEED_MS)
+    # Fade in con la animación ya corriendo: un paso por tick
+    fade_in = transitions.Fade(oled, 4)
     
     # TODO: Definir condición de salida (ej. botón)
     # Por ahora corre indefinidamente hasta reset o interrupción externa
     # Si queremos que sea interrumpible, necesitamos pasarle un input_handler
     
     while keep_playing:
-        # 1. Dibujar (Renderer)
-        view.draw_walk_frame(frame_actual)
+        # 1. Control de Tiempos (deadline fijo, no depende del show())
+        steps = await clock.tick()
         
-        # 2. Control de Tiempos
-        frame_actual += 1
-        time.sleep_ms(config.ANIMATION_SPEED_MS)
+        # 2. Avanzar la animación un frame por tick de simulación
+        frame_actual += steps
+        clock.update_done()
+        
+        # 3. Dibujar (Renderer) si no vamos atrasados
+        if clock.render:
+            view.draw_walk_frame(frame_actual, show=False)
+            clock.draw_done()
+            await runtime.show()
+            clock.flush_done()
+        # El contraste sube recién con el frame nuevo ya en pantalla
+        fade_in.step(steps)
         
         # TODO: Check input to exit?